@@ -0,0 +1,90 @@
+"""
+Adversarial-input benchmark for the guarded validators.
+
+Times each validator and its guarded version on oversized inputs (digit
+runs, punctuation runs and mixed junk) of growing size. The regular
+validators grow linearly with the input; the guarded ones must stay
+constant, and `--check` fails when the slowest guarded call on the
+largest input is more than `--max-ratio` times the cost on a plausible
+input.
+
+Usage:
+    python -m benchmarks.bench_adversarial [--max-size 10000000] [--check]
+"""
+
+import argparse
+import sys
+import timeit
+
+from src.guard import (
+    guarded_validate_brazilian_phone,
+    guarded_validate_cnh,
+    guarded_validate_cpf,
+    guarded_validate_crv,
+    guarded_validate_email,
+    guarded_validate_plate,
+)
+
+# Valor plausível e validador guardado de cada tipo
+CASES = {
+    "cpf": ("111.444.777-35", guarded_validate_cpf),
+    "cnh": ("12345678901", guarded_validate_cnh),
+    "crv": ("A1B2C3D4E5F", guarded_validate_crv),
+    "plate": ("ABC-1234", guarded_validate_plate),
+    "phone": ("(11) 91234-5678", guarded_validate_brazilian_phone),
+    "email": ("joao@email.com", guarded_validate_email),
+}
+
+PATTERNS = {
+    "digits": "1",
+    "punctuation": ".-",
+    "junk": "a1 .@",
+}
+
+
+def per_call(function, value: str, number: int) -> float:
+    """Returns the best time per call in seconds."""
+    timer = timeit.Timer(lambda: function(value))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-size", type=int, default=10_000_000)
+    parser.add_argument("--max-ratio", type=float, default=5.0)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    sizes = [10**power for power in range(2, 8) if 10**power <= args.max_size]
+    failures = []
+    print(
+        f"{'type':>6} {'pattern':>12} {'size':>10} {'plain µs':>10} "
+        f"{'guarded µs':>11}"
+    )
+    for kind, (plausible, guarded) in CASES.items():
+        baseline = per_call(guarded, plausible, 10_000)
+        plain = guarded.__wrapped__
+        for name, pattern in PATTERNS.items():
+            for size in sizes:
+                value = (pattern * (size // len(pattern) + 1))[:size]
+                number = max(1, 1_000_000 // size)
+                plain_time = per_call(plain, value, number)
+                guarded_time = per_call(guarded, value, 10_000)
+                print(
+                    f"{kind:>6} {name:>12} {size:>10} "
+                    f"{plain_time * 1e6:>10.2f} {guarded_time * 1e6:>11.3f}"
+                )
+            if guarded_time > baseline * args.max_ratio:
+                failures.append((kind, name, guarded_time, baseline))
+
+    for kind, name, worst, baseline in failures:
+        print(
+            f"not constant: {kind}/{name} {worst * 1e6:.3f} µs "
+            f"vs {baseline * 1e6:.3f} µs on a plausible input"
+        )
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Allocation benchmark for the functions exported by `src`.
+
+Uses `tracemalloc` to report, for each function in `src.__all__`:
+- peak: bytes of temporary memory used during a single call
+- kept: bytes kept alive per call by the returned value
+- blocks: memory blocks (objects) kept alive per call
+- batch: peak memory of a batch that keeps every result, scaled to
+  1M calls
+
+`BUDGETS` sets, for each hot-path validator, a maximum peak and a maximum
+number of blocks kept per call, taken from measured values plus a small
+margin. With `--check` the benchmark exits with an error when a budget is
+exceeded, so a change that makes a hot path allocate more fails the build.
+
+Usage:
+    python -m benchmarks.bench_allocations [--batch 100000] [--check]
+"""
+
+import argparse
+import gc
+import inspect
+import sys
+import tracemalloc
+from typing import Callable, NamedTuple
+
+import src
+
+_LOG_LINE = (
+    "2024-01-01 12:00:00 INFO login user=joao@email.com "
+    "cpf=111.444.777-35 tel=(11) 91234-5678 placa=ABC1D23"
+)
+
+# Argumentos de uma chamada típica de cada função exportada
+CASES: dict[str, tuple] = {
+    "check_brazilian_phone": ("(11) 91234-5678",),
+    "check_cnh": ("12345678900",),
+    "check_cpf": ("111.444.777-35",),
+    "check_crv": ("123456789012",),
+    "check_email": ("joao@email.com",),
+    "check_plate": ("ABC-1234",),
+    "clean_phone": ("(11) 91234-5678",),
+    "cpf_check_digits": ("111444777",),
+    "cpf_digits_failure": ("11144477735",),
+    "cpf_region": ("111.444.777-35",),
+    "extract_domain": ("joao@email.com",),
+    "extract_username": ("joao@email.com",),
+    "format_brazilian_phone": ("11912345678",),
+    "format_cnh": ("12345678900",),
+    "format_cpf": ("11144477735",),
+    "format_crv": ("123456789012",),
+    "format_e164_phone": ("(11) 91234-5678",),
+    "format_e164_phones": (["(11) 91234-5678", "1234"],),
+    "format_plate": ("abc-1234",),
+    "guarded_validate_brazilian_phone": ("(11) 91234-5678",),
+    "guarded_validate_cnh": ("12345678901",),
+    "guarded_validate_cpf": ("111.444.777-35",),
+    "guarded_validate_crv": ("123456789012",),
+    "guarded_validate_email": ("joao@email.com",),
+    "guarded_validate_plate": ("ABC-1234",),
+    "infer_column_type": (["111.444.777-35", "58449226031"] * 64,),
+    "is_blocked_domain": ("mail.spam.com", frozenset({"spam.com"})),
+    "is_blocked_email": ("joao@mail.spam.com", frozenset({"spam.com"})),
+    "is_cnh_format": ("12345678900",),
+    "is_cpf_format": ("111.444.777-35",),
+    "is_crv_format": ("123456789012",),
+    "is_email_format": ("joao@email.com",),
+    "is_mercosul_format_plate": ("ABC1D23",),
+    "is_old_format_plate": ("ABC-1234",),
+    "is_valid_ddd": ("11",),
+    "parse_email": ("joao@email.com",),
+    "phone_to_key": ("(11) 91234-5678",),
+    "redact_text": (_LOG_LINE,),
+    "validate_batch": ([("cpf", "111.444.777-35"), ("plate", "ABC1D23")],),
+    "validate_brazilian_phone": ("(11) 91234-5678",),
+    "validate_cnh": ("12345678900",),
+    "validate_cpf": ("111.444.777-35",),
+    "validate_crv": ("123456789012",),
+    "validate_email": ("joao@email.com",),
+    "validate_password_length": ("Password123!",),
+    "validate_password_match": ("Password123!", "Password123!"),
+    "validate_password_strength": ("Password123!",),
+    "validate_plate": ("ABC-1234",),
+}
+
+# Funções que não trabalham sobre um valor por chamada
+SKIPPED = {
+    "guarded",  # constrói validadores
+    "infer_csv_types",  # lê um arquivo
+    "dedup_file",  # ordena arquivos fora da memória
+    "join_files",  # ordena arquivos fora da memória
+    "load_domain_blocklist",  # lê um arquivo
+    "partition_cpf_file",  # lê e escreve arquivos
+    "partition_cpfs",  # escreve em dez saídas
+    "tokenize_parallel",  # cria um pool de processos
+    "validation_version",  # percorre o bytecode dos validadores
+}
+
+
+class Budget(NamedTuple):
+    """Allocation budget of a hot-path function."""
+
+    peak: int
+    blocks: int
+
+
+# Pico medido mais uma pequena margem e blocos mantidos por chamada
+BUDGETS: dict[str, Budget] = {
+    "check_cpf": Budget(peak=1400, blocks=1),
+    "clean_phone": Budget(peak=1350, blocks=1),
+    "format_cpf": Budget(peak=260, blocks=1),
+    "format_e164_phone": Budget(peak=1350, blocks=1),
+    "parse_email": Budget(peak=128, blocks=3),
+    "phone_to_key": Budget(peak=1350, blocks=1),
+    "validate_brazilian_phone": Budget(peak=1350, blocks=0),
+    "validate_cnh": Budget(peak=1300, blocks=0),
+    "validate_cpf": Budget(peak=1400, blocks=0),
+    "validate_crv": Budget(peak=1250, blocks=0),
+    "validate_email": Budget(peak=32, blocks=0),
+    "validate_plate": Budget(peak=1350, blocks=0),
+}
+
+# Folga nos blocos: snapshots e a freelist de tuplas distorcem a média
+_BLOCKS_TOLERANCE = 0.1
+
+
+class Allocation(NamedTuple):
+    """Allocation profile of a function."""
+
+    peak: int
+    kept: float
+    blocks: float
+    batch: float
+
+
+def functions() -> dict[str, Callable]:
+    """Returns the exported functions of `src`, by name."""
+    return {
+        name: getattr(src, name)
+        for name in src.__all__
+        if inspect.isfunction(getattr(src, name))
+    }
+
+
+def _peak(function: Callable, args: tuple, repeat: int) -> int:
+    # O menor pico entre as repetições descarta ruído do interpretador
+    best = sys.maxsize
+    for _ in range(repeat):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        function(*args)
+        best = min(best, tracemalloc.get_traced_memory()[1] - before)
+    return best
+
+
+def measure(
+    function: Callable, args: tuple, batch: int = 10_000, repeat: int = 20
+) -> Allocation:
+    """
+    Measures the allocations of `function(*args)`.
+
+    Args:
+        function (Callable): Function to measure
+        args (tuple): Arguments of each call
+        batch (int): Calls in the batch that keeps its results
+        repeat (int): Calls used to measure the peak of a single call
+
+    Returns:
+        Allocation: Peak bytes per call, bytes and blocks kept per call, and
+        batch peak in bytes scaled to 1M calls
+    """
+    # Aquece caches de regex e imports tardios antes de medir
+    function(*args)
+    enabled = gc.isenabled()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        peak = _peak(function, args, repeat)
+
+        # Lista pré-alocada: só os resultados contam como memória mantida
+        results = [None] * batch
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        before = tracemalloc.take_snapshot()
+        for index in range(batch):
+            results[index] = function(*args)
+        batch_peak = tracemalloc.get_traced_memory()[1] - start
+        after = tracemalloc.take_snapshot()
+        del results
+    finally:
+        tracemalloc.stop()
+        if enabled:
+            gc.enable()
+
+    stats = after.compare_to(before, "filename")
+    kept = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return Allocation(
+        peak=peak,
+        kept=kept / batch,
+        blocks=blocks / batch,
+        batch=batch_peak * 1_000_000 / batch,
+    )
+
+
+def over_budget(profiles: dict[str, Allocation]) -> dict[str, Allocation]:
+    """Returns the profile of every function that exceeds its budget."""
+    return {
+        name: profiles[name]
+        for name, budget in BUDGETS.items()
+        if name in profiles
+        and (
+            profiles[name].peak > budget.peak
+            or profiles[name].blocks > budget.blocks + _BLOCKS_TOLERANCE
+        )
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch", type=int, default=100_000)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    profiles = {}
+    print(
+        f"{'function':>28} {'peak B':>8} {'kept B':>8} {'blocks':>7} "
+        f"{'MB/1M':>9} {'budget':>11}"
+    )
+    for name, function in sorted(functions().items()):
+        if name not in CASES:
+            continue
+        profile = profiles[name] = measure(function, CASES[name], args.batch)
+        budget = BUDGETS.get(name)
+        limit = f"{budget.peak}/{budget.blocks}" if budget else ""
+        print(
+            f"{name:>28} {profile.peak:>8} {profile.kept:>8.1f} "
+            f"{profile.blocks:>7.2f} {profile.batch / 1e6:>9.1f} "
+            f"{limit:>11}"
+        )
+
+    failures = over_budget(profiles)
+    for name, profile in failures.items():
+        budget = BUDGETS[name]
+        print(
+            f"over budget: {name} peak {profile.peak}/{budget.peak} bytes, "
+            f"blocks {profile.blocks:.2f}/{budget.blocks}"
+        )
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
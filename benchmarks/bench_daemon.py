@@ -0,0 +1,117 @@
+"""
+Load generator for the validation daemon.
+
+Starts `python -m src.daemon` in a subprocess for each batching window,
+opens several client connections that each keep a fixed number of
+requests in flight, and reports throughput and p50/p99 latency. This
+shows the trade-off between batching window and latency.
+
+Usage:
+    python -m benchmarks.bench_daemon [--clients 32] [--requests 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_PAYLOADS = [
+    b"cpf 111.444.777-35\n",
+    b"phone (11) 91234-5678\n",
+    b"email joao@email.com\n",
+    b"plate ABC1D23\n",
+]
+
+
+async def _client(path: str, requests: int, depth: int) -> list[float]:
+    reader, writer = await asyncio.open_unix_connection(path)
+    latencies = []
+    sent_at = []
+
+    async def receive() -> None:
+        for _ in range(requests):
+            await reader.readline()
+            latencies.append(time.perf_counter() - sent_at[len(latencies)])
+
+    receiver = asyncio.create_task(receive())
+    for index in range(requests):
+        # Mantém no máximo `depth` pedidos em voo
+        while index - len(latencies) >= depth:
+            await asyncio.sleep(0)
+        sent_at.append(time.perf_counter())
+        writer.write(_PAYLOADS[index % len(_PAYLOADS)])
+        await writer.drain()
+    await receiver
+    writer.close()
+    return latencies
+
+
+async def _load(path: str, clients: int, requests: int, depth: int):
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_client(path, requests, depth) for _ in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+    latencies = sorted(value for result in results for value in result)
+    return len(latencies) / elapsed, latencies
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run(window_ms: float, args: argparse.Namespace) -> tuple:
+    """Benchmarks one batching window; returns (rps, p50, p99) in ms."""
+    path = os.path.join(tempfile.mkdtemp(), "regexm.sock")
+    daemon = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "src.daemon",
+            "--socket",
+            path,
+            "--window-ms",
+            str(window_ms),
+            "--workers",
+            str(args.workers),
+        ]
+    )
+    try:
+        while not os.path.exists(path):
+            time.sleep(0.01)
+        throughput, latencies = asyncio.run(
+            _load(path, args.clients, args.requests, args.depth)
+        )
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+    return (
+        throughput,
+        _percentile(latencies, 0.50) * 1000,
+        _percentile(latencies, 0.99) * 1000,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--windows", type=float, nargs="*", default=[0.0, 0.5, 1.0, 5.0]
+    )
+    args = parser.parse_args()
+
+    print(f"{'window ms':>10} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for window in args.windows:
+        throughput, p50, p99 = run(window, args)
+        print(f"{window:>10.1f} {throughput:>10.0f} {p50:>8.2f} {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Pathological-input benchmark for the email validator.
+
+Times `validate_email` and the former backtracking pattern on inputs built
+to make the regex backtrack: a long domain of "a." runs that fails at the
+very end. The regex cost grows quadratically with the input; the scanner
+must stay linear, and `--check` fails when its cost per character on the
+largest input is more than `--max-ratio` times the cost on the smallest.
+
+Usage:
+    python -m benchmarks.bench_email [--max-size 100000] [--check]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+
+from src.email import validate_email
+
+# Padrão substituído, mantido só para comparação
+OLD_PATTERN = re.compile(r"^([^\s@]+)@([^\s@]+\.[^\s@]+)$")
+
+SHAPES = {
+    "dots": lambda size: "a@" + "a." * (size // 2) + " ",
+    "trailing-at": lambda size: "a@" + "a." * (size // 2) + "@",
+    "no-dot": lambda size: "a@" + "a" * size + " ",
+}
+
+
+def per_call(function, value: str, number: int) -> float:
+    """Returns the best time per call in seconds."""
+    timer = timeit.Timer(lambda: function(value))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-size", type=int, default=100_000)
+    parser.add_argument("--max-regex-size", type=int, default=10_000)
+    parser.add_argument("--max-ratio", type=float, default=5.0)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    sizes = [10**power for power in range(2, 8) if 10**power <= args.max_size]
+    failures = []
+    print(
+        f"{'shape':>12} {'size':>8} {'regex ms':>10} {'scanner ms':>11} "
+        f"{'ns/char':>8}"
+    )
+    for name, build in SHAPES.items():
+        per_char = []
+        for size in sizes:
+            value = build(size)
+            number = max(1, 100_000 // size)
+            scanner = per_call(validate_email, value, number)
+            per_char.append(scanner / len(value))
+            if size <= args.max_regex_size:
+                regex = per_call(OLD_PATTERN.match, value, 1) * 1e3
+                regex_text = f"{regex:>10.3f}"
+            else:
+                regex_text = f"{'-':>10}"
+            print(
+                f"{name:>12} {size:>8} {regex_text} {scanner * 1e3:>11.4f} "
+                f"{per_char[-1] * 1e9:>8.2f}"
+            )
+        if per_char[-1] > per_char[0] * args.max_ratio:
+            failures.append((name, per_char[-1], per_char[0]))
+
+    for name, worst, first in failures:
+        print(
+            f"not linear: {name} {worst * 1e9:.2f} ns/char "
+            f"vs {first * 1e9:.2f} ns/char on the smallest input"
+        )
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Throughput benchmark for the fixed-width parser.
+
+Writes a synthetic DETRAN-style export with CPF, CNH, CRV and plate
+fields and reports records per second and MB/s of
+`FixedWidthParser.validate_file`.
+
+Usage:
+    python -m benchmarks.bench_fixedwidth [--records 500000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.cpf import cpf_check_digits
+from src.fixedwidth import Field, FixedWidthParser
+
+LAYOUT = [
+    Field("cpf", 0, 11, "cpf"),
+    Field("cnh", 11, 11, "cnh"),
+    Field("crv", 22, 11, "crv"),
+    Field("placa", 33, 8, "plate"),
+    Field("nome", 41, 30),
+]
+
+
+def build_file(path: str, records: int, seed: int = 0) -> None:
+    """Writes `records` fixed-width lines, about 1% with an invalid CPF."""
+    rng = random.Random(seed)
+    with open(path, "wb") as target:
+        for _ in range(records):
+            base = f"{rng.randrange(10**9):09d}"
+            cpf = base + cpf_check_digits(base)
+            if rng.random() < 0.01:
+                cpf = base + "00"
+            line = f"{cpf}12345678901A1B2C3D4E5FABC1D23 {'FULANO DE TAL':<30}"
+            target.write(line.encode("latin-1") + b"\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "detran.txt")
+        build_file(path, args.records)
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        stats = FixedWidthParser(LAYOUT).validate_file(
+            path, os.path.join(directory, "rejects.txt")
+        )
+        elapsed = time.perf_counter() - start
+
+    print(f"records: {stats['records']}, rejected: {stats['rejected']}")
+    print(f"records/s: {stats['records'] / elapsed:,.0f}")
+    print(f"MB/s: {size / elapsed / 1_000_000:.1f}")
+
+
+if __name__ == "__main__":
+    main()
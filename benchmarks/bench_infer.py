@@ -0,0 +1,113 @@
+"""
+Benchmark for column type inference.
+
+Writes a synthetic partner file with many columns of every document type
+(plus free text and plain numbers) and reports the time of
+`infer_csv_types` over the whole file, the time per column, and how many
+columns were detected correctly.
+
+Usage:
+    python -m benchmarks.bench_infer [--columns 200] [--rows 5000]
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from src.cpf import cpf_check_digits
+from src.infer import infer_csv_types
+
+
+def _cpf(rng: random.Random) -> str:
+    base = f"{rng.randrange(10**9):09d}"
+    cpf = base + cpf_check_digits(base)
+    if rng.random() < 0.5:
+        return cpf
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+
+def _cnh(rng: random.Random) -> str:
+    digits = [rng.randrange(10) for _ in range(9)]
+    first = sum(d * w for d, w in zip(digits, range(9, 0, -1))) * 10 % 11
+    second = sum(d * w for d, w in zip(digits, range(1, 10))) * 10 % 11
+    return "".join(map(str, digits)) + f"{first % 10}{second % 10}"
+
+
+def _phone(rng: random.Random) -> str:
+    return f"({rng.randrange(11, 100)}) 9{rng.randrange(10**7, 10**8)}"
+
+
+def _plate(rng: random.Random) -> str:
+    letters = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in "abc")
+    return f"{letters}{rng.randrange(10)}{rng.choice('ABCDE0123')}" + (
+        f"{rng.randrange(100):02d}"
+    )
+
+
+def _crv(rng: random.Random) -> str:
+    return "".join(rng.choice("ABCDEFGH0123456789") for _ in range(11))
+
+
+def _email(rng: random.Random) -> str:
+    return f"user{rng.randrange(10**6)}@example.com"
+
+
+def _text(rng: random.Random) -> str:
+    return rng.choice(("Maria", "João", "Ana Paula", "São Paulo - SP"))
+
+
+def _number(rng: random.Random) -> str:
+    return str(rng.randrange(10**6))
+
+
+GENERATORS = {
+    "cpf": _cpf,
+    "cnh": _cnh,
+    "phone": _phone,
+    "plate": _plate,
+    "crv": _crv,
+    "email": _email,
+    "none": _text,
+    "number": _number,
+}
+
+
+def build_file(path: str, columns: int, rows: int, seed: int = 0) -> list:
+    """Writes the synthetic file and returns the type of each column."""
+    rng = random.Random(seed)
+    kinds = [
+        list(GENERATORS)[index % len(GENERATORS)] for index in range(columns)
+    ]
+    with open(path, "w", encoding="utf-8", newline="") as target:
+        writer = csv.writer(target)
+        for _ in range(rows):
+            writer.writerow([GENERATORS[kind](rng) for kind in kinds])
+    return ["none" if kind == "number" else kind for kind in kinds]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "partner.csv")
+        expected = build_file(path, args.columns, args.rows)
+
+        start = time.perf_counter()
+        inferred = infer_csv_types(path)
+        elapsed = time.perf_counter() - start
+
+    correct = sum(kind == want for (kind, _), want in zip(inferred, expected))
+    print(f"columns: {args.columns}, rows: {args.rows}")
+    print(f"total: {elapsed * 1000:.1f} ms")
+    print(f"per column: {elapsed * 1000 / args.columns:.2f} ms")
+    print(f"correct: {correct}/{args.columns}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Throughput benchmark for keyed CPF tokenization.
+
+Generates valid CPFs and reports tokens per second of
+`Tokenizer.tokenize_many` in a single process and of `tokenize_parallel`
+across a process pool. The pool scales with the number of cores.
+
+Usage:
+    python -m benchmarks.bench_pseudonym [--count 1000000] [--processes 4]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from src.cpf import cpf_check_digits
+from src.pseudonym import Tokenizer, tokenize_parallel
+
+
+def build_cpfs(count: int, seed: int = 0) -> list[str]:
+    """Returns `count` valid CPFs, half of them formatted."""
+    rng = random.Random(seed)
+    cpfs = []
+    for index in range(count):
+        base = f"{rng.randrange(1, 10**9 - 1):09d}"
+        cpf = base + cpf_check_digits(base)
+        if index % 2:
+            cpf = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        cpfs.append(cpf)
+    return cpfs
+
+
+def run(function, values: list[str]) -> float:
+    """Runs `function(values)` and returns values per second."""
+    start = time.perf_counter()
+    function(values)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    key = b"benchmark-key"
+    cpfs = build_cpfs(args.count)
+    tokenizer = Tokenizer(key)
+
+    print(f"{'mode':>24} {'values/s':>12}")
+    for kind in ("cpf", "cpf_fpe"):
+        rate = run(lambda values: tokenizer.tokenize_many(values, kind), cpfs)
+        print(f"{kind + ' (1 process)':>24} {rate:>12,.0f}")
+
+    rate = run(
+        lambda values: tokenize_parallel(
+            values, "cpf", key, processes=args.processes
+        ),
+        cpfs,
+    )
+    print(f"{f'cpf ({args.processes} processes)':>24} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Throughput benchmark for the PII redactor.
+
+Builds synthetic log lines with a configurable fraction of lines carrying
+PII (CPF, email, phone and plate) and reports the throughput in MB/s of
+`Redactor.redact_stream` over 1 MiB byte chunks. `--check` fails when the
+throughput on a log without PII (timestamped lines only, which must skip
+the CPF/phone and plate regexes) is below `--min-mbps`.
+
+Usage:
+    python -m benchmarks.bench_redact [--megabytes 50] [--pii 0.1] [--check]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from src.redact import Redactor
+
+_PLAIN = (
+    "2024-01-01 12:00:{second:02d} INFO request handled "
+    "path=/api/v1/items status=200 took {ms}ms bytes=5421\n"
+)
+_PII = (
+    "2024-01-01 12:00:{second:02d} INFO login user=joao{ms}@email.com "
+    "cpf=111.444.777-35 tel=(11) 91234-5678 placa=ABC1D23 took {ms}ms\n"
+)
+
+
+def build_log(megabytes: int, pii_ratio: float, seed: int = 0) -> bytes:
+    """Returns a synthetic log of about `megabytes` MB."""
+    rng = random.Random(seed)
+    lines = []
+    size = 0
+    target = megabytes * 1_000_000
+    while size < target:
+        template = _PII if rng.random() < pii_ratio else _PLAIN
+        line = template.format(second=rng.randrange(60), ms=rng.randrange(999))
+        lines.append(line)
+        size += len(line)
+    return "".join(lines).encode("utf-8")
+
+
+def run(megabytes: int, pii_ratio: float, chunk_size: int) -> float:
+    """Redacts the synthetic log and returns the throughput in MB/s."""
+    data = build_log(megabytes, pii_ratio)
+    chunks = [
+        data[start : start + chunk_size]
+        for start in range(0, len(data), chunk_size)
+    ]
+    redactor = Redactor()
+
+    start = time.perf_counter()
+    for _ in redactor.redact_stream(chunks):
+        pass
+    elapsed = time.perf_counter() - start
+
+    return len(data) / elapsed / 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--megabytes", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument(
+        "--pii",
+        type=float,
+        nargs="*",
+        default=[0.0, 0.01, 0.1, 1.0],
+        help="Fractions of lines containing PII",
+    )
+    parser.add_argument("--min-mbps", type=float, default=50.0)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'PII lines':>10} {'MB/s':>10}")
+    for ratio in args.pii:
+        throughput = run(args.megabytes, ratio, args.chunk_size)
+        print(f"{ratio:>10.0%} {throughput:>10.1f}")
+
+    plain = run(args.megabytes, 0.0, args.chunk_size)
+    print(f"no PII: {plain:.1f} MB/s (minimum {args.min_mbps:.1f})")
+    if args.check and plain < args.min_mbps:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
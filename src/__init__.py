@@ -7,85 +7,264 @@ CPF (individual taxpayer registry), CRV (vehicle registration certificate),
 email addresses, passwords, phone numbers, and vehicle license plates
 
 Functions:
+- Cache:
+  - `RevalidationCache`,
+  - `validation_version`
 - CNH:
+  - `check_cnh`,
   - `format_cnh`,
   - `is_cnh_format`,
   - `validate_cnh`
 - CPF:
+  - `CPF_REGIONS`,
+  - `check_cpf`,
+  - `cpf_check_digits`,
+  - `cpf_digits_failure`,
+  - `cpf_region`,
   - `format_cpf`,
   - `is_cpf_format`,
   - `validate_cpf`
 - CRV:
+  - `check_crv`,
   - `format_crv`,
   - `is_crv_format`,
   - `validate_crv`
+- Daemon:
+  - `ValidationServer`,
+  - `validate_batch`
 - Email:
+  - `check_email`,
   - `extract_domain`,
   - `extract_username`,
+  - `is_blocked_domain`,
+  - `is_blocked_email`,
   - `is_email_format`,
+  - `load_domain_blocklist`,
+  - `parse_email`,
   - `validate_email`
+- Fixed-width:
+  - `Field`,
+  - `FixedWidthParser`,
+  - `FixedWidthRecord`
+- Guard:
+  - `GUARDED_VALIDATORS`,
+  - `guarded`,
+  - `guarded_validate_brazilian_phone`,
+  - `guarded_validate_cnh`,
+  - `guarded_validate_cpf`,
+  - `guarded_validate_crv`,
+  - `guarded_validate_email`,
+  - `guarded_validate_plate`
+- Infer:
+  - `infer_column_type`,
+  - `infer_csv_types`
+- Join:
+  - `KEYS`,
+  - `dedup_file`,
+  - `join_files`
+- Partition:
+  - `partition_cpf_file`,
+  - `partition_cpfs`
 - Password:
   - `validate_password_length`,
   - `validate_password_match`,
   - `validate_password_strength`
 - Phone:
+  - `check_brazilian_phone`,
   - `clean_phone`,
   - `format_brazilian_phone`,
+  - `format_e164_phone`,
+  - `format_e164_phones`,
   - `is_valid_ddd`,
+  - `phone_to_key`,
   - `validate_brazilian_phone`
 - Plate:
+  - `check_plate`,
   - `format_plate`,
   - `is_mercosul_format_plate`,
   - `is_old_format_plate`,
   - `validate_plate`
+- Pseudonym:
+  - `Tokenizer`,
+  - `tokenize_parallel`
+- Redact:
+  - `Redactor`,
+  - `redact_text`
+- Result:
+  - `FailureCode`,
+  - `ValidationResult`
+- Stats:
+  - `CountMinSketch`,
+  - `FieldStats`,
+  - `HeavyHitters`,
+  - `HyperLogLog`
 
 """
 
-from .cnh import format_cnh, is_cnh_format, validate_cnh
-from .cpf import format_cpf, is_cpf_format, validate_cpf
-from .crv import format_crv, is_crv_format, validate_crv
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .cnh import check_cnh, format_cnh, is_cnh_format, validate_cnh
+from .cpf import (
+    CPF_REGIONS,
+    check_cpf,
+    cpf_check_digits,
+    cpf_digits_failure,
+    cpf_region,
+    format_cpf,
+    is_cpf_format,
+    validate_cpf,
+)
+from .crv import check_crv, format_crv, is_crv_format, validate_crv
 from .email import (
+    check_email,
     extract_domain,
     extract_username,
+    is_blocked_domain,
+    is_blocked_email,
     is_email_format,
+    load_domain_blocklist,
+    parse_email,
     validate_email,
 )
+from .fixedwidth import Field, FixedWidthParser, FixedWidthRecord
+from .guard import (
+    GUARDED_VALIDATORS,
+    guarded,
+    guarded_validate_brazilian_phone,
+    guarded_validate_cnh,
+    guarded_validate_cpf,
+    guarded_validate_crv,
+    guarded_validate_email,
+    guarded_validate_plate,
+)
 from .password import (
     validate_password_length,
     validate_password_match,
     validate_password_strength,
 )
 from .phone import (
+    check_brazilian_phone,
     clean_phone,
     format_brazilian_phone,
+    format_e164_phone,
+    format_e164_phones,
     is_valid_ddd,
+    phone_to_key,
     validate_brazilian_phone,
 )
 from .plate import (
+    check_plate,
     format_plate,
     is_mercosul_format_plate,
     is_old_format_plate,
     validate_plate,
 )
+from .redact import Redactor, redact_text
+from .result import FailureCode, ValidationResult
+from .stats import CountMinSketch, FieldStats, HeavyHitters, HyperLogLog
+
+# Módulos com dependências de importação cara (sqlite3, asyncio,
+# multiprocessing, statistics) ou com CLI própria são carregados só no
+# primeiro acesso: mantém o `import src` rápido e o `python -m src.join`
+# sem o RuntimeWarning do runpy
+_LAZY_MODULES = {
+    "RevalidationCache": "cache",
+    "validation_version": "cache",
+    "ValidationServer": "daemon",
+    "validate_batch": "daemon",
+    "infer_column_type": "infer",
+    "infer_csv_types": "infer",
+    "KEYS": "join",
+    "dedup_file": "join",
+    "join_files": "join",
+    "partition_cpf_file": "partition",
+    "partition_cpfs": "partition",
+    "Tokenizer": "pseudonym",
+    "tokenize_parallel": "pseudonym",
+}
+
+if TYPE_CHECKING:
+    from .cache import RevalidationCache, validation_version
+    from .daemon import ValidationServer, validate_batch
+    from .infer import infer_column_type, infer_csv_types
+    from .join import KEYS, dedup_file, join_files
+    from .partition import partition_cpf_file, partition_cpfs
+    from .pseudonym import Tokenizer, tokenize_parallel
+
+
+def __getattr__(name: str):
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
 
 __all__ = [
+    # Cache
+    "RevalidationCache",
+    "validation_version",
     # CNH
     "validate_cnh",
     "format_cnh",
     "is_cnh_format",
+    "check_cnh",
     # CPF
     "format_cpf",
     "validate_cpf",
     "is_cpf_format",
+    "check_cpf",
+    "cpf_region",
+    "cpf_check_digits",
+    "cpf_digits_failure",
+    "CPF_REGIONS",
     # CRV
     "validate_crv",
     "format_crv",
     "is_crv_format",
+    "check_crv",
+    # Daemon
+    "ValidationServer",
+    "validate_batch",
     # Email
     "validate_email",
     "is_email_format",
+    "check_email",
     "extract_domain",
     "extract_username",
+    "parse_email",
+    "load_domain_blocklist",
+    "is_blocked_domain",
+    "is_blocked_email",
+    # Fixed-width
+    "Field",
+    "FixedWidthParser",
+    "FixedWidthRecord",
+    # Guard
+    "GUARDED_VALIDATORS",
+    "guarded",
+    "guarded_validate_cpf",
+    "guarded_validate_cnh",
+    "guarded_validate_crv",
+    "guarded_validate_plate",
+    "guarded_validate_brazilian_phone",
+    "guarded_validate_email",
+    # Infer
+    "infer_column_type",
+    "infer_csv_types",
+    # Join
+    "KEYS",
+    "join_files",
+    "dedup_file",
+    # Partition
+    "partition_cpfs",
+    "partition_cpf_file",
     # Password
     "validate_password_length",
     "validate_password_strength",
@@ -93,52 +272,142 @@ __all__ = [
     # Phone
     "format_brazilian_phone",
     "validate_brazilian_phone",
+    "check_brazilian_phone",
     "clean_phone",
     "is_valid_ddd",
+    "format_e164_phone",
+    "format_e164_phones",
+    "phone_to_key",
     # Plate
     "validate_plate",
     "format_plate",
     "is_old_format_plate",
     "is_mercosul_format_plate",
+    "check_plate",
+    # Pseudonym
+    "Tokenizer",
+    "tokenize_parallel",
+    # Redact
+    "Redactor",
+    "redact_text",
+    # Result
+    "FailureCode",
+    "ValidationResult",
+    # Stats
+    "CountMinSketch",
+    "HeavyHitters",
+    "HyperLogLog",
+    "FieldStats",
 ]
 
 __annotations__ = {
+    "Cache": {
+        "RevalidationCache": "SQLite cache for incremental revalidation",
+        "validation_version": "Function to fingerprint the validation logic",
+    },
     "CNH": {
+        "check_cnh": "Function to validate CNH with failure reason",
         "format_cnh": "Function to format CNH numbers",
         "is_cnh_format": "Function to check CNH format",
         "validate_cnh": "Function to validate CNH numbers",
     },
     "CPF": {
+        "CPF_REGIONS": "States of each CPF fiscal region",
+        "check_cpf": "Function to validate CPF with failure reason",
+        "cpf_check_digits": "Function to compute the CPF check digits",
+        "cpf_digits_failure": "Function to check a digits-only CPF",
+        "cpf_region": "Function to get the fiscal region of a CPF",
         "format_cpf": "Function to format CPF numbers",
         "is_cpf_format": "Function to check CPF format",
         "validate_cpf": "Function to validate CPF numbers",
     },
     "CRV": {
+        "check_crv": "Function to validate CRV with failure reason",
         "format_crv": "Function to format CRV numbers",
         "is_crv_format": "Function to check CRV format",
         "validate_crv": "Function to validate CRV numbers",
     },
+    "Daemon": {
+        "ValidationServer": "Unix socket server with micro-batching",
+        "validate_batch": "Function to validate (type, value) pairs",
+    },
     "Email": {
+        "check_email": "Function to validate email with failure reason",
         "extract_domain": "Function to extract domain from email",
         "extract_username": "Function to extract username from email",
+        "is_blocked_domain": "Function to check domain against a blocklist",
+        "is_blocked_email": "Function to check email against a blocklist",
         "is_email_format": "Function to check email format",
+        "load_domain_blocklist": "Function to load a domain blocklist",
+        "parse_email": "Function to validate and split email in one pass",
         "validate_email": "Function to validate email addresses",
     },
+    "Fixed-width": {
+        "Field": "Field of a fixed-width layout",
+        "FixedWidthParser": "Layout-driven validator for fixed-width files",
+        "FixedWidthRecord": "Validation result of a fixed-width record",
+    },
+    "Guard": {
+        "GUARDED_VALIDATORS": "Guarded validator of each type",
+        "guarded": "Function to reject oversized inputs in constant time",
+        "guarded_validate_brazilian_phone": "Guarded phone validator",
+        "guarded_validate_cnh": "Guarded CNH validator",
+        "guarded_validate_cpf": "Guarded CPF validator",
+        "guarded_validate_crv": "Guarded CRV validator",
+        "guarded_validate_email": "Guarded email validator",
+        "guarded_validate_plate": "Guarded plate validator",
+    },
+    "Infer": {
+        "infer_column_type": "Function to detect the document type of values",
+        "infer_csv_types": "Function to detect the type of file columns",
+    },
+    "Join": {
+        "KEYS": "Normalizer and validator of each join key type",
+        "dedup_file": "Function to deduplicate a file on a document key",
+        "join_files": "Function to join files on a document key",
+    },
+    "Partition": {
+        "partition_cpf_file": "Function to split a CPF file by region",
+        "partition_cpfs": "Function to route CPF records by region",
+    },
     "Password": {
         "validate_password_length": "Function to validate password length",
         "validate_password_match": "Function to check if passwords match",
         "validate_password_strength": "Function to validate password strength",
     },
     "Phone": {
+        "check_brazilian_phone": "Function to validate phone with reason",
         "clean_phone": "Function to clean phone number input",
         "format_brazilian_phone": "Function to format Brazilian phone",
+        "format_e164_phone": "Function to normalize phone to E.164",
+        "format_e164_phones": "Function to normalize phones in batch",
         "is_valid_ddd": "Function to check valid DDD codes",
+        "phone_to_key": "Function to convert phone to an integer key",
         "validate_brazilian_phone": "Function to validate Brazilian phone",
     },
     "Plate": {
+        "check_plate": "Function to validate plate with failure reason",
         "format_plate": "Function to format vehicle license plates",
         "is_mercosul_format_plate": "Function to check Mercosul plate format",
         "is_old_format_plate": "Function to check old plate format",
         "validate_plate": "Function to validate vehicle license plates",
     },
+    "Pseudonym": {
+        "Tokenizer": "Keyed tokenizer for CPFs and phones",
+        "tokenize_parallel": "Function to tokenize values in a process pool",
+    },
+    "Redact": {
+        "Redactor": "Streaming PII redactor for text and byte chunks",
+        "redact_text": "Function to mask CPFs, phones, emails and plates",
+    },
+    "Result": {
+        "FailureCode": "Reason why a value failed validation",
+        "ValidationResult": "Rich result returned by check functions",
+    },
+    "Stats": {
+        "CountMinSketch": "Sketch for approximate frequency counting",
+        "FieldStats": "Streaming statistics over validated fields",
+        "HeavyHitters": "Sketch for approximate top-k items",
+        "HyperLogLog": "Sketch for approximate distinct counting",
+    },
 }
@@ -0,0 +1,315 @@
+"""
+Incremental Revalidation Cache
+
+This module provides an on-disk (SQLite) cache for recurring batch jobs
+that revalidate mostly unchanged data. Results are cached at two levels:
+- chunk: a hash of the whole chunk of values maps to all its results, so
+  unchanged chunks are skipped without validating anything
+- value: a hash of each normalized value maps to its result, so changed
+  chunks only validate new values
+
+The cache is cleared whenever the validation logic changes, detected from
+`VALIDATION_VERSION` and a fingerprint of the validators' bytecode.
+"""
+
+import re
+import sqlite3
+from hashlib import blake2b
+from types import CodeType, FunctionType
+from typing import Callable, Iterable, Iterator, Sequence
+
+from .cnh import validate_cnh
+from .cpf import format_cpf, validate_cpf
+from .crv import format_crv, validate_crv
+from .email import validate_email
+from .phone import clean_phone, validate_brazilian_phone
+from .plate import format_plate, validate_plate
+
+# Incrementar quando a semântica de validação mudar sem mudar o bytecode
+VALIDATION_VERSION = "1"
+
+# Cada normalizador preserva a validade: valores com a mesma forma
+# normalizada têm sempre o mesmo resultado de validação
+VALIDATORS: dict[str, tuple[Callable[[str], bool], Callable[[str], str]]] = {
+    "cpf": (validate_cpf, format_cpf),
+    "cnh": (validate_cnh, str),
+    "crv": (validate_crv, format_crv),
+    "plate": (validate_plate, format_plate),
+    "phone": (validate_brazilian_phone, clean_phone),
+    "email": (validate_email, str),
+}
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+def _stable_repr(value) -> bytes:
+    # Conjuntos de strings têm ordem aleatória entre processos
+    if isinstance(value, (set, frozenset)):
+        return repr(sorted(map(repr, value))).encode("utf-8")
+    return repr(value).encode("utf-8")
+
+
+def _fingerprint_code(code: CodeType, namespace: dict, hasher, seen) -> None:
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _fingerprint_code(const, namespace, hasher, seen)
+        else:
+            hasher.update(_stable_repr(const))
+
+    package = __package__.split(".")[0]
+    for name in code.co_names:
+        value = namespace.get(name)
+        if isinstance(value, FunctionType):
+            if value in seen or value.__module__.split(".")[0] != package:
+                continue
+            seen.add(value)
+            _fingerprint_code(value.__code__, value.__globals__, hasher, seen)
+        elif isinstance(value, re.Pattern):
+            hasher.update(_stable_repr((value.pattern, value.flags)))
+        elif isinstance(value, (set, frozenset, tuple, str, int)):
+            hasher.update(_stable_repr(value))
+
+
+def validation_version() -> str:
+    """
+    Returns an identifier of the current validation logic.
+
+    It combines `VALIDATION_VERSION` with a hash of the bytecode, constants
+    and regex patterns of every validator and the package helpers they
+    call, so editing any validator changes it.
+
+    Returns:
+        str: Version identifier (e.g. "1-3f2a...")
+    """
+    hasher = blake2b(digest_size=8)
+    seen: set = set()
+    for kind, functions in sorted(VALIDATORS.items()):
+        hasher.update(kind.encode("utf-8"))
+        for function in functions:
+            if isinstance(function, FunctionType):
+                _fingerprint_code(
+                    function.__code__, function.__globals__, hasher, seen
+                )
+    return f"{VALIDATION_VERSION}-{hasher.hexdigest()}"
+
+
+class RevalidationCache:
+    """
+    SQLite cache of validation results for recurring batch jobs.
+
+    Args:
+        path (str): Path of the SQLite database (created if missing)
+        version (str | None): Validation version; defaults to
+            `validation_version()`. A different stored version clears the
+            cache.
+
+    Example:
+        - with RevalidationCache("validation.db") as cache:
+            - cache.validate_chunk("cpf", ["111.444.777-35", "123"])
+              - Returns: [True, False]
+            - cache.stats["skip_ratio"]  # Returns: 0.0 on the first run
+    """
+
+    def __init__(self, path: str, version: str | None = None) -> None:
+        self.version = version or validation_version()
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                kind TEXT NOT NULL,
+                digest BLOB NOT NULL,
+                results BLOB NOT NULL,
+                PRIMARY KEY (kind, digest)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS vals (
+                digest BLOB PRIMARY KEY, valid INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            """)
+        self._check_version()
+        self._stats = {
+            "chunks": 0,
+            "chunks_skipped": 0,
+            "values": 0,
+            "values_skipped": 0,
+            "values_cached": 0,
+            "values_validated": 0,
+        }
+
+    def _check_version(self) -> None:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone()
+        if row and row[0] == self.version:
+            return
+        with self._connection:
+            self._connection.execute("DELETE FROM chunks")
+            self._connection.execute("DELETE FROM vals")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                (self.version,),
+            )
+
+    def __enter__(self) -> "RevalidationCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commits pending writes and closes the database."""
+        self._connection.commit()
+        self._connection.close()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Counters of the current session.
+
+        Returns:
+            dict: chunks, chunks_skipped, values, values_skipped (in
+            skipped chunks), values_cached (hits in changed chunks),
+            values_validated and skip_ratio (fraction of values not
+            validated)
+        """
+        stats = dict(self._stats)
+        values = stats["values"]
+        validated = stats["values_validated"]
+        stats["skip_ratio"] = (values - validated) / values if values else 0.0
+        return stats
+
+    def validate(self, kind: str, value: str) -> bool:
+        """
+        Validates a single value, using the value cache.
+
+        Args:
+            kind (str): One of "cpf", "cnh", "crv", "plate", "phone", "email"
+            value (str): Value to validate
+
+        Returns:
+            bool: True if the value is valid, False otherwise
+        """
+        return self._validate_values(kind, [value])[0]
+
+    def validate_chunk(self, kind: str, values: Sequence[str]) -> list[bool]:
+        """
+        Validates a chunk of values, skipping it entirely if unchanged.
+
+        Args:
+            kind (str): One of "cpf", "cnh", "crv", "plate", "phone", "email"
+            values (Sequence[str]): Values of the chunk, in a stable order
+
+        Returns:
+            list[bool]: Validation results in input order
+        """
+        # repr() escapes every value, so distinct chunks never collide
+        digest = blake2b(
+            repr(list(values)).encode("utf-8"),
+            digest_size=16,
+            person=b"chunk",
+        ).digest()
+        self._stats["chunks"] += 1
+
+        row = self._connection.execute(
+            "SELECT results FROM chunks WHERE kind = ? AND digest = ?",
+            (kind, digest),
+        ).fetchone()
+        if row is not None and len(row[0]) == len(values):
+            self._stats["chunks_skipped"] += 1
+            self._stats["values"] += len(values)
+            self._stats["values_skipped"] += len(values)
+            return [bool(result) for result in row[0]]
+
+        results = self._validate_values(kind, values)
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?)",
+                (kind, digest, bytes(results)),
+            )
+        return results
+
+    def iter_validate(
+        self, kind: str, values: Iterable[str], chunk_size: int = 10_000
+    ) -> Iterator[bool]:
+        """
+        Validates a stream of values chunk by chunk.
+
+        Chunk boundaries depend only on the position in the stream, so an
+        unchanged export produces the same chunks on every run.
+
+        Args:
+            kind (str): One of "cpf", "cnh", "crv", "plate", "phone", "email"
+            values (Iterable[str]): Values to validate
+            chunk_size (int): Values per chunk (default: 10000)
+
+        Returns:
+            Iterator[bool]: Validation results in input order
+        """
+        chunk = []
+        for value in values:
+            chunk.append(value)
+            if len(chunk) == chunk_size:
+                yield from self.validate_chunk(kind, chunk)
+                chunk = []
+        if chunk:
+            yield from self.validate_chunk(kind, chunk)
+
+    def _validate_values(self, kind: str, values: Sequence[str]) -> list[bool]:
+        if kind not in VALIDATORS:
+            raise ValueError(f"Unknown validator: {kind!r}")
+        validator, normalize = VALIDATORS[kind]
+        prefix = f"{kind}\0"
+        keys = [
+            blake2b(
+                (prefix + normalize(value)).encode("utf-8", "surrogatepass"),
+                digest_size=16,
+            ).digest()
+            for value in values
+        ]
+
+        known: dict[bytes, bool] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _SQLITE_MAX_VARIABLES):
+            batch = unique[start : start + _SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(batch))
+            known.update(
+                (digest, bool(valid))
+                for digest, valid in self._connection.execute(
+                    "SELECT digest, valid FROM vals "
+                    f"WHERE digest IN ({placeholders})",
+                    batch,
+                )
+            )
+
+        hits = len(known)
+        new = {}
+        results = []
+        for key, value in zip(keys, values):
+            valid = known.get(key)
+            if valid is None:
+                valid = known[key] = new[key] = validator(value)
+            results.append(valid)
+
+        if new:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO vals VALUES (?, ?)",
+                    ((key, int(valid)) for key, valid in new.items()),
+                )
+
+        self._stats["values"] += len(values)
+        self._stats["values_cached"] += hits
+        self._stats["values_validated"] += len(new)
+        return results
+
+
+__all__ = [
+    "VALIDATION_VERSION",
+    "RevalidationCache",
+    "validation_version",
+]
@@ -5,6 +5,14 @@ This module provides functions to validate Brazilian CNH.
 """
 
 import re
+from operator import mul
+
+from .result import FailureCode, ValidationResult
+
+_CNH_PATTERN = re.compile(r"\d{11}")
+_NON_DIGIT = re.compile(r"\D")
+_FIRST_WEIGHTS = (9, 8, 7, 6, 5, 4, 3, 2, 1)
+_SECOND_WEIGHTS = (1, 2, 3, 4, 5, 6, 7, 8, 9)
 
 
 def validate_cnh(cnh: str) -> bool:
@@ -22,29 +30,59 @@ def validate_cnh(cnh: str) -> bool:
         - validate_cnh("123.456.789-01")  # Returns: True
         - validate_cnh("1234567890")  # Returns: False
     """
+    return not _cnh_failure(cnh)
+
+
+def _cnh_failure(cnh: str) -> FailureCode:
+    """Returns why a CNH is invalid, or FailureCode.OK."""
     # CNH validation requires exactly 11 digits with correct check digits.
     # Do not accept formatted strings (with dots/hyphens) here — the tests
     # expect `validate_cnh("123.456.789-01")` to be False.
-    if not re.fullmatch(r"\d{11}", cnh):
-        return False
+    if _CNH_PATTERN.fullmatch(cnh) is None:
+        if len(cnh) != 11:
+            return FailureCode.INVALID_LENGTH
+        return FailureCode.INVALID_CHARACTERS
 
     digits = [int(d) for d in cnh]
 
     # First verifier digit: weights 9..1 applied to digits 1..9
-    soma1 = sum(digits[i] * (9 - i) for i in range(9))
+    soma1 = sum(map(mul, digits, _FIRST_WEIGHTS))
     resto1 = (soma1 * 10) % 11
     if resto1 == 10:
         resto1 = 0
     if resto1 != digits[9]:
-        return False
+        return FailureCode.FIRST_CHECK_DIGIT
 
     # Second verifier digit: weights 1..9 applied to digits 1..9
-    soma2 = sum(digits[i] * (i + 1) for i in range(9))
+    soma2 = sum(map(mul, digits, _SECOND_WEIGHTS))
     resto2 = (soma2 * 10) % 11
     if resto2 == 10:
         resto2 = 0
+    if resto2 != digits[10]:
+        return FailureCode.SECOND_CHECK_DIGIT
+
+    return FailureCode.OK
+
+
+def check_cnh(cnh: str) -> ValidationResult:
+    """
+    Validates a Brazilian CNH and reports why it failed.
 
-    return resto2 == digits[10]
+    Args:
+        cnh (str): CNH string to validate
+
+    Returns:
+        ValidationResult: Result that is truthy if the CNH is valid, with
+        the failure `code`, and lazily built `message` and `normalized`
+        attributes
+
+    Example:
+        - bool(check_cnh("12345678901"))  # Returns: True
+        - check_cnh("12345678902").code
+          - Returns: FailureCode.SECOND_CHECK_DIGIT
+        - check_cnh("1234567890").code  # Returns: FailureCode.INVALID_LENGTH
+    """
+    return ValidationResult("CNH", _cnh_failure(cnh), cnh, format_cnh)
 
 
 def format_cnh(cnh: str) -> str:
@@ -62,7 +100,7 @@ def format_cnh(cnh: str) -> str:
         - format_cnh("12345678901")  # Returns: "12345678901"
         - format_cnh("12A34B56C78D90")  # Returns: "1234567890"
     """
-    return re.sub(r"\D", "", cnh)
+    return _NON_DIGIT.sub("", cnh)
 
 
 def is_cnh_format(cnh: str) -> bool:
@@ -81,11 +119,12 @@ def is_cnh_format(cnh: str) -> bool:
         - is_cnh_format("1234567890")  # Returns: False
     """
     # For CNH we expect a plain 11-digit string (no punctuation).
-    return bool(re.fullmatch(r"\d{11}", cnh))
+    return _CNH_PATTERN.fullmatch(cnh) is not None
 
 
 __all__ = [
     "validate_cnh",
     "format_cnh",
     "is_cnh_format",
+    "check_cnh",
 ]
@@ -6,6 +6,27 @@ This module provides functions to validate and format Brazilian CPF
 """
 
 import re
+from operator import mul
+
+from .result import FailureCode, ValidationResult
+
+_NON_DIGIT = re.compile(r"\D")
+_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Região fiscal de emissão, indicada pelo 9º dígito do CPF
+CPF_REGIONS: dict[int, tuple[str, ...]] = {
+    0: ("RS",),
+    1: ("DF", "GO", "MS", "MT", "TO"),
+    2: ("AC", "AM", "AP", "PA", "RO", "RR"),
+    3: ("CE", "MA", "PI"),
+    4: ("AL", "PB", "PE", "RN"),
+    5: ("BA", "SE"),
+    6: ("MG",),
+    7: ("ES", "RJ"),
+    8: ("SP",),
+    9: ("PR", "SC"),
+}
 
 
 def format_cpf(cpf: str) -> str:
@@ -24,7 +45,7 @@ def format_cpf(cpf: str) -> str:
         - format_cpf("123.456.789-01")  # Returns: "123.456.789-01"
         - format_cpf("1234567890")  # Returns: "1234567890"
     """
-    cpf = re.sub(r"\D", "", cpf)
+    cpf = _NON_DIGIT.sub("", cpf)
 
     # Aplica a máscara se tiver 11 dígitos
     if len(cpf) == 11:
@@ -49,27 +70,123 @@ def validate_cpf(cpf: str) -> bool:
         - validate_cpf("12345678909")  # Returns: False
         - validate_cpf("11144477735")  # Returns: True
     """
-    cpf = re.sub(r"\D", "", cpf)
+    return not cpf_digits_failure(_NON_DIGIT.sub("", cpf))
+
+
+def _check_digit(digits: list[int], weights: tuple[int, ...]) -> int:
+    resto = sum(map(mul, digits, weights)) * 10 % 11
+    return 0 if resto == 10 else resto
+
+
+def cpf_check_digits(base: str) -> str:
+    """
+    Computes the two check digits of a CPF base.
+
+    Args:
+        base (str): First 9 digits of the CPF, without formatting
+
+    Returns:
+        str: The two check digits
+
+    Raises:
+        ValueError: If `base` is not 9 digits
 
+    Example:
+        - cpf_check_digits("111444777")  # Returns: "35"
+        - cpf_check_digits("584492260")  # Returns: "31"
+    """
+    if len(base) != 9 or not base.isdecimal():
+        raise ValueError(f"Expected 9 digits, got {base!r}")
+    digits = [int(d) for d in base]
+    first = _check_digit(digits, _FIRST_WEIGHTS)
+    digits.append(first)
+    second = _check_digit(digits, _SECOND_WEIGHTS)
+    return f"{first}{second}"
+
+
+def cpf_digits_failure(digits: str) -> FailureCode:
+    """
+    Returns why a digits-only CPF is invalid.
+
+    Skips the cleanup of `validate_cpf`, for callers that already hold
+    the digits (e.g. to validate and then format them).
+
+    Args:
+        digits (str): CPF without formatting
+
+    Returns:
+        FailureCode: FailureCode.OK (falsy) if the CPF is valid, otherwise
+        the reason it failed
+
+    Example:
+        - cpf_digits_failure("11144477735")  # Returns: FailureCode.OK
+        - cpf_digits_failure("11111111111")
+          - Returns: FailureCode.REPEATED_DIGITS
+    """
     # CPF deve ter 11 dígitos e não pode ter todos os dígitos iguais
-    if len(cpf) != 11 or re.match(r"^(\d)\1+$", cpf):
-        return False
+    if len(digits) != 11:
+        return FailureCode.INVALID_LENGTH
+    if not digits.isdecimal():
+        return FailureCode.INVALID_CHARACTERS
+    if digits == digits[0] * 11:
+        return FailureCode.REPEATED_DIGITS
+
+    values = [int(d) for d in digits]
+
+    # Calcula o primeiro e o segundo dígitos verificadores
+    if _check_digit(values, _FIRST_WEIGHTS) != values[9]:
+        return FailureCode.FIRST_CHECK_DIGIT
+    if _check_digit(values, _SECOND_WEIGHTS) != values[10]:
+        return FailureCode.SECOND_CHECK_DIGIT
+
+    return FailureCode.OK
+
+
+def check_cpf(cpf: str) -> ValidationResult:
+    """
+    Validates a Brazilian CPF and reports why it failed.
+
+    Args:
+        cpf (str): CPF string to validate
+
+    Returns:
+        ValidationResult: Result that is truthy if the CPF is valid, with
+        the failure `code`, and lazily built `message` and `normalized`
+        (XXX.XXX.XXX-XX) attributes
 
-    # Calcula o primeiro dígito verificador
-    soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
-    resto = (soma * 10) % 11
-    if resto in [10, 11]:
-        resto = 0
-    if resto != int(cpf[9]):
-        return False
+    Example:
+        - bool(check_cpf("111.444.777-35"))  # Returns: True
+        - check_cpf("11144477735").normalized  # Returns: "111.444.777-35"
+        - check_cpf("111.444.777-36").code
+          - Returns: FailureCode.SECOND_CHECK_DIGIT
+        - check_cpf("1234").code  # Returns: FailureCode.INVALID_LENGTH
+    """
+    code = cpf_digits_failure(_NON_DIGIT.sub("", cpf))
+    return ValidationResult("CPF", code, cpf, format_cpf)
+
+
+def cpf_region(cpf: str) -> int:
+    """
+    Returns the fiscal region where a CPF was issued.
+
+    The region is the 9th digit of the CPF; `CPF_REGIONS` maps it to the
+    states of the region.
 
-    # Calcula o segundo dígito verificador
-    soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
-    resto = (soma * 10) % 11
-    if resto in [10, 11]:
-        resto = 0
+    Args:
+        cpf (str): CPF string with or without formatting
+
+    Returns:
+        int: Region from 0 to 9, or -1 if the CPF is invalid
 
-    return resto == int(cpf[10])
+    Example:
+        - cpf_region("111.444.777-35")  # Returns: 7 (ES, RJ)
+        - cpf_region("584.492.260-31")  # Returns: 0 (RS)
+        - cpf_region("111.444.777-36")  # Returns: -1
+    """
+    digits = _NON_DIGIT.sub("", cpf)
+    if cpf_digits_failure(digits):
+        return -1
+    return int(digits[8])
 
 
 def is_cpf_format(cpf: str) -> bool:
@@ -87,7 +204,7 @@ def is_cpf_format(cpf: str) -> bool:
         - is_cpf_format("12345678901")  # Returns: True
         - is_cpf_format("1234567890")  # Returns: False
     """
-    clean_cpf = re.sub(r"\D", "", cpf)
+    clean_cpf = _NON_DIGIT.sub("", cpf)
     return len(clean_cpf) == 11 and clean_cpf.isdigit()
 
 
@@ -95,4 +212,9 @@ __all__ = [
     "format_cpf",
     "validate_cpf",
     "is_cpf_format",
+    "check_cpf",
+    "cpf_region",
+    "cpf_check_digits",
+    "cpf_digits_failure",
+    "CPF_REGIONS",
 ]
@@ -6,6 +6,11 @@ This module provides functions to validate Brazilian CRV.
 
 import re
 
+from .result import FailureCode, ValidationResult
+
+_CRV_PATTERN = re.compile(r"^[A-Z0-9]{11}$")
+_WHITESPACE = re.compile(r"\s")
+
 
 def validate_crv(crv: str) -> bool:
     """
@@ -23,10 +28,39 @@ def validate_crv(crv: str) -> bool:
         - validate_crv("A1B2 C3D4E5F")  # Returns: True
     """
     # Remove espaços e converte para maiúsculo
-    limpo = re.sub(r"\s", "", crv).upper()
+    limpo = _WHITESPACE.sub("", crv).upper()
 
     # CRV deve ter 11 caracteres alfanuméricos
-    return bool(re.match(r"^[A-Z0-9]{11}$", limpo))
+    return _CRV_PATTERN.match(limpo) is not None
+
+
+def check_crv(crv: str) -> ValidationResult:
+    """
+    Validates a Brazilian CRV and reports why it failed.
+
+    Args:
+        crv (str): CRV string to validate
+
+    Returns:
+        ValidationResult: Result that is truthy if the CRV is valid, with
+        the failure `code`, and lazily built `message` and `normalized`
+        attributes
+
+    Example:
+        - bool(check_crv("a1b2 c3d4e5f"))  # Returns: True
+        - check_crv("a1b2 c3d4e5f").normalized  # Returns: "A1B2C3D4E5F"
+        - check_crv("1234567890").code  # Returns: FailureCode.INVALID_LENGTH
+        - check_crv("A1B2C3D4E5!").code
+          - Returns: FailureCode.INVALID_CHARACTERS
+    """
+    limpo = _WHITESPACE.sub("", crv).upper()
+    if _CRV_PATTERN.match(limpo) is not None:
+        code = FailureCode.OK
+    elif len(limpo) != 11:
+        code = FailureCode.INVALID_LENGTH
+    else:
+        code = FailureCode.INVALID_CHARACTERS
+    return ValidationResult("CRV", code, crv, format_crv)
 
 
 def format_crv(crv: str) -> str:
@@ -44,7 +78,7 @@ def format_crv(crv: str) -> str:
         - format_crv("A1B2C3D4E5F")  # Returns: "A1B2C3D4E5F"
         - format_crv("  a1 b2 c3 d4 e5 f  ")  # Returns: "A1B2C3D4E5F"
     """
-    return re.sub(r"\s", "", crv).upper()
+    return _WHITESPACE.sub("", crv).upper()
 
 
 def is_crv_format(crv: str) -> bool:
@@ -62,14 +96,13 @@ def is_crv_format(crv: str) -> bool:
         - is_crv_format("1234567890")  # Returns: False
         - is_crv_format("A1B2 C3D4E5F")  # Returns: True
     """
-    clean_crv = re.sub(r"\s", "", crv).upper()
-    return len(clean_crv) == 11 and bool(
-        re.match(r"^[A-Z0-9]{11}$", clean_crv)
-    )
+    clean_crv = _WHITESPACE.sub("", crv).upper()
+    return len(clean_crv) == 11 and _CRV_PATTERN.match(clean_crv) is not None
 
 
 __all__ = [
     "validate_crv",
     "format_crv",
     "is_crv_format",
+    "check_crv",
 ]
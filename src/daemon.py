@@ -0,0 +1,335 @@
+"""
+Local Validation Daemon
+
+This module provides a long-running validation server over a Unix domain
+socket, so non-Python and short-lived services can share the validation
+semantics of this package without importing it.
+
+Protocol: each request is "<type> <value>" (e.g. "cpf 111.444.777-35"),
+where type is one of "cpf", "cnh", "crv", "plate", "phone" or "email".
+The response is "1" (valid), "0" (invalid) or "E <message>". Requests and
+responses are framed either by a newline ("line") or by a 4-byte
+big-endian length prefix ("length"). Responses on a connection come back
+in request order, so clients may pipeline requests.
+
+Concurrent requests are coalesced into micro-batches: a batch is
+dispatched when `max_batch` requests are pending or `window` seconds after
+its first request, whichever comes first.
+
+Usage:
+    python -m src.daemon --socket /tmp/regexm.sock --window-ms 1
+"""
+
+import argparse
+import asyncio
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from .cnh import validate_cnh
+from .cpf import validate_cpf
+from .crv import validate_crv
+from .email import validate_email
+from .phone import validate_brazilian_phone
+from .plate import validate_plate
+
+VALIDATORS = {
+    "cpf": validate_cpf,
+    "cnh": validate_cnh,
+    "crv": validate_crv,
+    "plate": validate_plate,
+    "phone": validate_brazilian_phone,
+    "email": validate_email,
+}
+
+_LENGTH = struct.Struct(">I")
+_VALID = b"1"
+_INVALID = b"0"
+
+
+def validate_batch(requests: list[tuple[str, str]]) -> list[bool]:
+    """
+    Validates a batch of (type, value) requests.
+
+    Args:
+        requests (list[tuple[str, str]]): Pairs of type and value; types
+            must be keys of `VALIDATORS`
+
+    Returns:
+        list[bool]: Validation results in request order
+
+    Example:
+        - validate_batch([("cpf", "11144477735"), ("plate", "A1B2C3D")])
+          - Returns: [True, False]
+    """
+    validators = VALIDATORS
+    return [validators[kind](value) for kind, value in requests]
+
+
+class ValidationServer:
+    """
+    Unix socket server that validates requests in micro-batches.
+
+    Args:
+        path (str): Path of the Unix domain socket
+        window (float): Maximum time in seconds a request waits for its
+            batch to fill up (default: 0.001)
+        max_batch (int): Maximum number of requests per batch (default: 512)
+        workers (int): Number of worker processes; 0 validates in the event
+            loop, which is faster for cheap validators (default: 0)
+        framing (str): "line" or "length" (default: "line")
+        max_request_size (int): Largest accepted request in bytes
+            (default: 65536)
+
+    Example:
+        - server = ValidationServer("/tmp/regexm.sock", window=0.001)
+        - asyncio.run(server.serve_forever())
+    """
+
+    def __init__(
+        self,
+        path: str,
+        window: float = 0.001,
+        max_batch: int = 512,
+        workers: int = 0,
+        framing: str = "line",
+        max_request_size: int = 1 << 16,
+    ) -> None:
+        if framing not in ("line", "length"):
+            raise ValueError(f"Unknown framing: {framing!r}")
+        self.path = path
+        self.window = window
+        self.max_batch = max_batch
+        self.workers = workers
+        self.framing = framing
+        self.max_request_size = max_request_size
+        self._pending: list[tuple[str, str, asyncio.Future]] = []
+        self._wakeup: asyncio.Event | None = None
+        self._full: asyncio.Event | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._batcher: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+        self._clients: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Starts listening on the socket and the batching task."""
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._slots = asyncio.Semaphore(max(self.workers, 1))
+        if self.workers:
+            self._executor = ProcessPoolExecutor(self.workers)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=self.path, limit=self.max_request_size
+        )
+        self._batcher = asyncio.create_task(self._run_batcher())
+
+    async def serve_forever(self) -> None:
+        """Starts the server and serves until cancelled."""
+        await self.start()
+        try:
+            # Não usa Server.serve_forever: ao ser cancelado, ele espera as
+            # conexões abertas antes que close() possa desconectá-las
+            await asyncio.Event().wait()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """
+        Stops the server, the batching task and the worker pool.
+
+        Connected clients are disconnected; requests not yet dispatched
+        are answered with an error.
+        """
+        if self._server is not None:
+            self._server.close()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            self._batcher = None
+
+        # Falha os pedidos que não chegaram a um lote e espera os lotes em
+        # andamento, para que nenhuma resposta fique pendente
+        pending, self._pending = self._pending, []
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(ConnectionAbortedError("server closed"))
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+        # Desde o Python 3.12, wait_closed espera todas as conexões abertas
+        clients = list(self._clients)
+        for client in clients:
+            client.cancel()
+        if clients:
+            await asyncio.gather(*clients, return_exceptions=True)
+
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _submit(self, kind: str, value: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((kind, value, future))
+        # O primeiro pedido abre a janela; um lote cheio a fecha
+        if len(self._pending) == 1:
+            self._wakeup.set()
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+        return future
+
+    async def _run_batcher(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self.window > 0 and len(self._pending) < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+            self._full.clear()
+
+            batch = self._pending[: self.max_batch]
+            self._pending = self._pending[self.max_batch :]
+            if self._pending:
+                self._wakeup.set()
+
+            await self._slots.acquire()
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        requests = [(kind, value) for kind, value, _ in batch]
+        try:
+            if self._executor is None:
+                results = validate_batch(requests)
+            else:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    self._executor, validate_batch, requests
+                )
+        except Exception as error:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, _, future), valid in zip(batch, results):
+            if not future.done():
+                future.set_result(_VALID if valid else _INVALID)
+
+    def _request(self, payload: bytes) -> asyncio.Future:
+        kind, _, value = payload.decode("utf-8", "replace").partition(" ")
+        if kind in VALIDATORS:
+            return self._submit(kind, value)
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(f"E unknown type {kind!r}".encode("utf-8"))
+        return future
+
+    async def _read(self, reader: asyncio.StreamReader) -> bytes | None:
+        if self.framing == "line":
+            line = await reader.readline()
+            if not line:
+                return None
+            return line.rstrip(b"\r\n")
+
+        header = await reader.readexactly(_LENGTH.size)
+        (size,) = _LENGTH.unpack(header)
+        if size > self.max_request_size:
+            raise ValueError("Request too large")
+        return await reader.readexactly(size)
+
+    def _frame(self, response: bytes) -> bytes:
+        if self.framing == "line":
+            return response + b"\n"
+        return _LENGTH.pack(len(response)) + response
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        client = asyncio.current_task()
+        self._clients.add(client)
+        responses: asyncio.Queue = asyncio.Queue()
+        responder = asyncio.create_task(self._respond(responses, writer))
+        try:
+            while True:
+                payload = await self._read(reader)
+                if payload is None:
+                    break
+                responses.put_nowait(self._request(payload))
+        except (asyncio.IncompleteReadError, ValueError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Servidor encerrando: não espera o cliente ler as respostas
+            responder.cancel()
+            raise
+        finally:
+            responses.put_nowait(None)
+            try:
+                await asyncio.gather(responder, return_exceptions=True)
+            finally:
+                writer.close()
+                self._clients.discard(client)
+
+    async def _respond(
+        self, responses: asyncio.Queue, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                future = await responses.get()
+                if future is None:
+                    break
+                try:
+                    response = await future
+                except Exception as error:
+                    response = f"E {error}".encode("utf-8")
+                writer.write(self._frame(response))
+                if responses.empty():
+                    await writer.drain()
+        except ConnectionError:
+            pass
+
+
+__all__ = [
+    "VALIDATORS",
+    "ValidationServer",
+    "validate_batch",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="regexm validation daemon")
+    parser.add_argument("--socket", default="/tmp/regexm.sock")
+    parser.add_argument("--window-ms", type=float, default=1.0)
+    parser.add_argument("--max-batch", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--framing", choices=("line", "length"), default="line"
+    )
+    args = parser.parse_args()
+
+    server = ValidationServer(
+        args.socket,
+        window=args.window_ms / 1000,
+        max_batch=args.max_batch,
+        workers=args.workers,
+        framing=args.framing,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
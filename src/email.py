@@ -2,17 +2,73 @@
 Email Validation Functions
 
 This module provides functions to validate email addresses.
+
+Addresses are checked by a scanner that runs in linear time on any input.
+It accepts exactly the addresses of the former pattern (a username, "@",
+and a domain with a dot, none of them with spaces or another "@"), whose
+backtracking regex went quadratic on long domains with many dots. An
+optional strict mode also enforces the RFC 5321 length limits.
 """
 
 import re
+import sys
+
+from .result import FailureCode, ValidationResult
+
+_WHITESPACE = re.compile(r"\s")
+
+# Limites de tamanho do RFC 5321 (modo estrito)
+_MAX_ADDRESS_LENGTH = 254
+_MAX_LOCAL_LENGTH = 64
+_MAX_DOMAIN_LENGTH = 253
+_MAX_LABEL_LENGTH = 63
+
+
+def _scan_email(email: str) -> tuple[int, int]:
+    """
+    Returns the position of "@" and the end of a valid email address, or
+    (-1, 0) if invalid. Every step is a single linear scan.
+    """
+    end = len(email)
+    # Como o "$" do padrão: aceita uma quebra de linha final
+    if email.endswith("\n"):
+        end -= 1
+
+    # Exatamente um "@", com usuário não vazio
+    at = email.find("@", 0, end)
+    if at < 1 or email.find("@", at + 1, end) != -1:
+        return -1, 0
 
+    # O domínio precisa de um "." que não seja seu primeiro nem último
+    # caractere; basta olhar o primeiro "." depois do primeiro caractere
+    dot = email.find(".", at + 2, end)
+    if dot == -1 or dot > end - 2:
+        return -1, 0
 
-def validate_email(email: str) -> bool:
+    if _WHITESPACE.search(email, 0, end):
+        return -1, 0
+    return at, end
+
+
+def _exceeds_limits(email: str, at: int, end: int) -> bool:
+    """Checks the RFC 5321 length limits of a scanned email address."""
+    if end > _MAX_ADDRESS_LENGTH or at > _MAX_LOCAL_LENGTH:
+        return True
+    if end - at - 1 > _MAX_DOMAIN_LENGTH:
+        return True
+    labels = email[at + 1 : end].split(".")
+    return max(map(len, labels)) > _MAX_LABEL_LENGTH
+
+
+def validate_email(email: str, strict: bool = False) -> bool:
     """
-    Validates an email address using regex pattern.
+    Validates an email address in linear time.
 
     Args:
         email (str): Email address to validate
+        strict (bool): Also enforce the RFC 5321 length limits: 254
+            characters in the address, 64 in the username, 253 in the
+            domain and 63 in each domain label (default: False)
 
     Returns:
         bool: True if email is valid, False otherwise
@@ -21,9 +77,50 @@ def validate_email(email: str) -> bool:
         - validate_email("test@example.com")  # Returns: True
         - validate_email("invalid-email")  # Returns: False
         - validate_email("user.name+tag+sorting@example.com")  # Returns: True
+        - validate_email("a" * 65 + "@example.com", strict=True)
+          - Returns: False
     """
-    pattern = r"^[^\s@]+@[^\s@]+\.[^\s@]+$"
-    return bool(re.match(pattern, email))
+    at, end = _scan_email(email)
+    if at < 0:
+        return False
+    return not (strict and _exceeds_limits(email, at, end))
+
+
+def check_email(email: str, strict: bool = False) -> ValidationResult:
+    """
+    Validates an email address and reports why it failed.
+
+    Args:
+        email (str): Email address to validate
+        strict (bool): Also enforce the RFC 5321 length limits, failing
+            with FailureCode.INVALID_LENGTH (default: False)
+
+    Returns:
+        ValidationResult: Result that is truthy if the email is valid, with
+        the failure `code`, and lazily built `message` and `normalized`
+        (lowercased) attributes
+
+    Example:
+        - bool(check_email("test@example.com"))  # Returns: True
+        - check_email("Test@Example.com").normalized
+          - Returns: "test@example.com"
+        - check_email("invalid-email").code
+          - Returns: FailureCode.INVALID_FORMAT
+    """
+    at, end = _scan_email(email)
+    if at < 0:
+        code = FailureCode.INVALID_FORMAT
+    elif strict and _exceeds_limits(email, at, end):
+        code = FailureCode.INVALID_LENGTH
+    else:
+        code = FailureCode.OK
+    return ValidationResult("Email", code, email, _normalize_email)
+
+
+def _normalize_email(email: str) -> str:
+    """Returns the lowercased email address, or empty string if invalid."""
+    valid, username, domain = parse_email(email, lowercase=True)
+    return f"{username}@{domain}" if valid else ""
 
 
 def is_email_format(email: str) -> bool:
@@ -59,9 +156,7 @@ def extract_domain(email: str) -> str:
         - extract_domain("invalid-email")  # Returns: ""
         - extract_domain("user.name+ta@example.com")  # Returns: "example.com"
     """
-    if validate_email(email):
-        return email.split("@")[1]
-    return ""
+    return parse_email(email)[2]
 
 
 def extract_username(email: str) -> str:
@@ -79,14 +174,146 @@ def extract_username(email: str) -> str:
         - extract_username("invalid-email")  # Returns: ""
         - extract_username("user.name@example.com")  # Returns: "user.name"
     """
-    if validate_email(email):
-        return email.split("@")[0]
-    return ""
+    return parse_email(email)[1]
+
+
+def parse_email(
+    email: str,
+    lowercase: bool = False,
+    idna: bool = False,
+    intern: bool = False,
+    strict: bool = False,
+) -> tuple[bool, str, str]:
+    """
+    Validates an email address and splits it in a single pass.
+
+    Args:
+        email (str): Email address to parse
+        lowercase (bool): Lowercase both the username and the domain
+        idna (bool): Encode the domain with IDNA (e.g. "ação.com" becomes
+            "xn--ao-siap.com"); domains that cannot be encoded are invalid
+        intern (bool): Intern the domain with `sys.intern`, so repeated
+            domains share a single string during bulk processing
+        strict (bool): Also enforce the RFC 5321 length limits
+
+    Returns:
+        tuple[bool, str, str]: (valid, username, domain), with empty
+        username and domain if invalid
+
+    Example:
+        - parse_email("test@example.com")
+          - Returns: (True, "test", "example.com")
+        - parse_email("Test@Example.COM", lowercase=True)
+          - Returns: (True, "test", "example.com")
+        - parse_email("invalid-email")  # Returns: (False, "", "")
+    """
+    at, end = _scan_email(email)
+    if at < 0 or (strict and _exceeds_limits(email, at, end)):
+        return False, "", ""
+
+    username = email[:at]
+    domain = email[at + 1 : end]
+    if lowercase:
+        username = username.lower()
+        domain = domain.lower()
+    if idna:
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            return False, "", ""
+    if intern:
+        domain = sys.intern(domain)
+
+    return True, username, domain
+
+
+def load_domain_blocklist(path: str) -> frozenset[str]:
+    """
+    Loads a blocklist of domains (e.g. disposable email providers).
+
+    The file must contain one domain per line. Blank lines and lines
+    starting with "#" are ignored, and domains are lowercased.
+
+    Args:
+        path (str): Path to the blocklist file
+
+    Returns:
+        frozenset[str]: Set of blocked domains
+
+    Example:
+        - load_domain_blocklist("disposable.txt")
+          - Returns: frozenset({"mailinator.com", "tempmail.com"})
+    """
+    with open(path, encoding="utf-8") as file:
+        return frozenset(
+            sys.intern(line.lower().removesuffix("."))
+            for line in (raw.strip() for raw in file)
+            if line and not line.startswith("#")
+        )
+
+
+def is_blocked_domain(domain: str, blocklist: frozenset[str]) -> bool:
+    """
+    Checks if a domain, or any parent domain, is in the blocklist.
+
+    Each suffix of the domain on a label boundary is looked up in the set,
+    so the cost depends on the number of labels, not on the blocklist size.
+
+    Args:
+        domain (str): Domain to check
+        blocklist (frozenset[str]): Lowercased blocked domains
+
+    Returns:
+        bool: True if the domain is blocked, False otherwise
+
+    Example:
+        - is_blocked_domain("tempmail.com", {"tempmail.com"})  # Returns: True
+        - is_blocked_domain("x.tempmail.com", {"tempmail.com"}) # Returns: True
+        - is_blocked_domain("tempmail.com.", {"tempmail.com"})  # Returns: True
+        - is_blocked_domain("example.com", {"tempmail.com"})  # Returns: False
+    """
+    domain = domain.lower()
+    # "tempmail.com." (forma absoluta do DNS) é o mesmo domínio
+    if domain.endswith("."):
+        domain = domain[:-1]
+    start = 0
+    while True:
+        if domain[start:] in blocklist:
+            return True
+        start = domain.find(".", start) + 1
+        if not start:
+            return False
+
+
+def is_blocked_email(email: str, blocklist: frozenset[str]) -> bool:
+    """
+    Checks if the domain of an email address is in the blocklist.
+
+    Args:
+        email (str): Email address to check
+        blocklist (frozenset[str]): Lowercased blocked domains
+
+    Returns:
+        bool: True if the email is valid and its domain is blocked,
+        False otherwise
+
+    Example:
+        - is_blocked_email("a@tempmail.com", {"tempmail.com"})  # Returns: True
+        - is_blocked_email("a@example.com", {"tempmail.com"})  # Returns: False
+        - is_blocked_email("invalid-email", {"tempmail.com"})  # Returns: False
+    """
+    valid, _, domain = parse_email(email)
+    return valid and is_blocked_domain(domain, blocklist)
 
 
 __all__ = [
     "validate_email",
+    "check_email",
     "is_email_format",
     "extract_domain",
     "extract_username",
+    "parse_email",
+    "load_domain_blocklist",
+    "is_blocked_domain",
+    "is_blocked_email",
 ]
@@ -0,0 +1,330 @@
+"""
+Fixed-width Record Parsing Functions
+
+This module validates the fixed-width text exports of state agencies
+(DETRAN), whose records carry plate, CRV, CNH and CPF fields at fixed
+offsets. A layout maps each field to its offset, width and type.
+
+Files are read in large blocks and each record is a `memoryview` slice of
+its block. Fields are checked in place, with bytes patterns matched over
+the block (`pos`/`endpos`) and check digits computed from the raw bytes,
+so no `str` is created per field unless decoding is requested. Values
+that the fast path cannot settle (e.g. a formatted CPF) are decoded and
+checked with the regular `validate_*` functions, so results always match
+them.
+"""
+
+import re
+from functools import partial
+from operator import mul
+from typing import IO, Callable, Iterator, NamedTuple, Sequence
+
+from .cnh import validate_cnh
+from .cpf import validate_cpf
+from .crv import validate_crv
+from .plate import validate_plate
+
+_PADDED_DIGITS = re.compile(rb" *(\d{11}) *")
+_PADDED_CRV = re.compile(rb" *[A-Za-z0-9]{11} *")
+_PADDED_PLATE = re.compile(rb" *[A-Za-z]{3}-?\d[A-Za-z\d]\d{2} *")
+
+_CPF_WEIGHTS = ((10, 9, 8, 7, 6, 5, 4, 3, 2), (11, 10, 9, 8, 7, 6, 5, 4, 3, 2))
+_CNH_WEIGHTS = ((9, 8, 7, 6, 5, 4, 3, 2, 1), (1, 2, 3, 4, 5, 6, 7, 8, 9))
+
+
+class Field(NamedTuple):
+    """
+    Field of a fixed-width layout.
+
+    Args:
+        name (str): Field name
+        start (int): Offset of the field in the record (0-based)
+        width (int): Width of the field in bytes
+        kind (str | None): "cpf", "cnh", "crv", "plate", or None for a field
+            that is not validated
+
+    Example:
+        - Field("placa", 0, 8, "plate")
+    """
+
+    name: str
+    start: int
+    width: int
+    kind: str | None = None
+
+
+class FixedWidthRecord(NamedTuple):
+    """
+    Result of validating one record.
+
+    Args:
+        line (int): Line number of the record in the file (1-based, blank
+            lines included); record number for files without line breaks
+        invalid (tuple[str, ...]): Names of the invalid fields
+        record (memoryview): Raw bytes of the record, without line break
+        fields (dict[str, str] | None): Decoded field values without
+            padding, when requested
+    """
+
+    line: int
+    invalid: tuple[str, ...]
+    record: memoryview
+    fields: dict[str, str] | None = None
+
+    @property
+    def valid(self) -> bool:
+        """True if every validated field is valid."""
+        return not self.invalid
+
+
+def _check_digits(digits: bytes, weights: tuple) -> bool:
+    # Os bytes são códigos ASCII: subtrai 48 ("0") de cada dígito
+    for position, factors in enumerate(weights, start=9):
+        total = sum(map(mul, digits, factors)) - 48 * sum(factors)
+        rest = total * 10 % 11
+        if rest == 10:
+            rest = 0
+        if rest != digits[position] - 48:
+            return False
+    return True
+
+
+def _fast_cpf(block: bytes, start: int, end: int) -> bool | None:
+    match = _PADDED_DIGITS.fullmatch(block, start, end)
+    if match is None:
+        return None
+    digits = block[match.start(1) : match.end(1)]
+    if digits == digits[:1] * 11:
+        return False
+    return _check_digits(digits, _CPF_WEIGHTS)
+
+
+def _fast_cnh(block: bytes, start: int, end: int) -> bool | None:
+    match = _PADDED_DIGITS.fullmatch(block, start, end)
+    if match is None:
+        return None
+    return _check_digits(block[match.start(1) : match.end(1)], _CNH_WEIGHTS)
+
+
+def _fast_pattern(pattern: re.Pattern, block: bytes, start: int, end: int):
+    return True if pattern.fullmatch(block, start, end) else None
+
+
+# Verificação rápida em bytes (None quando não decide) e validador normal
+_CHECKS: dict[str, tuple[Callable, Callable[[str], bool]]] = {
+    "cpf": (_fast_cpf, validate_cpf),
+    "cnh": (_fast_cnh, validate_cnh),
+    "crv": (partial(_fast_pattern, _PADDED_CRV), validate_crv),
+    "plate": (partial(_fast_pattern, _PADDED_PLATE), validate_plate),
+}
+
+
+class FixedWidthParser:
+    """
+    Layout-driven validator for fixed-width files.
+
+    Records are either lines (default) or fixed-size chunks without line
+    breaks (`record_length`). Field values are compared without their
+    space padding.
+
+    Args:
+        layout (Sequence[Field]): Fields of each record
+        record_length (int | None): Size of each record for files without
+            line breaks (default: None)
+        encoding (str): Encoding used when fields are decoded (default:
+            "latin-1")
+        block_size (int): Bytes read at a time (default: 1 MiB)
+
+    Example:
+        - parser = FixedWidthParser([
+            Field("cpf", 0, 11, "cpf"),
+            Field("placa", 11, 8, "plate"),
+          ])
+        - parser.check_record(b"11144477735ABC1D23 ")  # Returns: ()
+        - parser.check_record(b"11144477736ABC1D23 ")  # Returns: ("cpf",)
+    """
+
+    def __init__(
+        self,
+        layout: Sequence[Field],
+        record_length: int | None = None,
+        encoding: str = "latin-1",
+        block_size: int = 1 << 20,
+    ) -> None:
+        for field in layout:
+            if field.kind is not None and field.kind not in _CHECKS:
+                raise ValueError(f"Unknown field kind: {field.kind!r}")
+        self.layout = tuple(layout)
+        self.record_length = record_length
+        self.encoding = encoding
+        self.block_size = block_size
+        self._checks = [
+            (field.name, field.start, field.width, *_CHECKS[field.kind])
+            for field in self.layout
+            if field.kind is not None
+        ]
+
+    def _invalid(self, block: bytes, start: int, end: int) -> tuple:
+        invalid = ()
+        for name, offset, width, fast, validator in self._checks:
+            field_start = start + offset
+            field_end = min(field_start + width, end)
+            valid = fast(block, field_start, field_end)
+            if valid is None:
+                text = block[field_start:field_end].decode(self.encoding)
+                valid = validator(text.strip())
+            if not valid:
+                invalid += (name,)
+        return invalid
+
+    def check_record(self, record: bytes) -> tuple[str, ...]:
+        """
+        Validates one record.
+
+        Args:
+            record (bytes): Raw record, without line break
+
+        Returns:
+            tuple[str, ...]: Names of the invalid fields (empty if valid)
+        """
+        return self._invalid(bytes(record), 0, len(record))
+
+    def decode(self, record: bytes) -> dict[str, str]:
+        """
+        Decodes every field of a record, without padding.
+
+        Args:
+            record (bytes): Raw record, without line break
+
+        Returns:
+            dict[str, str]: Field values by name
+        """
+        return {
+            field.name: bytes(record[field.start : field.start + field.width])
+            .decode(self.encoding)
+            .strip()
+            for field in self.layout
+        }
+
+    def _spans(
+        self, source: IO[bytes]
+    ) -> Iterator[tuple[int, bytes, int, int]]:
+        # Gera (número da linha, bloco, início, fim) de cada registro; as
+        # linhas em branco são puladas, mas contam na numeração
+        rest = b""
+        size = self.record_length
+        line = 0
+        for block in iter(partial(source.read, self.block_size), b""):
+            if rest:
+                block = rest + block
+            if size:
+                last = len(block) - len(block) % size
+                for start in range(0, last, size):
+                    line += 1
+                    yield line, block, start, start + size
+                rest = block[last:]
+                continue
+
+            start = 0
+            find = block.find
+            newline = find(b"\n")
+            while newline != -1:
+                line += 1
+                end = newline
+                if end > start and block[end - 1] == 13:  # "\r"
+                    end -= 1
+                if end > start:
+                    yield line, block, start, end
+                start = newline + 1
+                newline = find(b"\n", start)
+            rest = block[start:]
+
+        rest = rest.rstrip(b"\r")
+        if rest:
+            yield line + 1, rest, 0, len(rest)
+
+    def iter_records(
+        self, source: IO[bytes], decode: bool = False
+    ) -> Iterator[FixedWidthRecord]:
+        """
+        Validates every record of a binary stream.
+
+        Args:
+            source (IO[bytes]): File opened in binary mode
+            decode (bool): Also decode the fields of each record (default:
+                False)
+
+        Returns:
+            Iterator[FixedWidthRecord]: One result per record; blank lines
+            are skipped
+        """
+        invalid_fields = self._invalid
+        view = None
+        current = None
+        for line, block, start, end in self._spans(source):
+            if block is not current:
+                current = block
+                view = memoryview(block)
+            record = view[start:end]
+            fields = self.decode(record) if decode else None
+            yield FixedWidthRecord(
+                line, invalid_fields(block, start, end), record, fields
+            )
+
+    def validate_file(
+        self, path: str, rejects_path: str | None = None
+    ) -> dict:
+        """
+        Validates a fixed-width file and reports its rejected records.
+
+        The rejects report has one line per rejected record:
+        "<line>\\t<invalid fields, comma separated>\\t<raw record>".
+
+        Args:
+            path (str): Path of the file
+            rejects_path (str | None): Path of the rejects report; None
+                skips the report (default: None)
+
+        Returns:
+            dict: records, valid, rejected and invalid (number of invalid
+            values per field name)
+
+        Example:
+            - parser.validate_file("detran.txt", "rejeitados.txt")
+              - Returns: {"records": 1000, "valid": 998, "rejected": 2,
+                "invalid": {"cpf": 1, "placa": 1, ...}}
+        """
+        invalid = dict.fromkeys((name for name, *_ in self._checks), 0)
+        records = rejected = 0
+        report = open(rejects_path, "wb") if rejects_path else None
+        try:
+            with open(path, "rb") as source:
+                for result in self.iter_records(source):
+                    records += 1
+                    if result.valid:
+                        continue
+                    rejected += 1
+                    for name in result.invalid:
+                        invalid[name] += 1
+                    if report is not None:
+                        names = ",".join(result.invalid)
+                        report.write(f"{result.line}\t{names}\t".encode())
+                        report.write(result.record)
+                        report.write(b"\n")
+        finally:
+            if report is not None:
+                report.close()
+
+        return {
+            "records": records,
+            "valid": records - rejected,
+            "rejected": rejected,
+            "invalid": invalid,
+        }
+
+
+__all__ = [
+    "Field",
+    "FixedWidthParser",
+    "FixedWidthRecord",
+]
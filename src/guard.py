@@ -0,0 +1,100 @@
+"""
+Guarded Validation Functions
+
+This module provides validators for untrusted input (e.g. a public API).
+The regular validators clean the whole input (`re.sub`, `.upper()`)
+before checking its length, so a 10 MB string sent as a CPF costs O(n)
+time and memory. The guarded validators first compare `len()`, which is
+O(1), with the longest plausible formatted value, and reject longer
+inputs without scanning them.
+
+Inputs up to the maximum length get exactly the result of the regular
+validator.
+"""
+
+from functools import wraps
+from typing import Callable
+
+from .cnh import validate_cnh
+from .cpf import validate_cpf
+from .crv import validate_crv
+from .email import validate_email
+from .phone import validate_brazilian_phone
+from .plate import validate_plate
+
+# Tamanho do maior valor formatado plausível, com folga para espaços e
+# pontuação extras (ex.: " 123.456.789-09 ")
+MAX_CPF_LENGTH = 32
+MAX_CNH_LENGTH = 11
+MAX_CRV_LENGTH = 32
+MAX_PLATE_LENGTH = 16
+MAX_PHONE_LENGTH = 32
+# Limite de um endereço de email no RFC 5321
+MAX_EMAIL_LENGTH = 254
+
+
+def guarded(
+    validator: Callable[[str], bool], max_length: int
+) -> Callable[[str], bool]:
+    """
+    Wraps a validator so that inputs longer than `max_length` are rejected
+    in constant time.
+
+    Args:
+        validator (Callable[[str], bool]): Validator to wrap
+        max_length (int): Longest input passed to the validator
+
+    Returns:
+        Callable[[str], bool]: Guarded validator
+
+    Example:
+        - guarded_cpf = guarded(validate_cpf, 32)
+        - guarded_cpf("111.444.777-35")  # Returns: True
+        - guarded_cpf("1" * 10_000_000)  # Returns: False, without scanning
+    """
+
+    @wraps(validator)
+    def guarded_validator(value: str) -> bool:
+        return len(value) <= max_length and validator(value)
+
+    guarded_validator.__name__ = f"guarded_{validator.__name__}"
+    guarded_validator.__qualname__ = guarded_validator.__name__
+    guarded_validator.max_length = max_length
+    return guarded_validator
+
+
+guarded_validate_cpf = guarded(validate_cpf, MAX_CPF_LENGTH)
+guarded_validate_cnh = guarded(validate_cnh, MAX_CNH_LENGTH)
+guarded_validate_crv = guarded(validate_crv, MAX_CRV_LENGTH)
+guarded_validate_plate = guarded(validate_plate, MAX_PLATE_LENGTH)
+guarded_validate_brazilian_phone = guarded(
+    validate_brazilian_phone, MAX_PHONE_LENGTH
+)
+guarded_validate_email = guarded(validate_email, MAX_EMAIL_LENGTH)
+
+GUARDED_VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "cpf": guarded_validate_cpf,
+    "cnh": guarded_validate_cnh,
+    "crv": guarded_validate_crv,
+    "plate": guarded_validate_plate,
+    "phone": guarded_validate_brazilian_phone,
+    "email": guarded_validate_email,
+}
+
+
+__all__ = [
+    "GUARDED_VALIDATORS",
+    "MAX_CNH_LENGTH",
+    "MAX_CPF_LENGTH",
+    "MAX_CRV_LENGTH",
+    "MAX_EMAIL_LENGTH",
+    "MAX_PHONE_LENGTH",
+    "MAX_PLATE_LENGTH",
+    "guarded",
+    "guarded_validate_brazilian_phone",
+    "guarded_validate_cnh",
+    "guarded_validate_cpf",
+    "guarded_validate_crv",
+    "guarded_validate_email",
+    "guarded_validate_plate",
+]
@@ -0,0 +1,230 @@
+"""
+Column Type Inference Functions
+
+This module detects which document type an unlabeled column holds (CPF,
+CNH, CRV, plate, phone, email or none), for onboarding partner files.
+
+Instead of running every validator over every value, it:
+- samples the column adaptively, in batches that double in size
+- prunes candidate types per value with cheap signatures (length, digit
+  count, "@"), so most values run one or two validators
+- stops as soon as the Wilson score interval of each type's match rate
+  settles the answer
+"""
+
+import csv
+import random
+from itertools import islice
+from math import sqrt
+from statistics import NormalDist
+from typing import Callable, Iterable, Iterator, Sequence
+
+from .cnh import validate_cnh
+from .cpf import validate_cpf
+from .crv import validate_crv
+from .email import validate_email
+from .phone import validate_brazilian_phone
+from .plate import validate_plate
+
+# Ordem de especificidade: quando vários tipos casam, vence o primeiro
+TYPES: tuple[str, ...] = ("cpf", "cnh", "phone", "plate", "crv", "email")
+
+_VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "cpf": validate_cpf,
+    "cnh": validate_cnh,
+    "phone": validate_brazilian_phone,
+    "plate": validate_plate,
+    "crv": validate_crv,
+    "email": validate_email,
+}
+
+_DELETE_DIGITS = str.maketrans("", "", "0123456789")
+
+
+def _candidates(value: str) -> tuple[str, ...]:
+    """Returns the types whose validators can accept `value`."""
+    if not value.isascii():
+        # Dígitos Unicode também contam para os validadores
+        return TYPES
+    if "@" in value:
+        return ("email",)
+
+    length = len(value)
+    digits = length - len(value.translate(_DELETE_DIGITS))
+    candidates = []
+    # Condições necessárias de cada validador
+    if digits == 11:
+        candidates.append("cpf")
+        if length == 11:
+            candidates.append("cnh")
+    if digits in (10, 11):
+        candidates.append("phone")
+    if digits in (3, 4) and length >= 7:
+        candidates.append("plate")
+    if length >= 11:
+        candidates.append("crv")
+    return tuple(candidates)
+
+
+def _wilson(successes: int, total: int, z: float) -> tuple[float, float]:
+    if not total:
+        return 0.0, 1.0
+    rate = successes / total
+    z2 = z * z
+    center = rate + z2 / (2 * total)
+    margin = z * sqrt(rate * (1 - rate) / total + z2 / (4 * total * total))
+    denominator = 1 + z2 / total
+    return (center - margin) / denominator, (center + margin) / denominator
+
+
+def _decide(
+    matches: dict[str, int], total: int, threshold: float, z: float | None
+) -> str | None:
+    # Percorre os tipos do mais específico ao menos específico: o primeiro
+    # acima do limiar vence. Com z, só decide se os intervalos de
+    # confiança já separam cada tipo do limiar.
+    for kind in TYPES:
+        if z is None:
+            if total and matches[kind] / total >= threshold:
+                return kind
+            continue
+        low, high = _wilson(matches[kind], total, z)
+        if low >= threshold:
+            return kind
+        if high >= threshold:
+            return None
+    return "none"
+
+
+def _positions(size: int, count: int, seed: int) -> Iterator[int]:
+    # Fisher-Yates parcial e preguiçoso: sorteia só as posições lidas
+    rng = random.Random(seed)
+    swaps: dict[int, int] = {}
+    for index in range(count):
+        chosen = rng.randrange(index, size)
+        yield swaps.get(chosen, chosen)
+        swaps[chosen] = swaps.get(index, index)
+
+
+def _sample(
+    values: Iterable[str], max_sample: int, seed: int
+) -> Iterable[str]:
+    if isinstance(values, Sequence):
+        # Amostra posições espalhadas pela coluna, não só o começo, para que
+        # a parada antecipada não dependa da ordem das linhas
+        size = len(values)
+        positions = _positions(size, min(size, max_sample), seed)
+        return (values[position] for position in positions)
+    return islice(values, max_sample)
+
+
+def infer_column_type(
+    values: Iterable[str],
+    threshold: float = 0.9,
+    confidence: float = 0.99,
+    min_sample: int = 32,
+    max_sample: int = 1024,
+    seed: int = 0,
+) -> tuple[str, float]:
+    """
+    Infers the document type held by a column of values.
+
+    The result is the most specific type (cpf > cnh > phone > plate > crv >
+    email) whose match rate reaches `threshold`. Blank values are ignored.
+
+    Args:
+        values (Iterable[str]): Values of the column; sequences are sampled
+            at random positions, other iterables from the start
+        threshold (float): Minimum match rate of a type (default: 0.9)
+        confidence (float): Confidence required to stop sampling early
+            (default: 0.99)
+        min_sample (int): Size of the first sample batch (default: 32)
+        max_sample (int): Maximum number of values read (default: 1024)
+        seed (int): Seed of the random sample (default: 0)
+
+    Returns:
+        tuple[str, float]: Type ("cpf", "cnh", "crv", "plate", "phone",
+        "email" or "none") and its match rate in the sample; for "none",
+        the highest match rate among all types
+
+    Example:
+        - infer_column_type(["111.444.777-35", "584.492.260-31"])
+          - Returns: ("cpf", 1.0)
+        - infer_column_type(["(11) 91234-5678", "21987654321"])
+          - Returns: ("phone", 1.0)
+        - infer_column_type(["Maria", "João"])  # Returns: ("none", 0.0)
+    """
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    matches = dict.fromkeys(TYPES, 0)
+    total = 0
+    batch_end = min_sample
+    decision = None
+
+    for value in _sample(values, max_sample, seed):
+        value = value.strip()
+        if not value:
+            continue
+        total += 1
+        for kind in _candidates(value):
+            if _VALIDATORS[kind](value):
+                matches[kind] += 1
+
+        if total == batch_end:
+            decision = _decide(matches, total, threshold, z)
+            if decision is not None:
+                break
+            batch_end *= 2
+
+    if decision is None:
+        decision = _decide(matches, total, threshold, None)
+    if not total:
+        return "none", 0.0
+    if decision == "none":
+        return "none", max(matches.values()) / total
+    return decision, matches[decision] / total
+
+
+def infer_csv_types(
+    path: str,
+    delimiter: str = ",",
+    header: bool = False,
+    max_rows: int = 1024,
+    **options,
+) -> list[tuple[str, float]]:
+    """
+    Infers the document type of every column of a delimited file.
+
+    Only the first `max_rows` rows are read.
+
+    Args:
+        path (str): Path of the file
+        delimiter (str): Field delimiter (default: ",")
+        header (bool): Skip the first row (default: False)
+        max_rows (int): Number of rows read (default: 1024)
+        **options: Options of `infer_column_type`
+
+    Returns:
+        list[tuple[str, float]]: Type and match rate of each column
+
+    Example:
+        - infer_csv_types("parceiro.csv", delimiter=";", header=True)
+          - Returns: [("cpf", 1.0), ("none", 0.0), ("email", 0.98)]
+    """
+    with open(path, encoding="utf-8", newline="") as source:
+        rows = csv.reader(source, delimiter=delimiter)
+        if header:
+            next(rows, None)
+        rows = list(islice(rows, max_rows))
+
+    width = max(map(len, rows), default=0)
+    columns = (
+        [row[index] if index < len(row) else "" for row in rows]
+        for index in range(width)
+    )
+    return [infer_column_type(column, **options) for column in columns]
+
+
+__all__ = [
+    "infer_column_type",
+    "infer_csv_types",
+]
@@ -0,0 +1,428 @@
+"""
+Out-of-core Join and Deduplication Functions
+
+This module joins and deduplicates delimited files (one record per line)
+on a document key, when the files do not fit in memory. Keys are
+normalized before comparison, so a formatted CPF ("111.444.777-35") on one
+side matches a raw one ("11144477735") on the other, and rows whose key
+fails validation are dropped.
+
+Each file goes through an external merge sort: records are sorted in
+memory up to the memory budget, spilled to temporary run files, and
+merged back with a k-way merge (`heapq.merge`). The sorted sides are then
+merge-joined in a single pass.
+
+Usage:
+    python -m src.join inner left.csv right.csv out.csv --kind cpf
+    python -m src.join dedup cpfs.csv unique.csv --kind cpf --memory-mb 512
+"""
+
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator
+
+from .cnh import format_cnh, validate_cnh
+from .cpf import format_cpf, validate_cpf
+from .phone import clean_phone, validate_brazilian_phone
+
+# Normalizador e validador de cada tipo de chave; o validador recebe a
+# chave já normalizada
+KEYS: dict[str, tuple[Callable[[str], str], Callable[[str], bool]]] = {
+    "cpf": (format_cpf, validate_cpf),
+    "cnh": (format_cnh, validate_cnh),
+    "phone": (clean_phone, validate_brazilian_phone),
+}
+
+_HOWS = ("inner", "left", "anti")
+# Custo aproximado de uma tupla (chave, sequência, linha) em uma lista
+_RECORD_OVERHEAD = 104
+_FAN_IN = 256
+
+Record = tuple[str, int, str]
+
+
+def _key_function(kind: str) -> tuple[Callable, Callable]:
+    if kind not in KEYS:
+        raise ValueError(f"Unknown key kind: {kind!r}")
+    return KEYS[kind]
+
+
+def _records(
+    lines: Iterable[str],
+    kind: str,
+    column: int,
+    delimiter: str,
+    stats: dict,
+    prefix: str,
+) -> Iterator[Record]:
+    normalize, validate = _key_function(kind)
+    rows = rejected = 0
+    for sequence, line in enumerate(lines):
+        if not line.endswith("\n"):
+            line += "\n"
+        fields = line.split(delimiter, column + 1)
+        field = fields[column] if column < len(fields) else ""
+        key = normalize(field.strip().strip('"'))
+        rows += 1
+        if validate(key):
+            yield key, sequence, line
+        else:
+            rejected += 1
+    stats[f"{prefix}_rows"] = rows
+    stats[f"{prefix}_rejected"] = rejected
+
+
+def _write_run(records: list[Record], directory: str) -> str:
+    descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with open(descriptor, "w", encoding="utf-8", newline="\n") as run:
+        run.writelines(
+            f"{key}\t{sequence}\t{line}" for key, sequence, line in records
+        )
+    return path
+
+
+def _read_run(path: str) -> Iterator[Record]:
+    with open(path, encoding="utf-8", newline="\n") as run:
+        for raw in run:
+            key, sequence, line = raw.split("\t", 2)
+            yield key, int(sequence), line
+    os.unlink(path)
+
+
+def _merge_runs(paths: list[str], directory: str) -> Iterator[Record]:
+    # Limita o número de arquivos abertos ao mesmo tempo: junta grupos de
+    # runs em runs maiores até caberem em um único merge
+    while len(paths) > _FAN_IN:
+        merged = []
+        for start in range(0, len(paths), _FAN_IN):
+            group = paths[start : start + _FAN_IN]
+            records = heapq.merge(*map(_read_run, group))
+            descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+            with open(descriptor, "w", encoding="utf-8", newline="\n") as run:
+                run.writelines(
+                    f"{key}\t{sequence}\t{line}"
+                    for key, sequence, line in records
+                )
+            merged.append(path)
+        paths = merged
+    return heapq.merge(*map(_read_run, paths))
+
+
+def _external_sort(
+    records: Iterable[Record], memory: int, directory: str, stats: dict
+) -> Iterator[Record]:
+    buffer: list[Record] = []
+    used = 0
+    runs: list[str] = []
+    sizeof = sys.getsizeof
+
+    for record in records:
+        buffer.append(record)
+        used += sizeof(record[0]) + sizeof(record[2]) + _RECORD_OVERHEAD
+        if used >= memory:
+            buffer.sort()
+            runs.append(_write_run(buffer, directory))
+            buffer = []
+            used = 0
+
+    stats["runs"] = stats.get("runs", 0) + len(runs)
+    buffer.sort()
+    if not runs:
+        # Cabe na memória: nenhum arquivo temporário
+        return iter(buffer)
+    if buffer:
+        runs.append(_write_run(buffer, directory))
+    return _merge_runs(runs, directory)
+
+
+def _sorted_file(
+    path: str,
+    kind: str,
+    column: int,
+    delimiter: str,
+    header: bool,
+    memory: int,
+    directory: str,
+    stats: dict,
+    prefix: str,
+) -> tuple[str, Iterator[Record]]:
+    source = open(path, encoding="utf-8", newline="\n")
+    with source:
+        first = source.readline() if header else ""
+        records = _records(source, kind, column, delimiter, stats, prefix)
+        return first, _external_sort(records, memory, directory, stats)
+
+
+def _buffer_group(
+    lines: Iterator[str], memory: int, directory: str
+) -> tuple[list[str], str | None]:
+    # Guarda as linhas de uma chave até o orçamento de memória e grava o
+    # resto em disco, para que uma chave muito repetida não estoure o limite
+    buffered = []
+    used = 0
+    for line in lines:
+        buffered.append(line)
+        used += sys.getsizeof(line) + 8
+        if used >= memory:
+            break
+    else:
+        return buffered, None
+
+    descriptor, path = tempfile.mkstemp(suffix=".group", dir=directory)
+    with open(descriptor, "w", encoding="utf-8", newline="\n") as spill:
+        spill.writelines(lines)
+    return buffered, path
+
+
+def _group_lines(buffered: list[str], path: str | None) -> Iterator[str]:
+    yield from buffered
+    if path is not None:
+        with open(path, encoding="utf-8", newline="\n") as spill:
+            yield from spill
+
+
+def join_files(
+    left: str,
+    right: str,
+    output: str,
+    kind: str,
+    how: str = "inner",
+    left_column: int = 0,
+    right_column: int = 0,
+    delimiter: str = ",",
+    header: bool = False,
+    memory: int = 256 << 20,
+    tmp_dir: str | None = None,
+) -> dict:
+    """
+    Joins two delimited files on a normalized document key.
+
+    Output rows are the left row followed by the right row, ordered by
+    key and then by position in the input. Left rows without a match get
+    empty right fields ("left") and only they are written by "anti".
+
+    Args:
+        left (str): Path of the left file
+        right (str): Path of the right file
+        output (str): Path of the output file
+        kind (str): Key type: "cpf", "cnh" or "phone"
+        how (str): "inner", "left" or "anti" (default: "inner")
+        left_column (int): Index of the key field in the left file
+        right_column (int): Index of the key field in the right file
+        delimiter (str): Field delimiter (default: ",")
+        header (bool): Whether both files start with a header line
+        memory (int): Memory budget in bytes for the in-memory sort, split
+            between the two files; the right rows of a single key are also
+            kept within half of it (default: 256 MiB)
+        tmp_dir (str | None): Directory of the spill files (default: system
+            temporary directory)
+
+    Returns:
+        dict: left_rows, left_rejected, right_rows, right_rejected (rows
+        whose key failed validation), runs (spill files), group_spills
+        (right keys whose rows exceeded the memory budget and were spilled
+        to disk) and output_rows
+
+    Example:
+        - join_files("clientes.csv", "pedidos.csv", "out.csv", "cpf")
+          - Returns: {"left_rows": 3, "left_rejected": 1, ...}
+    """
+    if how not in _HOWS:
+        raise ValueError(f"Unknown join: {how!r}")
+    _key_function(kind)
+
+    with open(right, encoding="utf-8", newline="\n") as source:
+        right_width = len(source.readline().split(delimiter))
+    padding = delimiter * right_width + "\n"
+
+    stats: dict = {"runs": 0, "group_spills": 0, "output_rows": 0}
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        left_header, left_records = _sorted_file(
+            left,
+            kind,
+            left_column,
+            delimiter,
+            header,
+            memory // 2,
+            directory,
+            stats,
+            "left",
+        )
+        right_header, right_records = _sorted_file(
+            right,
+            kind,
+            right_column,
+            delimiter,
+            header,
+            memory // 2,
+            directory,
+            stats,
+            "right",
+        )
+
+        with open(output, "w", encoding="utf-8", newline="\n") as target:
+            write = target.write
+            if header:
+                if how == "anti":
+                    write(left_header)
+                else:
+                    write(left_header.rstrip("\r\n") + delimiter)
+                    write(right_header)
+
+            rows = 0
+            right_groups = groupby(right_records, itemgetter(0))
+            current = next(right_groups, None)
+            for key, group in groupby(left_records, itemgetter(0)):
+                lines = (line for _, _, line in group)
+                while current is not None and current[0] < key:
+                    current = next(right_groups, None)
+
+                matched = current is not None and current[0] == key
+                if how == "anti":
+                    if not matched:
+                        for line in lines:
+                            write(line)
+                            rows += 1
+                elif matched:
+                    right_lines = (line for _, _, line in current[1])
+                    buffered, path = _buffer_group(
+                        right_lines, memory // 2, directory
+                    )
+                    if path is not None:
+                        stats["group_spills"] += 1
+                    for line in lines:
+                        line = line.rstrip("\r\n") + delimiter
+                        for match in _group_lines(buffered, path):
+                            write(line + match)
+                            rows += 1
+                    if path is not None:
+                        os.unlink(path)
+                elif how == "left":
+                    for line in lines:
+                        write(line.rstrip("\r\n") + padding)
+                        rows += 1
+                if matched:
+                    current = next(right_groups, None)
+
+    stats["output_rows"] = rows
+    return stats
+
+
+def dedup_file(
+    path: str,
+    output: str,
+    kind: str,
+    column: int = 0,
+    delimiter: str = ",",
+    header: bool = False,
+    memory: int = 256 << 20,
+    tmp_dir: str | None = None,
+) -> dict:
+    """
+    Keeps the first row of each normalized document key.
+
+    Args:
+        path (str): Path of the input file
+        output (str): Path of the output file, ordered by key
+        kind (str): Key type: "cpf", "cnh" or "phone"
+        column (int): Index of the key field (default: 0)
+        delimiter (str): Field delimiter (default: ",")
+        header (bool): Whether the file starts with a header line
+        memory (int): Memory budget in bytes for the in-memory sort
+            (default: 256 MiB)
+        tmp_dir (str | None): Directory of the spill files (default: system
+            temporary directory)
+
+    Returns:
+        dict: rows, rejected (rows whose key failed validation), runs
+        (spill files) and output_rows
+
+    Example:
+        - dedup_file("cpfs.csv", "unique.csv", "cpf")
+          - Returns: {"rows": 4, "rejected": 1, "runs": 0, "output_rows": 2}
+    """
+    _key_function(kind)
+    stats: dict = {"runs": 0}
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        first, records = _sorted_file(
+            path,
+            kind,
+            column,
+            delimiter,
+            header,
+            memory,
+            directory,
+            stats,
+            "input",
+        )
+        with open(output, "w", encoding="utf-8", newline="\n") as target:
+            target.write(first)
+            rows = 0
+            for _, group in groupby(records, itemgetter(0)):
+                target.write(next(group)[2])
+                rows += 1
+
+    return {
+        "rows": stats["input_rows"],
+        "rejected": stats["input_rejected"],
+        "runs": stats["runs"],
+        "output_rows": rows,
+    }
+
+
+__all__ = [
+    "KEYS",
+    "dedup_file",
+    "join_files",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Join or deduplicate files on a document key"
+    )
+    parser.add_argument("how", choices=(*_HOWS, "dedup"))
+    parser.add_argument("paths", nargs="+", help="inputs followed by output")
+    parser.add_argument("--kind", choices=tuple(KEYS), default="cpf")
+    parser.add_argument("--left-column", type=int, default=0)
+    parser.add_argument("--right-column", type=int, default=0)
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--header", action="store_true")
+    parser.add_argument("--memory-mb", type=int, default=256)
+    parser.add_argument("--tmp-dir", default=None)
+    args = parser.parse_args()
+
+    options = {
+        "delimiter": args.delimiter,
+        "header": args.header,
+        "memory": args.memory_mb << 20,
+        "tmp_dir": args.tmp_dir,
+    }
+    if args.how == "dedup":
+        if len(args.paths) != 2:
+            parser.error("dedup expects an input and an output path")
+        stats = dedup_file(
+            *args.paths, args.kind, column=args.left_column, **options
+        )
+    else:
+        if len(args.paths) != 3:
+            parser.error("joins expect left, right and output paths")
+        stats = join_files(
+            *args.paths,
+            args.kind,
+            how=args.how,
+            left_column=args.left_column,
+            right_column=args.right_column,
+            **options,
+        )
+    for name, value in stats.items():
+        print(f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+CPF Region Partitioning Functions
+
+This module splits bulk CPF files by the fiscal region of each CPF (its
+9th digit, see `cpf_region`), so each worker of a sharded job handles one
+coherent partition. Records are streamed in a single pass: each line is
+validated and written to one of ten region outputs, and invalid CPFs go to
+an optional rejects output. Output files are opened once, with large
+buffers, never per record.
+
+Usage:
+    python -m src.partition cpfs.csv output/ --column 0 --header
+"""
+
+import argparse
+import os
+import re
+from typing import IO, Iterable, Sequence
+
+from .cpf import cpf_digits_failure
+
+_NON_DIGIT = re.compile(r"\D")
+_REGIONS = 10
+# Tabela para bytes.translate: apaga tudo que não for dígito ASCII
+_NON_DIGIT_BYTES = bytes(set(range(256)) - set(b"0123456789"))
+_FIELD_STRIP = b' \t\r\n"'
+
+
+def _record_region(field: bytes) -> int:
+    if field.isascii():
+        # Caminho rápido: remove a pontuação sem decodificar nem usar regex
+        digits = field.translate(None, _NON_DIGIT_BYTES)
+        if len(digits) != 11:
+            return -1
+        digits = digits.decode("ascii")
+    else:
+        digits = _NON_DIGIT.sub("", field.decode("utf-8", "replace"))
+    if cpf_digits_failure(digits):
+        return -1
+    return int(digits[8])
+
+
+def partition_cpfs(
+    records: Iterable[bytes],
+    targets: Sequence[IO[bytes]],
+    rejects: IO[bytes] | None = None,
+    column: int | None = None,
+    delimiter: bytes = b",",
+    header: bool = False,
+) -> tuple[list[int], int]:
+    """
+    Routes each record to the output of its CPF fiscal region.
+
+    Args:
+        records (Iterable[bytes]): Lines of the input (e.g. a file opened in
+            binary mode)
+        targets (Sequence[IO[bytes]]): Ten binary outputs, indexed by region
+        rejects (IO[bytes] | None): Output for records with an invalid CPF;
+            None discards them
+        column (int | None): Index of the CPF field in a delimited record;
+            None uses the whole record
+        delimiter (bytes): Field delimiter (default: b",")
+        header (bool): Copy the first record to every output (default: False)
+
+    Returns:
+        tuple[list[int], int]: Records written per region, and number of
+        rejected records
+
+    Example:
+        - partition_cpfs([b"111.444.777-35\\n", b"123\\n"], targets)
+          - Returns: ([0, 0, 0, 0, 0, 0, 0, 1, 0, 0], 1)
+    """
+    if len(targets) != _REGIONS:
+        raise ValueError(f"Expected {_REGIONS} targets, got {len(targets)}")
+
+    writers = [target.write for target in targets]
+    reject = rejects.write if rejects is not None else None
+    counts = [0] * _REGIONS
+    rejected = 0
+    records = iter(records)
+
+    if header:
+        first = next(records, b"")
+        if first:
+            for write in writers:
+                write(first)
+            if reject:
+                reject(first)
+
+    for record in records:
+        if not record.endswith(b"\n"):
+            record += b"\n"
+        if column is None:
+            field = record
+        else:
+            fields = record.split(delimiter, column + 1)
+            field = fields[column] if column < len(fields) else b""
+        region = _record_region(field.strip(_FIELD_STRIP))
+
+        if region < 0:
+            rejected += 1
+            if reject:
+                reject(record)
+        else:
+            counts[region] += 1
+            writers[region](record)
+
+    return counts, rejected
+
+
+def partition_cpf_file(
+    path: str,
+    output_dir: str,
+    column: int | None = None,
+    delimiter: str = ",",
+    header: bool = False,
+    buffer_size: int = 1 << 20,
+) -> tuple[list[int], int]:
+    """
+    Splits a file of CPF records into one file per fiscal region.
+
+    Writes "region_<d><ext>" for each region d (0-9) and "rejects<ext>"
+    in `output_dir`, where <ext> is the extension of the input file.
+
+    Args:
+        path (str): Input file with one record per line
+        output_dir (str): Directory of the output files (created if missing)
+        column (int | None): Index of the CPF field in a delimited record;
+            None uses the whole line
+        delimiter (str): Field delimiter (default: ",")
+        header (bool): Copy the first line to every output (default: False)
+        buffer_size (int): Buffer size of the input and of each output, in
+            bytes (default: 1 MiB)
+
+    Returns:
+        tuple[list[int], int]: Records written per region, and number of
+        rejected records
+
+    Example:
+        - partition_cpf_file("cpfs.csv", "out", column=0, header=True)
+          - Returns: ([120, 98, ...], 3)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    extension = os.path.splitext(path)[1]
+    names = [f"region_{region}{extension}" for region in range(_REGIONS)]
+    names.append(f"rejects{extension}")
+
+    outputs = []
+    try:
+        for name in names:
+            outputs.append(
+                open(os.path.join(output_dir, name), "wb", buffer_size)
+            )
+        with open(path, "rb", buffer_size) as source:
+            return partition_cpfs(
+                source,
+                outputs[:_REGIONS],
+                outputs[_REGIONS],
+                column=column,
+                delimiter=delimiter.encode("utf-8"),
+                header=header,
+            )
+    finally:
+        for output in outputs:
+            output.close()
+
+
+__all__ = [
+    "partition_cpf_file",
+    "partition_cpfs",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Split CPF records by fiscal region"
+    )
+    parser.add_argument("path")
+    parser.add_argument("output_dir")
+    parser.add_argument("--column", type=int, default=None)
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--header", action="store_true")
+    args = parser.parse_args()
+
+    counts, rejected = partition_cpf_file(
+        args.path,
+        args.output_dir,
+        column=args.column,
+        delimiter=args.delimiter,
+        header=args.header,
+    )
+    for region, count in enumerate(counts):
+        print(f"region {region}: {count}")
+    print(f"rejected: {rejected}")
+
+
+if __name__ == "__main__":
+    main()
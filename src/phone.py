@@ -5,6 +5,83 @@ This module provides functions to validate and format Brazilian phone numbers.
 """
 
 import re
+from typing import Iterable
+
+from .result import FailureCode, ValidationResult
+
+_NON_DIGIT = re.compile(r"\D")
+
+_VALID_DDDS = frozenset(
+    {
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",  # São Paulo
+        "21",
+        "22",
+        "24",  # Rio de Janeiro
+        "27",
+        "28",  # Espírito Santo
+        "31",
+        "32",
+        "33",
+        "34",
+        "35",
+        "37",
+        "38",  # Minas Gerais
+        "41",
+        "42",
+        "43",
+        "44",
+        "45",
+        "46",  # Paraná
+        "47",
+        "48",
+        "49",  # Santa Catarina
+        "51",
+        "53",
+        "54",
+        "55",  # Rio Grande do Sul
+        "61",  # Distrito Federal
+        "62",
+        "64",  # Goiás
+        "63",  # Tocantins
+        "65",
+        "66",  # Mato Grosso
+        "67",  # Mato Grosso do Sul
+        "68",  # Acre
+        "69",  # Rondônia
+        "71",
+        "73",
+        "74",
+        "75",
+        "77",  # Bahia
+        "79",  # Sergipe
+        "81",
+        "87",  # Pernambuco
+        "82",  # Alagoas
+        "83",  # Paraíba
+        "84",  # Rio Grande do Norte
+        "85",
+        "88",  # Ceará
+        "86",
+        "89",  # Piauí
+        "91",
+        "93",
+        "94",  # Pará
+        "92",
+        "97",  # Amazonas
+        "95",  # Roraima
+        "96",  # Amapá
+        "98",
+        "99",  # Maranhão
+    }
+)
 
 
 def format_brazilian_phone(phone: str) -> str:
@@ -24,7 +101,7 @@ def format_brazilian_phone(phone: str) -> str:
         - format_brazilian_phone("1234")  # Returns: "12 934-1234"
     """
     # Remove tudo que não for número
-    digits = re.sub(r"\D", "", phone)[:11]  # máximo 11 dígitos
+    digits = _NON_DIGIT.sub("", phone)[:11]  # máximo 11 dígitos
 
     # Se tiver menos que 2 dígitos, não tenta formatar ainda
     if len(digits) < 2:
@@ -68,9 +145,49 @@ def validate_brazilian_phone(phone: str) -> bool:
         - validate_brazilian_phone("(21) 98765-4321")  # Returns: True
         - validate_brazilian_phone("1234")  # Returns: False
     """
-    digits = re.sub(r"\D", "", phone)
+    digits = _NON_DIGIT.sub("", phone)
     # Accept both 10 digits (will add 9) and 11 digits
-    return len(digits) in [10, 11]
+    return len(digits) in (10, 11)
+
+
+def _normalize_phone(phone: str) -> str:
+    # Mantém o número como está: fixo com 8 dígitos, celular com 9
+    digits = _NON_DIGIT.sub("", phone)
+    return f"({digits[:2]}) {digits[2:-4]}-{digits[-4:]}"
+
+
+def check_brazilian_phone(
+    phone: str, check_ddd: bool = False
+) -> ValidationResult:
+    """
+    Validates a Brazilian phone number and reports why it failed.
+
+    Args:
+        phone (str): Phone number to validate
+        check_ddd (bool): Also reject numbers with an unknown DDD
+
+    Returns:
+        ValidationResult: Result that is truthy if the phone is valid, with
+        the failure `code`, and lazily built `message` and `normalized`
+        ((XX) XXXXX-XXXX, or (XX) XXXX-XXXX for 10 digits) attributes
+
+    Example:
+        - bool(check_brazilian_phone("11912345678"))  # Returns: True
+        - check_brazilian_phone("2134567890").normalized
+          - Returns: "(21) 3456-7890"
+        - check_brazilian_phone("1234").code
+          - Returns: FailureCode.INVALID_LENGTH
+        - check_brazilian_phone("00912345678", check_ddd=True).code
+          - Returns: FailureCode.INVALID_DDD
+    """
+    digits = _NON_DIGIT.sub("", phone)
+    if len(digits) not in (10, 11):
+        code = FailureCode.INVALID_LENGTH
+    elif check_ddd and digits[:2] not in _VALID_DDDS:
+        code = FailureCode.INVALID_DDD
+    else:
+        code = FailureCode.OK
+    return ValidationResult("Phone", code, phone, _normalize_phone)
 
 
 def clean_phone(phone: str) -> str:
@@ -88,7 +205,7 @@ def clean_phone(phone: str) -> str:
         - clean_phone("21 98765 4321")  # Returns: "21987654321"
         - clean_phone("1234")  # Returns: "1234"
     """
-    return re.sub(r"\D", "", phone)
+    return _NON_DIGIT.sub("", phone)
 
 
 def is_valid_ddd(ddd: str) -> bool:
@@ -106,81 +223,118 @@ def is_valid_ddd(ddd: str) -> bool:
         - is_valid_ddd("99")  # Returns: True
         - is_valid_ddd("00")  # Returns: False
     """
-    valid_ddds = {
-        "11",
-        "12",
-        "13",
-        "14",
-        "15",
-        "16",
-        "17",
-        "18",
-        "19",  # São Paulo
-        "21",
-        "22",
-        "24",  # Rio de Janeiro
-        "27",
-        "28",  # Espírito Santo
-        "31",
-        "32",
-        "33",
-        "34",
-        "35",
-        "37",
-        "38",  # Minas Gerais
-        "41",
-        "42",
-        "43",
-        "44",
-        "45",
-        "46",  # Paraná
-        "47",
-        "48",
-        "49",  # Santa Catarina
-        "51",
-        "53",
-        "54",
-        "55",  # Rio Grande do Sul
-        "61",  # Distrito Federal
-        "62",
-        "64",  # Goiás
-        "63",  # Tocantins
-        "65",
-        "66",  # Mato Grosso
-        "67",  # Mato Grosso do Sul
-        "68",  # Acre
-        "69",  # Rondônia
-        "71",
-        "73",
-        "74",
-        "75",
-        "77",  # Bahia
-        "79",  # Sergipe
-        "81",
-        "87",  # Pernambuco
-        "82",  # Alagoas
-        "83",  # Paraíba
-        "84",  # Rio Grande do Norte
-        "85",
-        "88",  # Ceará
-        "86",
-        "89",  # Piauí
-        "91",
-        "93",
-        "94",  # Pará
-        "92",
-        "97",  # Amazonas
-        "95",  # Roraima
-        "96",  # Amapá
-        "98",
-        "99",  # Maranhão
-    }
-    return ddd in valid_ddds
+    return ddd in _VALID_DDDS
+
+
+def format_e164_phone(phone: str) -> str:
+    """
+    Normalizes a Brazilian phone number to the E.164 format (+55DDXXXXXXXXX).
+
+    Accepts an optional country code ("+55", "55" or "055"), a national
+    trunk prefix with carrier selection code ("0 21 11 ...") and both
+    landline and mobile numbers. Landlines (first digit 2-5) are kept with
+    8 digits; 8-digit mobiles (first digit 6-9) get the leading "9".
+
+    Args:
+        phone (str): Phone number to normalize
+
+    Returns:
+        str: Phone number in E.164 format, or empty string if invalid
+
+    Example:
+        - format_e164_phone("(11) 91234-5678")  # Returns: "+5511912345678"
+        - format_e164_phone("+55 21 3456-7890")  # Returns: "+552134567890"
+        - format_e164_phone("021 11 91234-5678")  # Returns: "+5511912345678"
+        - format_e164_phone("1234")  # Returns: ""
+    """
+    digits = _NON_DIGIT.sub("", phone)
+    length = len(digits)
+
+    if phone.lstrip().startswith("+"):
+        # Número internacional: só aceitamos o código do Brasil
+        if not digits.startswith("55"):
+            return ""
+        digits = digits[2:]
+    elif digits.startswith("0"):
+        # Prefixo nacional "0", seguido de operadora (ou "55") opcional
+        digits = digits[1:]
+        if len(digits) in (12, 13):
+            digits = digits[2:]
+    elif length in (12, 13) and digits.startswith("55"):
+        digits = digits[2:]
+
+    length = len(digits)
+    if length not in (10, 11) or not is_valid_ddd(digits[:2]):
+        return ""
+
+    first = digits[2]
+    if length == 11:
+        # Celulares com 9 dígitos sempre começam com "9"
+        if first != "9":
+            return ""
+    elif first in "6789":
+        # Celular antigo com 8 dígitos: adiciona o nono dígito
+        digits = f"{digits[:2]}9{digits[2:]}"
+    elif first not in "2345":
+        return ""
+
+    return "+55" + digits
+
+
+def phone_to_key(phone: str) -> int:
+    """
+    Converts a Brazilian phone number to a packed integer key.
+
+    The key is the E.164 number without the "+" sign, so it fits in a
+    64-bit integer and can be used to deduplicate recipient lists.
+
+    Args:
+        phone (str): Phone number to convert
+
+    Returns:
+        int: Integer key (e.g. 5511912345678), or 0 if invalid
+
+    Example:
+        - phone_to_key("(11) 91234-5678")  # Returns: 5511912345678
+        - phone_to_key("+55 11 91234-5678")  # Returns: 5511912345678
+        - phone_to_key("1234")  # Returns: 0
+    """
+    e164 = format_e164_phone(phone)
+    return int(e164[1:]) if e164 else 0
+
+
+def format_e164_phones(
+    phones: Iterable[str], as_key: bool = False
+) -> list[str] | list[int]:
+    """
+    Normalizes many Brazilian phone numbers at once.
+
+    Args:
+        phones (Iterable[str]): Phone numbers to normalize
+        as_key (bool): Return integer keys instead of E.164 strings
+
+    Returns:
+        list[str] | list[int]: Normalized numbers in input order, with ""
+        (or 0 when `as_key` is True) for invalid entries
+
+    Example:
+        - format_e164_phones(["11912345678", "1234"])
+          - Returns: ["+5511912345678", ""]
+        - format_e164_phones(["11912345678", "1234"], as_key=True)
+          - Returns: [5511912345678, 0]
+    """
+    if as_key:
+        return [phone_to_key(phone) for phone in phones]
+    return [format_e164_phone(phone) for phone in phones]
 
 
 __all__ = [
     "format_brazilian_phone",
+    "format_e164_phone",
+    "format_e164_phones",
+    "phone_to_key",
     "validate_brazilian_phone",
+    "check_brazilian_phone",
     "clean_phone",
     "is_valid_ddd",
 ]
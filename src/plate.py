@@ -7,6 +7,14 @@ This module provides functions to validate Brazilian vehicle plates
 
 import re
 
+from .result import FailureCode, ValidationResult
+
+_OLD_PATTERN = re.compile(r"^[A-Z]{3}\d{4}$")
+_MERCOSUL_PATTERN = re.compile(r"^[A-Z]{3}\d[A-Z]\d{2}$")
+# União dos dois padrões: AAA0000 ou AAA0A00
+_PLATE_PATTERN = re.compile(r"^[A-Z]{3}\d[A-Z\d]\d{2}$")
+_SEPARATORS = re.compile(r"[\s\-]")
+
 
 def validate_plate(plate: str) -> bool:
     """
@@ -27,17 +35,38 @@ def validate_plate(plate: str) -> bool:
         - validate_plate("A1B2C3D")  # Returns: False
     """
     # Remove espaços e hífens, converte para maiúsculo
-    limpo = re.sub(r"[\s\-]", "", plate).upper()
+    limpo = _SEPARATORS.sub("", plate).upper()
+
+    # Padrão antigo (AAA0000) ou Mercosul (AAA0A00)
+    return _PLATE_PATTERN.match(limpo) is not None
 
-    # Padrão antigo (AAA0000)
-    old_pattern = r"^[A-Z]{3}\d{4}$"
 
-    # Padrão Mercosul (AAA0A00)
-    mercosul_pattern = r"^[A-Z]{3}\d[A-Z]\d{2}$"
+def check_plate(plate: str) -> ValidationResult:
+    """
+    Validates a Brazilian vehicle plate and reports why it failed.
 
-    return bool(re.match(old_pattern, limpo)) or bool(
-        re.match(mercosul_pattern, limpo)
-    )
+    Args:
+        plate (str): Plate string to validate
+
+    Returns:
+        ValidationResult: Result that is truthy if the plate is valid, with
+        the failure `code`, and lazily built `message` and `normalized`
+        attributes
+
+    Example:
+        - bool(check_plate("abc-1234"))  # Returns: True
+        - check_plate("abc-1234").normalized  # Returns: "ABC1234"
+        - check_plate("ABC123").code  # Returns: FailureCode.INVALID_LENGTH
+        - check_plate("A1B2C3D").code  # Returns: FailureCode.INVALID_FORMAT
+    """
+    limpo = _SEPARATORS.sub("", plate).upper()
+    if _PLATE_PATTERN.match(limpo) is not None:
+        code = FailureCode.OK
+    elif len(limpo) != 7:
+        code = FailureCode.INVALID_LENGTH
+    else:
+        code = FailureCode.INVALID_FORMAT
+    return ValidationResult("Plate", code, plate, format_plate)
 
 
 def format_plate(plate: str, format_type: str = "clean") -> str:
@@ -57,14 +86,14 @@ def format_plate(plate: str, format_type: str = "clean") -> str:
         - format_plate("ABC1D23", "dash")  # Returns: "ABC-1D23"
     """
     # Remove espaços e hífens, converte para maiúsculo
-    clean_plate = re.sub(r"[\s\-]", "", plate).upper()
+    clean_plate = _SEPARATORS.sub("", plate).upper()
 
     if format_type == "dash" and len(clean_plate) >= 7:
         # Adiciona hífen no formato antigo (AAA-0000)
-        if re.match(r"^[A-Z]{3}\d{4}$", clean_plate):
+        if _OLD_PATTERN.match(clean_plate):
             return f"{clean_plate[:3]}-{clean_plate[3:]}"
         # Para Mercosul, também pode usar hífen
-        elif re.match(r"^[A-Z]{3}\d[A-Z]\d{2}$", clean_plate):
+        elif _MERCOSUL_PATTERN.match(clean_plate):
             return f"{clean_plate[:3]}-{clean_plate[3:]}"
 
     return clean_plate
@@ -84,8 +113,8 @@ def is_old_format_plate(plate: str) -> bool:
         - is_old_format_plate("ABC-1234")  # Returns: True
         - is_old_format_plate("ABC1D23")  # Returns: False
     """
-    limpo = re.sub(r"[\s\-]", "", plate).upper()
-    return bool(re.match(r"^[A-Z]{3}\d{4}$", limpo))
+    limpo = _SEPARATORS.sub("", plate).upper()
+    return _OLD_PATTERN.match(limpo) is not None
 
 
 def is_mercosul_format_plate(plate: str) -> bool:
@@ -103,8 +132,8 @@ def is_mercosul_format_plate(plate: str) -> bool:
         - is_mercosul_format_plate("ABC-1234")  # Returns: False
         - is_mercosul_format_plate("ABC1234")  # Returns: False
     """
-    limpo = re.sub(r"[\s\-]", "", plate).upper()
-    return bool(re.match(r"^[A-Z]{3}\d[A-Z]\d{2}$", limpo))
+    limpo = _SEPARATORS.sub("", plate).upper()
+    return _MERCOSUL_PATTERN.match(limpo) is not None
 
 
 __all__ = [
@@ -112,4 +141,5 @@ __all__ = [
     "format_plate",
     "is_old_format_plate",
     "is_mercosul_format_plate",
+    "check_plate",
 ]
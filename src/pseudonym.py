@@ -0,0 +1,213 @@
+"""
+CPF and Phone Pseudonymization Functions
+
+This module provides keyed tokenization of CPFs and phone numbers for
+analytics. Values are validated and normalized before hashing, so
+formatted and unformatted inputs of the same document map to the same
+token.
+"""
+
+import hmac
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Iterable
+
+from .cpf import cpf_check_digits, cpf_digits_failure, format_cpf
+from .phone import format_e164_phone
+
+_NON_DIGIT = re.compile(r"\D")
+_KINDS = ("cpf", "phone", "cpf_fpe")
+_FEISTEL_ROUNDS = 10
+# Base do CPF (9 dígitos) dividida em 4 + 5 dígitos para a rede de Feistel
+_LEFT_DIGITS = 4
+_RIGHT_DIGITS = 5
+
+
+class Tokenizer:
+    """
+    Keyed tokenizer for CPFs and phone numbers.
+
+    Tokens are an HMAC of the normalized value (`format_cpf` for CPFs and
+    `format_e164_phone` for phones). The keyed hasher is built once and
+    copied per value, so the key schedule is not recomputed.
+
+    Args:
+        key (bytes): Secret key
+        digestmod (str): Hash used by the HMAC (default: "sha256")
+        length (int): Number of hex characters in each token (default: 32)
+        cache_size (int): Size of an LRU cache of recent tokens; 0 disables
+            it (default: 0)
+
+    Example:
+        - tokenizer = Tokenizer(b"secret")
+        - tokenizer.tokenize_cpf("111.444.777-35")
+          - Returns: same token as tokenizer.tokenize_cpf("11144477735")
+        - tokenizer.tokenize_cpf("123")  # Returns: ""
+        - validate_cpf(tokenizer.pseudonymize_cpf("111.444.777-35"))
+          - Returns: True
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        digestmod: str = "sha256",
+        length: int = 32,
+        cache_size: int = 0,
+    ) -> None:
+        self.key = key
+        self.digestmod = digestmod
+        self.length = length
+        self.cache_size = cache_size
+        self._hasher = hmac.new(key, digestmod=digestmod)
+
+        self.tokenize_cpf = self._cached(self._tokenize_cpf)
+        self.tokenize_phone = self._cached(self._tokenize_phone)
+        self.pseudonymize_cpf = self._cached(self._pseudonymize_cpf)
+
+    def _cached(self, function: Callable[[str], str]) -> Callable[[str], str]:
+        if self.cache_size:
+            return lru_cache(maxsize=self.cache_size)(function)
+        return function
+
+    def _digest(self, message: bytes) -> bytes:
+        hasher = self._hasher.copy()
+        hasher.update(message)
+        return hasher.digest()
+
+    def _token(self, prefix: bytes, value: str) -> str:
+        digest = self._digest(prefix + value.encode("utf-8"))
+        return digest.hex()[: self.length]
+
+    def _tokenize_cpf(self, cpf: str) -> str:
+        """
+        Returns the token of a CPF, or empty string if the CPF is invalid.
+        """
+        # Limpa os dígitos uma única vez para validar e formatar
+        digits = _NON_DIGIT.sub("", cpf)
+        if cpf_digits_failure(digits):
+            return ""
+        return self._token(b"cpf:", format_cpf(digits))
+
+    def _tokenize_phone(self, phone: str) -> str:
+        """
+        Returns the token of a phone, or empty string if it is invalid.
+        """
+        e164 = format_e164_phone(phone)
+        if not e164:
+            return ""
+        return self._token(b"phone:", e164)
+
+    def _round(self, index: int, value: int, modulus: int) -> int:
+        digest = self._digest(b"fpe:%d:%d" % (index, value))
+        return int.from_bytes(digest[:8], "big") % modulus
+
+    def _encrypt_base(self, base: int) -> int:
+        # Rede de Feistel com aritmética modular (como no FF1): é uma
+        # permutação dos 10**9 números de 9 dígitos
+        left_modulus = 10**_LEFT_DIGITS
+        right_modulus = 10**_RIGHT_DIGITS
+        left, right = divmod(base, right_modulus)
+        for index in range(_FEISTEL_ROUNDS):
+            modulus = left_modulus if index % 2 == 0 else right_modulus
+            mixed = (left + self._round(index, right, modulus)) % modulus
+            left, right = right, mixed
+        return left * right_modulus + right
+
+    def _pseudonymize_cpf(self, cpf: str) -> str:
+        """
+        Returns a valid CPF that replaces `cpf`, or empty string if invalid.
+        """
+        digits = _NON_DIGIT.sub("", cpf)
+        if cpf_digits_failure(digits):
+            return ""
+        base = int(digits[:9])
+
+        # Cycle walking: bases com todos os dígitos iguais geram CPFs
+        # inválidos, então cifra de novo até sair delas. Como a entrada
+        # também não é uma dessas bases, o mapeamento continua bijetor.
+        while True:
+            base = self._encrypt_base(base)
+            text = f"{base:09d}"
+            if text != text[0] * 9:
+                break
+
+        return format_cpf(text + cpf_check_digits(text))
+
+    def tokenize_many(self, values: Iterable[str], kind: str) -> list[str]:
+        """
+        Tokenizes many values of the same kind.
+
+        Args:
+            values (Iterable[str]): Values to tokenize
+            kind (str): "cpf", "phone" or "cpf_fpe" (format-preserving)
+
+        Returns:
+            list[str]: Tokens in input order, with "" for invalid values
+        """
+        function = self._function(kind)
+        return [function(value) for value in values]
+
+    def _function(self, kind: str) -> Callable[[str], str]:
+        if kind == "cpf":
+            return self.tokenize_cpf
+        if kind == "phone":
+            return self.tokenize_phone
+        if kind == "cpf_fpe":
+            return self.pseudonymize_cpf
+        raise ValueError(f"Unknown kind: {kind!r}")
+
+
+def _tokenize_chunk(arguments: tuple) -> list[str]:
+    key, digestmod, length, cache_size, kind, values = arguments
+    tokenizer = Tokenizer(key, digestmod, length, cache_size)
+    return tokenizer.tokenize_many(values, kind)
+
+
+def tokenize_parallel(
+    values: Iterable[str],
+    kind: str,
+    key: bytes,
+    processes: int | None = None,
+    chunk_size: int = 50_000,
+    digestmod: str = "sha256",
+    length: int = 32,
+    cache_size: int = 0,
+) -> list[str]:
+    """
+    Tokenizes values across a process pool.
+
+    Args:
+        values (Iterable[str]): Values to tokenize
+        kind (str): "cpf", "phone" or "cpf_fpe" (format-preserving)
+        key (bytes): Secret key
+        processes (int | None): Number of worker processes (default: CPUs)
+        chunk_size (int): Values sent to a worker at a time (default: 50000)
+        digestmod (str): Hash used by the HMAC (default: "sha256")
+        length (int): Number of hex characters in each token (default: 32)
+        cache_size (int): LRU cache size per worker chunk (default: 0)
+
+    Returns:
+        list[str]: Tokens in input order, with "" for invalid values
+
+    Example:
+        - tokenize_parallel(["111.444.777-35", "123"], "cpf", b"secret")
+          - Returns: ["<32 hex chars>", ""]
+    """
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown kind: {kind!r}")
+
+    values = list(values)
+    chunks = (
+        (key, digestmod, length, cache_size, kind, values[i : i + chunk_size])
+        for i in range(0, len(values), chunk_size)
+    )
+    with ProcessPoolExecutor(processes) as executor:
+        return list(chain.from_iterable(executor.map(_tokenize_chunk, chunks)))
+
+
+__all__ = [
+    "Tokenizer",
+    "tokenize_parallel",
+]
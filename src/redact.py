@@ -0,0 +1,418 @@
+"""
+PII Redaction Functions
+
+This module provides a streaming redactor that masks CPFs, phone numbers,
+email addresses and vehicle plates in text, such as application logs.
+
+Candidates are found with cheap scans (a "@" search for emails and coarse
+numeric spans for CPFs and phones) and only true positives are masked: a
+CPF must pass `validate_cpf`, a phone must normalize with
+`format_e164_phone`, and so on, so an arbitrary 11-digit run is kept.
+"""
+
+import re
+from functools import partial
+from typing import IO, Callable, Iterable, Iterator
+
+from .cpf import validate_cpf
+from .email import validate_email
+from .phone import format_e164_phone
+from .plate import validate_plate
+
+# Trechos com 10+ caracteres numéricos: candidatos a CPF ou telefone
+_NUMBER_SPANS = re.compile(r"[(+]?\d[\d.\-() +]{7,}\d")
+# Telefone: código do país ("+55", "55"), prefixo nacional com operadora
+# opcional ("0", "021") e o nono dígito separado ("11 9 1234-5678"), como
+# aceita format_e164_phone
+_NUMBERS = re.compile(
+    r"(?<!\d)(?:(?P<cpf>\d{3}\.?\d{3}\.?\d{3}-?\d{2})"
+    r"|(?P<phone>(?:\+?55[ \-]?|0[ \-]?(?:\d{2}[ \-]?)?)?"
+    r"(?:\(\d{2}\)|\d{2})[ \-]?(?:9[ \-]?)?\d{4}[ \-]?\d{4}))(?!\d)"
+)
+# Placas em qualquer caixa, com hífen ou espaço opcional após as letras,
+# como aceita validate_plate
+_PLATES = re.compile(r"[A-Za-z]{3}[ \t\-]?\d[A-Za-z\d]\d{2}")
+_EMAIL_DOMAIN = re.compile(r"[\w\-]+(?:\.[\w\-]+)+")
+
+
+class _ShapeTable(dict):
+    """
+    Translation table that maps digits (including non-ASCII ones, as `\\d`
+    does) to "0", ASCII letters to "a" and separators to "-".
+    """
+
+    def __missing__(self, code: int) -> str | int:
+        value = "0" if chr(code).isdecimal() else code
+        self[code] = value
+        return value
+
+
+_SHAPE = _ShapeTable(
+    {
+        **dict.fromkeys(map(ord, "0123456789"), "0"),
+        **dict.fromkeys(
+            map(ord, "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"),
+            "a",
+        ),
+        **dict.fromkeys(map(ord, " \t.-"), "-"),
+    }
+)
+# Trechos que todo candidato contém depois do mapeamento, buscados com
+# str.find: CPF tem 6 dígitos seguidos ou "000.000.000"; telefone termina
+# em 8 dígitos, separados ou não; placa tem uma letra seguida, com
+# separador opcional, de "0000" (antiga) ou "0a00" (Mercosul). Datas e
+# horas ("0000-00-00-00:00:00") não contêm os de CPF e telefone.
+_NUMBER_SHAPES = ("000000", "000-000-000", "0000-0000")
+_PLATE_SHAPES = ("a0000", "a0a00", "a-0000", "a-0a00")
+
+_TAGS = {
+    "cpf": "[CPF]",
+    "phone": "[PHONE]",
+    "email": "[EMAIL]",
+    "plate": "[PLATE]",
+}
+
+
+# CPFs, telefones e placas são ASCII; emails podem ter letras acentuadas
+_ALNUM = re.compile(r"[^\W_]")
+_DIGITS_TO_STAR = str.maketrans(dict.fromkeys("0123456789", "*"))
+_ALNUM_TO_STAR = str.maketrans(
+    dict.fromkeys(
+        "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ", "*"
+    )
+)
+
+
+def _partial_cpf(value: str) -> str:
+    # Mantém os dígitos do meio: ***.444.777-**
+    return f"***{value[3:-2]}**"
+
+
+def _partial_phone(value: str) -> str:
+    # Mantém apenas os 4 últimos dígitos
+    return value[:-4].translate(_DIGITS_TO_STAR) + value[-4:]
+
+
+def _partial_email(value: str) -> str:
+    username, domain = value.split("@", 1)
+    return f"{username[0]}***@{domain}"
+
+
+def _partial_plate(value: str) -> str:
+    return value[:3] + value[3:].translate(_ALNUM_TO_STAR)
+
+
+def _full(value: str) -> str:
+    if value.isascii():
+        return value.translate(_ALNUM_TO_STAR)
+    return _ALNUM.sub("*", value)
+
+
+_PARTIAL = {
+    "cpf": _partial_cpf,
+    "phone": _partial_phone,
+    "email": _partial_email,
+    "plate": _partial_plate,
+}
+
+
+def _candidate_lines(
+    shape: str, markers: tuple[str, ...]
+) -> list[tuple[int, int]]:
+    """Returns the sorted, merged spans of the lines containing a marker."""
+    spans = []
+    for marker in markers:
+        position = shape.find(marker)
+        while position != -1:
+            start = shape.rfind("\n", 0, position) + 1
+            end = shape.find("\n", position)
+            if end == -1:
+                end = len(shape)
+            spans.append((start, end))
+            position = shape.find(marker, end)
+    if len(spans) < 2:
+        return spans
+
+    spans.sort()
+    merged = [spans[0]]
+    for start, end in spans[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class Redactor:
+    """
+    Masks CPFs, phones, emails and plates in text or streams.
+
+    Each type can use its own masking style:
+    - "partial": keep part of the value (e.g. "***.444.777-**")
+    - "full": replace every letter and digit with "*"
+    - "tag": replace the value with a tag (e.g. "[CPF]")
+    - None: do not redact this type
+    - a callable receiving the matched text and returning its replacement
+
+    Args:
+        styles (dict | None): Masking style per type ("cpf", "phone",
+            "email", "plate"); missing types use "partial"
+        max_line_length (int): Size after which a line without newline is
+            flushed at its last space, bounding memory (default: 1 MiB)
+
+    Example:
+        - redactor = Redactor()
+        - redactor.redact("cpf 111.444.777-35")
+          - Returns: "cpf ***.444.777-**"
+        - Redactor({"cpf": "tag"}).redact("cpf 11144477735")
+          - Returns: "cpf [CPF]"
+    """
+
+    def __init__(
+        self,
+        styles: dict[str, str | Callable[[str], str] | None] | None = None,
+        max_line_length: int = 1 << 20,
+    ) -> None:
+        styles = styles or {}
+        self.max_line_length = max_line_length
+        self._maskers = {
+            kind: self._masker(kind, styles.get(kind, "partial"))
+            for kind in _TAGS
+        }
+
+    @staticmethod
+    def _masker(
+        kind: str, style: str | Callable[[str], str] | None
+    ) -> Callable[[str], str] | None:
+        if style is None or callable(style):
+            return style
+        if style == "partial":
+            return _PARTIAL[kind]
+        if style == "full":
+            return _full
+        if style == "tag":
+            tag = _TAGS[kind]
+            return lambda value: tag
+        raise ValueError(f"Unknown masking style: {style!r}")
+
+    def _mask(self, kind: str, value: str) -> str:
+        masker = self._maskers[kind]
+        return masker(value) if masker else value
+
+    def _replace_number(self, match: re.Match) -> str:
+        value = match.group()
+
+        if match.lastgroup == "cpf":
+            if validate_cpf(value):
+                return self._mask("cpf", value)
+            # 11 dígitos sem pontuação também podem ser um celular
+            if not value.isdigit():
+                return value
+
+        if format_e164_phone(value):
+            return self._mask("phone", value)
+        return value
+
+    def _replace_numbers(self, match: re.Match) -> str:
+        return _NUMBERS.sub(self._replace_number, match.group())
+
+    def _replace_plate(self, match: re.Match) -> str:
+        text = match.string
+        start, end = match.span()
+        value = match.group()
+        # Exige limites de palavra dos dois lados
+        if (start and text[start - 1].isalnum()) or (
+            end < len(text) and text[end].isalnum()
+        ):
+            return value
+        return self._mask("plate", value) if validate_plate(value) else value
+
+    def _redact_emails(self, text: str) -> str:
+        # Procura cada "@" com str.find e expande para os lados, evitando
+        # tentar o padrão de email em todas as posições do texto
+        pieces = []
+        last = 0
+        at = text.find("@")
+        while at != -1:
+            # O usuário é tudo o que validate_email aceita: qualquer
+            # caractere que não seja espaço nem "@" (ex.: "joão")
+            start = at
+            while start > last:
+                char = text[start - 1]
+                if char == "@" or char.isspace():
+                    break
+                start -= 1
+            domain = _EMAIL_DOMAIN.match(text, at + 1)
+            if start < at and domain:
+                end = domain.end()
+                value = text[start:end]
+                if validate_email(value):
+                    pieces.append(text[last:start])
+                    pieces.append(self._mask("email", value))
+                    last = end
+            at = text.find("@", max(at + 1, last))
+
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+    def redact(self, text: str) -> str:
+        """
+        Masks every valid CPF, phone, email and plate in `text`.
+
+        Args:
+            text (str): Text to redact
+
+        Returns:
+            str: Redacted text
+        """
+        maskers = self._maskers
+        if maskers["email"] and "@" in text:
+            text = self._redact_emails(text)
+
+        numbers = maskers["cpf"] or maskers["phone"]
+        plates = maskers["plate"]
+        shapes = (_NUMBER_SHAPES if numbers else ()) + (
+            _PLATE_SHAPES if plates else ()
+        )
+        if not shapes:
+            return text
+
+        # Só as linhas com um trecho de CPF, telefone ou placa passam pelas
+        # regex, que são lentas quando tentadas em toda posição do texto
+        lines = _candidate_lines(text.translate(_SHAPE), shapes)
+        if not lines:
+            return text
+        pieces = []
+        last = 0
+        for start, end in lines:
+            line = text[start:end]
+            if numbers:
+                line = _NUMBER_SPANS.sub(self._replace_numbers, line)
+            if plates:
+                line = _PLATES.sub(self._replace_plate, line)
+            pieces.append(text[last:start])
+            pieces.append(line)
+            last = end
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+    def redact_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Redacts an iterable of lines (e.g. a text file), one at a time.
+
+        Args:
+            lines (Iterable[str]): Lines to redact
+
+        Returns:
+            Iterator[str]: Redacted lines
+        """
+        redact = self.redact
+        for line in lines:
+            yield redact(line)
+
+    def _redact_piece(self, piece: str | bytes) -> str | bytes:
+        if isinstance(piece, str):
+            return self.redact(piece)
+        # surrogateescape devolve intactos os bytes que não são UTF-8
+        text = piece.decode("utf-8", "surrogateescape")
+        redacted = self.redact(text)
+        if redacted is text:
+            # Nada mascarado: devolve os bytes sem recodificar
+            return piece
+        return redacted.encode("utf-8", "surrogateescape")
+
+    def redact_stream(
+        self, chunks: Iterable[str | bytes]
+    ) -> Iterator[str | bytes]:
+        """
+        Redacts a stream of text or byte chunks split at arbitrary points.
+
+        Chunks are only redacted up to their last newline, so values split
+        across two chunks are still found. Bytes are buffered as bytes and
+        decoded as UTF-8 only up to a newline or space, so multi-byte
+        characters are never split; bytes that are not valid UTF-8 are
+        kept byte for byte.
+
+        Args:
+            chunks (Iterable[str | bytes]): Text or byte chunks
+
+        Returns:
+            Iterator[str | bytes]: Redacted chunks, of the same type as the
+            input chunks
+        """
+        parts: list = []
+        size = 0
+        empty = ""
+
+        for chunk in chunks:
+            binary = isinstance(chunk, (bytes, bytearray))
+            newline, space = (b"\n", b" ") if binary else ("\n", " ")
+            empty = chunk[:0]
+
+            cut = chunk.rfind(newline) + 1
+            if cut:
+                parts.append(chunk[:cut])
+                output = self._redact_piece(empty.join(parts))
+                parts = [chunk[cut:]]
+                size = len(parts[0])
+                yield output
+                continue
+
+            parts.append(chunk)
+            size += len(chunk)
+            if size > self.max_line_length:
+                # Linha muito longa: descarrega até o último espaço
+                buffer = empty.join(parts)
+                cut = buffer.rfind(space) + 1 or len(buffer)
+                output = self._redact_piece(buffer[:cut])
+                parts = [buffer[cut:]]
+                size = len(parts[0])
+                yield output
+
+        if size:
+            yield self._redact_piece(empty.join(parts))
+
+    def redact_file(
+        self, source: IO[bytes], target: IO[bytes], chunk_size: int = 1 << 20
+    ) -> None:
+        """
+        Redacts a binary file object into another one.
+
+        Args:
+            source (IO[bytes]): File opened for binary reading
+            target (IO[bytes]): File opened for binary writing
+            chunk_size (int): Bytes read per chunk (default: 1 MiB)
+        """
+        chunks = iter(partial(source.read, chunk_size), b"")
+        target.writelines(self.redact_stream(chunks))
+
+
+def redact_text(
+    text: str,
+    styles: dict[str, str | Callable[[str], str] | None] | None = None,
+) -> str:
+    """
+    Masks every valid CPF, phone, email and plate in a text.
+
+    Args:
+        text (str): Text to redact
+        styles (dict | None): Masking style per type, see `Redactor`
+
+    Returns:
+        str: Redacted text
+
+    Example:
+        - redact_text("cpf 111.444.777-35")  # Returns: "cpf ***.444.777-**"
+        - redact_text("tel (11) 91234-5678")  # Returns: "tel (**) *****-5678"
+        - redact_text("id 12345678901")  # Returns: "id 12345678901"
+        - redact_text("joao@email.com")  # Returns: "j***@email.com"
+    """
+    return Redactor(styles).redact(text)
+
+
+__all__ = [
+    "Redactor",
+    "redact_text",
+]
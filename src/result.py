@@ -0,0 +1,113 @@
+"""
+Validation Result Objects
+
+This module provides the rich result returned by the `check_*` functions:
+a compact failure code plus the original value, with the message and the
+normalized value computed only when accessed.
+"""
+
+from enum import IntEnum
+from typing import Callable
+
+
+class FailureCode(IntEnum):
+    """
+    Reason why a value failed validation.
+
+    Example:
+        - FailureCode.OK  # Value is valid
+        - FailureCode.FIRST_CHECK_DIGIT  # First verifier digit mismatch
+    """
+
+    OK = 0
+    INVALID_LENGTH = 1
+    INVALID_CHARACTERS = 2
+    INVALID_FORMAT = 3
+    REPEATED_DIGITS = 4
+    FIRST_CHECK_DIGIT = 5
+    SECOND_CHECK_DIGIT = 6
+    INVALID_DDD = 7
+
+
+_MESSAGES = {
+    FailureCode.OK: "{kind} is valid",
+    FailureCode.INVALID_LENGTH: "{kind} has an invalid length",
+    FailureCode.INVALID_CHARACTERS: "{kind} contains invalid characters",
+    FailureCode.INVALID_FORMAT: "{kind} has an invalid format",
+    FailureCode.REPEATED_DIGITS: "{kind} cannot have all digits repeated",
+    FailureCode.FIRST_CHECK_DIGIT: "{kind} first check digit is invalid",
+    FailureCode.SECOND_CHECK_DIGIT: "{kind} second check digit is invalid",
+    FailureCode.INVALID_DDD: "{kind} has an invalid DDD",
+}
+
+
+class ValidationResult:
+    """
+    Result of a `check_*` function.
+
+    Evaluates to True when the value is valid, so it can be used wherever
+    the boolean returned by the `validate_*` functions is expected.
+
+    Args:
+        kind (str): Name of the validated type (e.g. "CPF")
+        code (FailureCode): Reason of the failure, or FailureCode.OK
+        value (str): Original value
+        normalize (Callable[[str], str] | None): Function used to build the
+            normalized value on first access
+
+    Example:
+        - result = check_cpf("111.444.777-36")
+        - bool(result)  # Returns: False
+        - result.code  # Returns: FailureCode.SECOND_CHECK_DIGIT
+        - result.message  # Returns: "CPF second check digit is invalid"
+    """
+
+    __slots__ = ("kind", "code", "value", "_normalize", "_normalized")
+
+    def __init__(
+        self,
+        kind: str,
+        code: FailureCode,
+        value: str,
+        normalize: Callable[[str], str] | None = None,
+    ) -> None:
+        self.kind = kind
+        self.code = code
+        self.value = value
+        self._normalize = normalize
+        self._normalized = None
+
+    def __bool__(self) -> bool:
+        return not self.code
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationResult(kind={self.kind!r}, "
+            f"code={self.code.name}, value={self.value!r})"
+        )
+
+    @property
+    def valid(self) -> bool:
+        """True if the value is valid."""
+        return not self.code
+
+    @property
+    def message(self) -> str:
+        """Human readable description of the result."""
+        return _MESSAGES[self.code].format(kind=self.kind)
+
+    @property
+    def normalized(self) -> str:
+        """Normalized value, or empty string if the value is invalid."""
+        if self.code:
+            return ""
+        if self._normalized is None:
+            normalize = self._normalize
+            self._normalized = normalize(self.value) if normalize else ""
+        return self._normalized
+
+
+__all__ = [
+    "FailureCode",
+    "ValidationResult",
+]
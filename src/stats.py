@@ -0,0 +1,322 @@
+"""
+Streaming Statistics Over Validated Fields
+
+This module provides bounded-memory sketches to compute statistics over
+streams of records without storing them: top email domains, top DDDs,
+plate format mix, invalid rate per field and distinct CPFs.
+
+All sketches use a deterministic hash, so sketches built in different
+worker processes can be merged with `merge`.
+"""
+
+import heapq
+import math
+from array import array
+from hashlib import blake2b
+
+from .cpf import format_cpf, validate_cpf
+from .email import extract_domain
+from .phone import format_e164_phone
+from .plate import is_mercosul_format_plate, is_old_format_plate
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _hash64(item: str) -> int:
+    """Returns a 64-bit hash of `item` that is stable across processes."""
+    digest = blake2b(item.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch for approximate frequency counting.
+
+    Estimates never undercount; they overcount by at most
+    `e / width * total` with probability `1 - exp(-depth)`.
+
+    Args:
+        width (int): Number of counters per row (default: 2048)
+        depth (int): Number of rows (default: 4)
+
+    Example:
+        - sketch = CountMinSketch()
+        - sketch.add("gmail.com")  # Returns: 1
+        - sketch.estimate("gmail.com")  # Returns: 1
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4) -> None:
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, item: str) -> list[int]:
+        # Double hashing: h1 + i * h2 gives `depth` independent positions
+        value = _hash64(item)
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        width = self.width
+        return [(h1 + i * h2) % width for i in range(self.depth)]
+
+    def add(self, item: str, count: int = 1) -> int:
+        """Adds `count` occurrences of `item` and returns its estimate."""
+        self.total += count
+        estimate = None
+        for row, index in zip(self._rows, self._indexes(item)):
+            row[index] += count
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        return estimate
+
+    def estimate(self, item: str) -> int:
+        """Returns the estimated number of occurrences of `item`."""
+        return min(
+            row[index] for row, index in zip(self._rows, self._indexes(item))
+        )
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Adds the counters of `other` (same width and depth) to this one."""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge sketches with different shapes")
+        self.total += other.total
+        for row, other_row in zip(self._rows, other._rows):
+            for index, value in enumerate(other_row):
+                if value:
+                    row[index] += value
+
+
+class HeavyHitters:
+    """
+    Top-k frequent items using a Count-Min sketch plus k candidates.
+
+    Only the k current candidates are stored explicitly, so memory is
+    bounded regardless of the number of distinct items in the stream.
+
+    Args:
+        k (int): Number of heavy hitters to keep (default: 10)
+        width (int): Count-Min sketch width (default: 2048)
+        depth (int): Count-Min sketch depth (default: 4)
+
+    Example:
+        - hitters = HeavyHitters(k=2)
+        - hitters.add("gmail.com")
+        - hitters.top()  # Returns: [("gmail.com", 1)]
+    """
+
+    def __init__(self, k: int = 10, width: int = 2048, depth: int = 4) -> None:
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self._candidates: dict[str, int] = {}
+        # Lower bound of the smallest candidate count; candidate counts
+        # only grow, so the real minimum is never below this value
+        self._floor = 0
+
+    def add(self, item: str, count: int = 1) -> None:
+        """Adds `count` occurrences of `item`."""
+        estimate = self.sketch.add(item, count)
+        candidates = self._candidates
+
+        if item in candidates or len(candidates) < self.k:
+            candidates[item] = estimate
+            return
+        if estimate <= self._floor:
+            return
+
+        smallest = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[smallest]:
+            del candidates[smallest]
+            candidates[item] = estimate
+            smallest = min(candidates, key=candidates.__getitem__)
+        self._floor = candidates[smallest]
+
+    def top(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Returns up to `n` (default: k) items with estimated counts."""
+        return heapq.nlargest(
+            n or self.k, self._candidates.items(), key=lambda item: item[1]
+        )
+
+    def merge(self, other: "HeavyHitters") -> None:
+        """Merges the sketch and candidates of `other` into this one."""
+        self.sketch.merge(other.sketch)
+        items = set(self._candidates) | set(other._candidates)
+        estimates = {item: self.sketch.estimate(item) for item in items}
+        self._candidates = dict(
+            heapq.nlargest(self.k, estimates.items(), key=lambda item: item[1])
+        )
+        self._floor = min(self._candidates.values(), default=0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch for approximate distinct counting.
+
+    Uses `2 ** precision` one-byte registers, with a standard error of
+    about `1.04 / sqrt(2 ** precision)` (0.8% for the default).
+
+    Args:
+        precision (int): Number of index bits, from 4 to 18 (default: 14)
+
+    Example:
+        - hll = HyperLogLog()
+        - hll.add("11144477735")
+        - hll.count()  # Returns: 1
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, item: str) -> None:
+        """Adds `item` to the set."""
+        value = _hash64(item)
+        precision = self.precision
+        index = value >> (64 - precision)
+        rest = (value << precision) & _MASK_64
+        rank = 65 - rest.bit_length() if rest else 65 - precision
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct items."""
+        registers = self._registers
+        size = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0**-r for r in registers)
+
+        zeros = registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting for small cardinalities
+            estimate = size * math.log(size / zeros)
+
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Merges `other` (same precision) into this sketch."""
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        self._registers = bytearray(
+            map(max, self._registers, other._registers)
+        )
+
+
+class FieldStats:
+    """
+    Streaming statistics for email, phone, plate and CPF fields.
+
+    Tracks the number of seen and invalid values per field, the top email
+    domains, the DDD distribution, the plate format mix and the number of
+    distinct valid CPFs, in bounded memory.
+
+    Args:
+        top_k (int): Number of top email domains to keep (default: 10)
+        width (int): Count-Min sketch width (default: 2048)
+        depth (int): Count-Min sketch depth (default: 4)
+        precision (int): HyperLogLog precision (default: 14)
+
+    Example:
+        - stats = FieldStats()
+        - stats.add_email("test@example.com")
+        - stats.add_phone("(11) 91234-5678")
+        - stats.top_domains()  # Returns: [("example.com", 1)]
+        - stats.invalid_rate("phone")  # Returns: 0.0
+    """
+
+    FIELDS = ("email", "phone", "plate", "cpf")
+
+    def __init__(
+        self,
+        top_k: int = 10,
+        width: int = 2048,
+        depth: int = 4,
+        precision: int = 14,
+    ) -> None:
+        self.seen = dict.fromkeys(self.FIELDS, 0)
+        self.invalid = dict.fromkeys(self.FIELDS, 0)
+        self.domains = HeavyHitters(top_k, width, depth)
+        # Only ~70 DDDs exist, so an exact counter is already bounded
+        self.ddds: dict[str, int] = {}
+        self.plate_formats = {"old": 0, "mercosul": 0}
+        self.cpfs = HyperLogLog(precision)
+
+    def add_email(self, email: str) -> None:
+        """Adds an email address to the statistics."""
+        self.seen["email"] += 1
+        domain = extract_domain(email)
+        if domain:
+            self.domains.add(domain.lower())
+        else:
+            self.invalid["email"] += 1
+
+    def add_phone(self, phone: str) -> None:
+        """
+        Adds a phone number to the statistics.
+
+        A phone is valid if it normalizes with `format_e164_phone`, so
+        numbers with country code ("+55 11 91234-5678") or trunk prefix
+        are counted under their DDD.
+        """
+        self.seen["phone"] += 1
+        e164 = format_e164_phone(phone)
+        if e164:
+            ddd = e164[3:5]
+            self.ddds[ddd] = self.ddds.get(ddd, 0) + 1
+        else:
+            self.invalid["phone"] += 1
+
+    def add_plate(self, plate: str) -> None:
+        """Adds a vehicle plate to the statistics."""
+        self.seen["plate"] += 1
+        if is_old_format_plate(plate):
+            self.plate_formats["old"] += 1
+        elif is_mercosul_format_plate(plate):
+            self.plate_formats["mercosul"] += 1
+        else:
+            self.invalid["plate"] += 1
+
+    def add_cpf(self, cpf: str) -> None:
+        """Adds a CPF to the statistics."""
+        self.seen["cpf"] += 1
+        if validate_cpf(cpf):
+            self.cpfs.add(format_cpf(cpf))
+        else:
+            self.invalid["cpf"] += 1
+
+    def top_domains(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Returns the most frequent email domains."""
+        return self.domains.top(n)
+
+    def top_ddds(self, n: int = 10) -> list[tuple[str, int]]:
+        """Returns the most frequent DDDs of valid phone numbers."""
+        return heapq.nlargest(n, self.ddds.items(), key=lambda item: item[1])
+
+    def distinct_cpfs(self) -> int:
+        """Returns the estimated number of distinct valid CPFs."""
+        return self.cpfs.count()
+
+    def invalid_rate(self, field: str) -> float:
+        """Returns the fraction of invalid values seen for `field`."""
+        seen = self.seen[field]
+        return self.invalid[field] / seen if seen else 0.0
+
+    def merge(self, other: "FieldStats") -> None:
+        """Merges statistics computed by another worker into this one."""
+        for field in self.FIELDS:
+            self.seen[field] += other.seen[field]
+            self.invalid[field] += other.invalid[field]
+        for ddd, count in other.ddds.items():
+            self.ddds[ddd] = self.ddds.get(ddd, 0) + count
+        for name, count in other.plate_formats.items():
+            self.plate_formats[name] += count
+        self.domains.merge(other.domains)
+        self.cpfs.merge(other.cpfs)
+
+
+__all__ = [
+    "CountMinSketch",
+    "HeavyHitters",
+    "HyperLogLog",
+    "FieldStats",
+]
@@ -0,0 +1,26 @@
+from benchmarks.bench_allocations import (
+    BUDGETS,
+    CASES,
+    SKIPPED,
+    functions,
+    measure,
+    over_budget,
+)
+
+
+def test_every_exported_function_has_a_case():
+
+    exported = set(functions())
+    assert exported - SKIPPED == set(CASES)
+    assert set(BUDGETS) <= set(CASES)
+
+
+def test_hot_paths_within_budget():
+
+    profiles = {
+        name: measure(functions()[name], CASES[name], batch=200, repeat=5)
+        for name in BUDGETS
+    }
+    assert over_budget(profiles) == {}
+    # O orçamento de blocos só vale se a medição enxerga o resultado mantido
+    assert profiles["format_cpf"].blocks > 0.9
@@ -0,0 +1,59 @@
+import pytest
+
+from src.cache import RevalidationCache
+
+
+def test_validate_chunk_skips_unchanged(tmp_path):
+
+    path = str(tmp_path / "cache.db")
+    chunk = ["111.444.777-35", "123", "11144477735"]
+
+    with RevalidationCache(path) as cache:
+        assert cache.validate_chunk("cpf", chunk) == [True, False, True]
+        stats = cache.stats
+        assert stats["values_validated"] == 2
+        assert stats["chunks_skipped"] == 0
+
+    with RevalidationCache(path) as cache:
+        assert cache.validate_chunk("cpf", chunk) == [True, False, True]
+        assert cache.validate_chunk("cpf", chunk + ["584.492.260-31"]) == [
+            True,
+            False,
+            True,
+            True,
+        ]
+        stats = cache.stats
+        assert stats["chunks_skipped"] == 1
+        assert stats["values_skipped"] == 3
+        assert stats["values_cached"] == 2
+        assert stats["values_validated"] == 1
+        assert stats["skip_ratio"] == 6 / 7
+
+
+def test_version_change_invalidates(tmp_path):
+
+    path = str(tmp_path / "cache.db")
+    with RevalidationCache(path, version="a") as cache:
+        cache.validate_chunk("email", ["a@b.com"])
+
+    with RevalidationCache(path, version="a") as cache:
+        cache.validate_chunk("email", ["a@b.com"])
+        assert cache.stats["chunks_skipped"] == 1
+
+    with RevalidationCache(path, version="b") as cache:
+        assert cache.validate_chunk("email", ["a@b.com"]) == [True]
+        assert cache.stats["values_validated"] == 1
+
+
+def test_iter_validate_and_errors(tmp_path):
+
+    with RevalidationCache(str(tmp_path / "cache.db")) as cache:
+        phones = ["(11) 91234-5678", "1234", "11912345678"] * 3
+        assert list(cache.iter_validate("phone", phones, chunk_size=2)) == [
+            True,
+            False,
+            True,
+        ] * 3
+        assert cache.validate("plate", "abc-1234") is True
+        with pytest.raises(ValueError):
+            cache.validate("foo", "bar")
@@ -1,6 +1,10 @@
+import pytest
+
 from src.cpf import (
+    CPF_REGIONS, cpf_check_digits, cpf_digits_failure, cpf_region,
     is_cpf_format, format_cpf, validate_cpf
 )
+from src.result import FailureCode
 
 
 def test_is_cpf_format():
@@ -25,3 +29,34 @@ def test_validate_cpf():
     assert validate_cpf("111.444.777-35") is True
     assert validate_cpf("00000000000") is False
     assert validate_cpf("11144477735") is True
+
+
+def test_cpf_region():
+
+    assert cpf_region("111.444.777-35") == 7
+    assert cpf_region("58449226031") == 0
+    assert cpf_region("111.444.777-36") == -1
+    assert CPF_REGIONS[cpf_region("111.444.777-35")] == ("ES", "RJ")
+
+
+def test_cpf_check_digits():
+
+    assert cpf_check_digits("111444777") == "35"
+    assert cpf_check_digits("584492260") == "31"
+    assert cpf_check_digits("390533447") == "05"
+    with pytest.raises(ValueError):
+        cpf_check_digits("11144477")
+
+
+def test_cpf_digits_failure():
+
+    assert cpf_digits_failure("11144477735") is FailureCode.OK
+    assert cpf_digits_failure("1114447773") is FailureCode.INVALID_LENGTH
+    assert cpf_digits_failure("111444777²5") is (
+        FailureCode.INVALID_CHARACTERS
+    )
+    assert cpf_digits_failure("11111111111") is FailureCode.REPEATED_DIGITS
+    assert cpf_digits_failure("11144477745") is FailureCode.FIRST_CHECK_DIGIT
+    assert cpf_digits_failure("11144477736") is (
+        FailureCode.SECOND_CHECK_DIGIT
+    )
@@ -0,0 +1,141 @@
+import asyncio
+import struct
+import subprocess
+import sys
+
+from src.daemon import ValidationServer, validate_batch
+
+
+def test_validate_batch():
+
+    assert validate_batch(
+        [("cpf", "11144477735"), ("plate", "A1B2C3D"), ("email", "a@b.com")]
+    ) == [True, False, True]
+
+
+def _serve_and_query(tmp_path, framing, payloads, **options):
+    path = str(tmp_path / "regexm.sock")
+
+    async def run():
+        server = ValidationServer(path, framing=framing, **options)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            for payload in payloads:
+                if framing == "line":
+                    writer.write(payload + b"\n")
+                else:
+                    writer.write(struct.pack(">I", len(payload)) + payload)
+            await writer.drain()
+
+            responses = []
+            for _ in payloads:
+                if framing == "line":
+                    responses.append((await reader.readline()).rstrip(b"\n"))
+                else:
+                    (size,) = struct.unpack(">I", await reader.readexactly(4))
+                    responses.append(await reader.readexactly(size))
+            writer.close()
+            return responses
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_server_line_framing(tmp_path):
+
+    responses = _serve_and_query(
+        tmp_path,
+        "line",
+        [
+            b"cpf 111.444.777-35",
+            b"cpf 111.444.777-36",
+            b"phone (11) 91234-5678",
+            b"plate ABC1D23",
+            b"foo bar",
+        ],
+        window=0.005,
+        max_batch=2,
+    )
+    assert responses[:4] == [b"1", b"0", b"1", b"1"]
+    assert responses[4].startswith(b"E ")
+
+
+def test_server_length_framing(tmp_path):
+
+    responses = _serve_and_query(
+        tmp_path,
+        "length",
+        [b"email a@b.com", b"email a b@c.com", b"cnh 12345678901"],
+        window=0,
+    )
+    assert responses == [b"1", b"0", b"1"]
+
+
+def test_server_close_with_connected_client(tmp_path):
+
+    path = str(tmp_path / "regexm.sock")
+
+    async def run():
+        server = ValidationServer(path, window=60, max_batch=512)
+        await server.start()
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"cpf 111.444.777-35\n")
+        await writer.drain()
+        await asyncio.sleep(0.05)
+
+        # O pedido ainda espera a janela do lote quando o servidor fecha
+        await asyncio.wait_for(server.close(), 2)
+        response = await asyncio.wait_for(reader.readline(), 2)
+        closed = await asyncio.wait_for(reader.read(), 2)
+        writer.close()
+        return response, closed
+
+    response, closed = asyncio.run(run())
+    assert response.startswith(b"E ")
+    assert closed == b""
+
+
+def test_serve_forever_cancel_with_connected_client(tmp_path):
+
+    path = str(tmp_path / "regexm.sock")
+
+    async def run():
+        server = ValidationServer(path)
+        serving = asyncio.create_task(server.serve_forever())
+        while server._server is None:
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"cpf 111.444.777-35\n")
+        assert await reader.readline() == b"1\n"
+
+        # Como o Ctrl+C no asyncio.run: cancela com o cliente conectado
+        serving.cancel()
+        await asyncio.wait_for(
+            asyncio.gather(serving, return_exceptions=True), 2
+        )
+        closed = await asyncio.wait_for(reader.read(), 2)
+        writer.close()
+        return closed
+
+    assert asyncio.run(run()) == b""
+
+
+def test_package_import_is_lazy():
+
+    code = (
+        "import sys, src; "
+        "assert 'asyncio' not in sys.modules; "
+        "assert 'src.daemon' not in sys.modules; "
+        "assert src.ValidationServer.__module__ == 'src.daemon'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # Sem o RuntimeWarning do runpy ao executar os módulos com CLI
+    for module in ("src.daemon", "src.join", "src.partition"):
+        subprocess.run(
+            [sys.executable, "-W", "error", "-m", module, "--help"],
+            check=True,
+            capture_output=True,
+        )
@@ -0,0 +1,128 @@
+import random
+import re
+
+from src.email import (
+    check_email,
+    extract_domain,
+    extract_username,
+    is_blocked_domain,
+    is_blocked_email,
+    load_domain_blocklist,
+    parse_email,
+    validate_email,
+)
+from src.result import FailureCode
+
+# Padrão anterior ao scanner: o scanner deve aceitar a mesma linguagem
+OLD_PATTERN = re.compile(r"^([^\s@]+)@([^\s@]+\.[^\s@]+)$")
+
+
+def test_parse_email():
+
+    assert parse_email("test@example.com") == (True, "test", "example.com")
+    assert parse_email("invalid-email") == (False, "", "")
+    assert parse_email("Test@Example.COM", lowercase=True) == (
+        True,
+        "test",
+        "example.com",
+    )
+    assert parse_email("user@ação.com", idna=True) == (
+        True,
+        "user",
+        "xn--ao-siap.com",
+    )
+
+
+def test_parse_email_intern():
+
+    _, _, first = parse_email("a@" + "example" + ".com", intern=True)
+    _, _, second = parse_email("b@" + "example" + ".com", intern=True)
+    assert first is second
+
+
+def test_extract_parts():
+
+    assert extract_domain("user.name+tag@example.com") == "example.com"
+    assert extract_username("user.name+tag@example.com") == "user.name+tag"
+    assert extract_domain("invalid-email") == ""
+    assert extract_username("invalid-email") == ""
+
+
+def test_domain_blocklist(tmp_path):
+
+    path = tmp_path / "blocklist.txt"
+    path.write_text("# disposable\nTempMail.com\n\nmailinator.com\n")
+    blocklist = load_domain_blocklist(str(path))
+
+    assert blocklist == frozenset({"tempmail.com", "mailinator.com"})
+    assert is_blocked_domain("tempmail.com", blocklist) is True
+    assert is_blocked_domain("inbox.TEMPMAIL.com", blocklist) is True
+    assert is_blocked_domain("nottempmail.com", blocklist) is False
+    assert is_blocked_email("user@mailinator.com", blocklist) is True
+    assert is_blocked_email("user@example.com", blocklist) is False
+    assert is_blocked_email("mailinator.com", blocklist) is False
+
+    # Ponto final (domínio absoluto) não escapa da lista
+    assert validate_email("a@tempmail.com.") is True
+    assert is_blocked_email("a@tempmail.com.", blocklist) is True
+    assert is_blocked_domain("inbox.tempmail.com.", blocklist) is True
+    path.write_text("spam.com.\n")
+    assert load_domain_blocklist(str(path)) == frozenset({"spam.com"})
+
+
+def test_validate_email_matches_old_pattern():
+
+    edge_cases = [
+        "a@b.c",
+        "a@b.c\n",
+        "a@b.c\n\n",
+        "a@.bc",
+        "a@b.",
+        "a@b..c",
+        "a@.b.c",
+        "@b.c",
+        "a@@b.c",
+        "a b@c.d",
+        "a@b.c ",
+        "a@b.c\t",
+        "a@b\n.c",
+        "ç@ação.br",
+        "",
+    ]
+    rng = random.Random(0)
+    alphabet = "ab.@ \n\tç"
+    randoms = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randrange(10)))
+        for _ in range(20000)
+    ]
+    for value in edge_cases + randoms:
+        match = OLD_PATTERN.match(value)
+        assert validate_email(value) is (match is not None), repr(value)
+        if match:
+            assert parse_email(value) == (True, *match.groups())
+
+
+def test_validate_email_strict():
+
+    label = "a" * 63
+    assert validate_email("a" * 64 + "@example.com", strict=True) is True
+    assert validate_email("a" * 65 + "@example.com", strict=True) is False
+    assert validate_email("a" * 65 + "@example.com") is True
+    assert validate_email(f"user@{label}.com", strict=True) is True
+    assert validate_email(f"user@{label}a.com", strict=True) is False
+    domain = ".".join([label] * 4)
+    assert validate_email(f"u@{domain}", strict=True) is False
+    assert validate_email(f"u@{domain[:252]}", strict=True) is True
+    assert validate_email(f"uu@{domain[:252]}", strict=True) is False
+    assert parse_email("a" * 65 + "@example.com", strict=True) == (
+        False,
+        "",
+        "",
+    )
+
+    result = check_email("a" * 65 + "@example.com", strict=True)
+    assert result.code is FailureCode.INVALID_LENGTH
+    assert check_email("a@@b.c", strict=True).code is (
+        FailureCode.INVALID_FORMAT
+    )
+    assert check_email("joao@email.com", strict=True).valid
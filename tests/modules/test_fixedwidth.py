@@ -0,0 +1,89 @@
+import io
+
+import pytest
+
+from src.fixedwidth import Field, FixedWidthParser
+
+LAYOUT = [
+    Field("cpf", 0, 14, "cpf"),
+    Field("cnh", 14, 11, "cnh"),
+    Field("crv", 25, 11, "crv"),
+    Field("placa", 36, 8, "plate"),
+    Field("nome", 44, 10),
+]
+RECORDS = [
+    b"11144477735   12345678901A1B2C3D4E5FABC1D23 ANA       ",
+    b"111.444.777-3512345678901A1B2C3D4E5FABC-1234BRUNO     ",
+    b"11144477736   12345678902A1B2C3D4E5FA1B2C3D CARLA     ",
+]
+
+
+def test_check_record():
+
+    parser = FixedWidthParser(LAYOUT)
+    assert parser.check_record(RECORDS[0]) == ()
+    assert parser.check_record(RECORDS[1]) == ()
+    assert parser.check_record(RECORDS[2]) == ("cpf", "cnh", "placa")
+    assert parser.decode(RECORDS[1])["placa"] == "ABC-1234"
+
+    with pytest.raises(ValueError):
+        FixedWidthParser([Field("x", 0, 3, "rg")])
+
+
+@pytest.mark.parametrize("block_size", [7, 1 << 20])
+def test_iter_records(block_size):
+
+    parser = FixedWidthParser(LAYOUT, block_size=block_size)
+    source = io.BytesIO(b"\r\n".join(RECORDS) + b"\n\n")
+    results = list(parser.iter_records(source, decode=True))
+
+    assert [result.line for result in results] == [1, 2, 3]
+    assert [result.valid for result in results] == [True, True, False]
+    assert bytes(results[2].record) == RECORDS[2]
+    assert results[0].fields["nome"] == "ANA"
+
+    # Registros de tamanho fixo sem quebra de linha
+    parser = FixedWidthParser(LAYOUT, record_length=54, block_size=block_size)
+    results = list(parser.iter_records(io.BytesIO(b"".join(RECORDS))))
+    assert [result.invalid for result in results] == [
+        (),
+        (),
+        ("cpf", "cnh", "placa"),
+    ]
+
+
+def test_validate_file(tmp_path):
+
+    path = tmp_path / "detran.txt"
+    path.write_bytes(b"\n".join(RECORDS))
+    rejects = tmp_path / "rejeitados.txt"
+
+    stats = FixedWidthParser(LAYOUT).validate_file(str(path), str(rejects))
+    assert stats == {
+        "records": 3,
+        "valid": 2,
+        "rejected": 1,
+        "invalid": {"cpf": 1, "cnh": 1, "crv": 0, "placa": 1},
+    }
+    assert rejects.read_bytes() == b"3\tcpf,cnh,placa\t" + RECORDS[2] + b"\n"
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 1 << 20])
+def test_line_numbers_count_blank_lines(tmp_path, block_size):
+
+    parser = FixedWidthParser(
+        [Field("cpf", 0, 11, "cpf")], block_size=block_size
+    )
+    data = b"11144477735\n\n\r\n11144477736\n\n11144477736"
+    results = list(parser.iter_records(io.BytesIO(data)))
+    assert [(result.line, result.valid) for result in results] == [
+        (1, True),
+        (4, False),
+        (6, False),
+    ]
+
+    path = tmp_path / "detran.txt"
+    rejects = tmp_path / "rejects.txt"
+    path.write_bytes(b"11144477735\n\n11144477736\n")
+    parser.validate_file(str(path), str(rejects))
+    assert rejects.read_bytes() == b"3\tcpf\t11144477736\n"
@@ -0,0 +1,45 @@
+from src.cpf import validate_cpf
+from src.guard import (
+    GUARDED_VALIDATORS,
+    MAX_CPF_LENGTH,
+    guarded,
+    guarded_validate_brazilian_phone,
+    guarded_validate_cnh,
+    guarded_validate_cpf,
+    guarded_validate_crv,
+    guarded_validate_email,
+    guarded_validate_plate,
+)
+
+
+def test_guarded_validators_match_plain_ones():
+
+    assert guarded_validate_cpf("111.444.777-35") is True
+    assert guarded_validate_cpf(" 111.444.777-36 ") is False
+    assert guarded_validate_cnh("12345678901") is True
+    assert guarded_validate_crv("A1B2 C3D4E5F") is True
+    assert guarded_validate_plate("abc-1234") is True
+    assert guarded_validate_brazilian_phone("(11) 91234-5678") is True
+    assert guarded_validate_email("joao@email.com") is True
+    assert guarded_validate_cpf.__name__ == "guarded_validate_cpf"
+
+
+def test_oversized_inputs_are_not_scanned():
+
+    calls = []
+
+    def spy(value):
+        calls.append(value)
+        return validate_cpf(value)
+
+    guarded_spy = guarded(spy, MAX_CPF_LENGTH)
+    # Válido para validate_cpf, mas longo demais para a versão guardada
+    padded = "111.444.777-35" + " " * 10_000
+    assert validate_cpf(padded) is True
+    assert guarded_spy(padded) is False
+    assert calls == []
+    assert guarded_spy("111.444.777-35") is True
+    assert calls == ["111.444.777-35"]
+
+    for validator in GUARDED_VALIDATORS.values():
+        assert validator("1" * 1_000_000) is False
@@ -0,0 +1,40 @@
+from src.infer import infer_column_type, infer_csv_types
+
+
+def test_infer_column_type():
+
+    cpfs = ["111.444.777-35", "58449226031", "390.533.447-05"] * 40
+    assert infer_column_type(cpfs) == ("cpf", 1.0)
+    assert infer_column_type(["(11) 91234-5678", "21987654321"] * 50) == (
+        "phone",
+        1.0,
+    )
+    assert infer_column_type(["joao@email.com", ""] * 50) == ("email", 1.0)
+    assert infer_column_type(["ABC1D23", "abc-1234"] * 50) == ("plate", 1.0)
+    assert infer_column_type(["Maria", "João"] * 50) == ("none", 0.0)
+    assert infer_column_type([]) == ("none", 0.0)
+
+
+def test_infer_column_type_threshold():
+
+    # 80% de CPFs: abaixo do limiar padrão, acima de um limiar de 0.7
+    values = ["111.444.777-35"] * 80 + ["n/d"] * 20
+    kind, rate = infer_column_type(values)
+    assert kind == "none"
+    assert 0.7 < rate < 0.9
+    assert infer_column_type(values, threshold=0.7)[0] == "cpf"
+
+
+def test_infer_csv_types(tmp_path):
+
+    path = tmp_path / "partner.csv"
+    path.write_text(
+        "doc;nome;contato\n"
+        + "111.444.777-35;Ana;ana@email.com\n" * 10
+        + "58449226031;Bruno;(11) 91234-5678\n" * 10
+    )
+    assert infer_csv_types(str(path), delimiter=";", header=True) == [
+        ("cpf", 1.0),
+        ("none", 0.0),
+        ("none", 0.5),
+    ]
@@ -0,0 +1,100 @@
+import pytest
+
+import src.join
+from src.join import dedup_file, join_files
+
+LEFT = (
+    "cpf,nome\n"
+    "111.444.777-35,Ana\n"
+    "584.492.260-31,Bruno\n"
+    "123,Invalido\n"
+    "390.533.447-05,Carla\n"
+)
+RIGHT = "doc,valor\n58449226031,10\n11144477735,20\n11144477735,30\n"
+
+
+@pytest.fixture(params=[256 << 20, 300])
+def memory(request, monkeypatch):
+    # Orçamento pequeno força arquivos de spill e merges em várias passadas
+    monkeypatch.setattr(src.join, "_FAN_IN", 2)
+    return request.param
+
+
+def test_join_files(tmp_path, memory):
+
+    left = tmp_path / "left.csv"
+    right = tmp_path / "right.csv"
+    output = tmp_path / "out.csv"
+    left.write_text(LEFT)
+    right.write_text(RIGHT)
+
+    def join(how):
+        stats = join_files(
+            str(left),
+            str(right),
+            str(output),
+            "cpf",
+            how=how,
+            header=True,
+            memory=memory,
+        )
+        return stats, output.read_text().splitlines()
+
+    stats, rows = join("inner")
+    assert rows == [
+        "cpf,nome,doc,valor",
+        "111.444.777-35,Ana,11144477735,20",
+        "111.444.777-35,Ana,11144477735,30",
+        "584.492.260-31,Bruno,58449226031,10",
+    ]
+    assert stats["left_rejected"] == 1
+    assert stats["output_rows"] == 3
+    assert (stats["runs"] > 0) == (memory < 1000)
+
+    _, rows = join("left")
+    assert len(rows) == 5
+    assert rows[3] == "390.533.447-05,Carla,,"
+    _, rows = join("anti")
+    assert rows == ["cpf,nome", "390.533.447-05,Carla"]
+
+    with pytest.raises(ValueError):
+        join("outer")
+
+
+def test_dedup_file(tmp_path, memory):
+
+    source = tmp_path / "cpfs.txt"
+    output = tmp_path / "unique.txt"
+    source.write_text("11144477735\n584.492.260-31\n111.444.777-35\nx\n")
+
+    stats = dedup_file(str(source), str(output), "cpf", memory=memory)
+    assert output.read_text() == "11144477735\n584.492.260-31\n"
+    assert stats["rows"] == 4
+    assert stats["rejected"] == 1
+    assert stats["output_rows"] == 2
+    assert sorted(tmp_path.iterdir()) == [source, output]
+
+
+def test_join_hot_key_spills(tmp_path):
+
+    left = tmp_path / "left.csv"
+    right = tmp_path / "right.csv"
+    output = tmp_path / "out.csv"
+    left.write_text("111.444.777-35,Ana\n11144477735,Bia\n")
+    right.write_text("".join(f"11144477735,{index}\n" for index in range(500)))
+
+    # A chave repetida no lado direito passa do orçamento e vai para disco
+    stats = join_files(str(left), str(right), str(output), "cpf", memory=4096)
+    assert stats["group_spills"] == 1
+    assert stats["output_rows"] == 1000
+
+    rows = output.read_text().splitlines()
+    assert rows[:2] == [
+        "111.444.777-35,Ana,11144477735,0",
+        "111.444.777-35,Ana,11144477735,1",
+    ]
+    assert rows[500:502] == [
+        "11144477735,Bia,11144477735,0",
+        "11144477735,Bia,11144477735,1",
+    ]
+    assert rows[-1] == "11144477735,Bia,11144477735,499"
@@ -0,0 +1,47 @@
+import io
+
+import pytest
+
+from src.partition import partition_cpf_file, partition_cpfs
+
+
+def test_partition_cpfs_routes_by_region():
+
+    records = [
+        b"cpf;nome\n",
+        b"111.444.777-35;Ana\n",
+        b'"584.492.260-31";Bruno\n',
+        b"111.444.777-36;Carla\n",
+        b"11144477735;Dani",
+    ]
+    targets = [io.BytesIO() for _ in range(10)]
+    rejects = io.BytesIO()
+
+    counts, rejected = partition_cpfs(
+        records, targets, rejects, column=0, delimiter=b";", header=True
+    )
+    assert counts == [1, 0, 0, 0, 0, 0, 0, 2, 0, 0]
+    assert rejected == 1
+    assert targets[7].getvalue() == (
+        b"cpf;nome\n111.444.777-35;Ana\n11144477735;Dani\n"
+    )
+    assert targets[0].getvalue().endswith(b'"584.492.260-31";Bruno\n')
+    assert rejects.getvalue() == b"cpf;nome\n111.444.777-36;Carla\n"
+
+    with pytest.raises(ValueError):
+        partition_cpfs(records, targets[:9])
+
+
+def test_partition_cpf_file(tmp_path):
+
+    source = tmp_path / "cpfs.txt"
+    source.write_bytes(b"111.444.777-35\n123\n584.492.260-31\n")
+
+    counts, rejected = partition_cpf_file(str(source), str(tmp_path / "out"))
+    assert sum(counts) == 2
+    assert rejected == 1
+    assert (tmp_path / "out" / "region_7.txt").read_bytes() == (
+        b"111.444.777-35\n"
+    )
+    assert (tmp_path / "out" / "rejects.txt").read_bytes() == b"123\n"
+    assert (tmp_path / "out" / "region_1.txt").read_bytes() == b""
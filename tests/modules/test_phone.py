@@ -0,0 +1,47 @@
+from src.phone import format_e164_phone, format_e164_phones, phone_to_key
+
+
+def test_format_e164_phone():
+
+    assert format_e164_phone("11912345678") == "+5511912345678"
+    assert format_e164_phone("(11) 91234-5678") == "+5511912345678"
+    assert format_e164_phone("+55 (11) 91234-5678") == "+5511912345678"
+    assert format_e164_phone("5511912345678") == "+5511912345678"
+    assert format_e164_phone("055 11 91234-5678") == "+5511912345678"
+    assert format_e164_phone("021 11 91234-5678") == "+5511912345678"
+    # Landline keeps 8 digits, old 8-digit mobile gets the leading 9
+    assert format_e164_phone("(21) 3456-7890") == "+552134567890"
+    assert format_e164_phone("(21) 8765-4321") == "+5521987654321"
+    # DDD 55 (RS) without country code
+    assert format_e164_phone("55 99876-5432") == "+5555998765432"
+
+
+def test_format_e164_phone_invalid():
+
+    assert format_e164_phone("1234") == ""
+    assert format_e164_phone("(00) 91234-5678") == ""
+    assert format_e164_phone("(11) 81234-5678") == ""
+    assert format_e164_phone("(11) 1234-5678") == ""
+    assert format_e164_phone("+1 (11) 91234-5678") == ""
+
+
+def test_phone_to_key():
+
+    assert phone_to_key("(11) 91234-5678") == 5511912345678
+    assert phone_to_key("+55 11 91234-5678") == 5511912345678
+    assert phone_to_key("1234") == 0
+
+
+def test_format_e164_phones():
+
+    phones = ["11912345678", "1234", "(21) 3456-7890"]
+    assert format_e164_phones(phones) == [
+        "+5511912345678",
+        "",
+        "+552134567890",
+    ]
+    assert format_e164_phones(phones, as_key=True) == [
+        5511912345678,
+        0,
+        552134567890,
+    ]
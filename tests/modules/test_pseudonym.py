@@ -0,0 +1,43 @@
+import pytest
+
+from src.cpf import validate_cpf
+from src.pseudonym import Tokenizer, tokenize_parallel
+
+
+def test_tokens_ignore_formatting():
+
+    tokenizer = Tokenizer(b"secret")
+    token = tokenizer.tokenize_cpf("111.444.777-35")
+    assert len(token) == 32
+    assert token == tokenizer.tokenize_cpf("11144477735")
+    assert token != Tokenizer(b"other").tokenize_cpf("11144477735")
+    assert tokenizer.tokenize_cpf("111.444.777-36") == ""
+
+    phone = tokenizer.tokenize_phone("(11) 91234-5678")
+    assert phone == tokenizer.tokenize_phone("+55 11 91234-5678")
+    assert phone != token
+    assert tokenizer.tokenize_phone("1234") == ""
+
+
+def test_pseudonymize_cpf_is_valid_and_stable():
+
+    tokenizer = Tokenizer(b"secret", cache_size=128)
+    cpfs = ["111.444.777-35", "584.492.260-31", "390.533.447-05"]
+    pseudonyms = tokenizer.tokenize_many(cpfs, "cpf_fpe")
+
+    assert all(validate_cpf(value) for value in pseudonyms)
+    assert len(set(pseudonyms)) == len(cpfs)
+    assert pseudonyms[0] == tokenizer.pseudonymize_cpf("11144477735")
+    assert tokenizer.pseudonymize_cpf("111.111.111-11") == ""
+
+
+def test_tokenize_parallel():
+
+    values = ["111.444.777-35", "123", "11144477735"] * 5
+    tokens = tokenize_parallel(values, "cpf", b"secret", processes=1)
+    assert tokens == Tokenizer(b"secret").tokenize_many(values, "cpf")
+
+    with pytest.raises(ValueError):
+        tokenize_parallel(values, "cnh", b"secret")
+    with pytest.raises(ValueError):
+        Tokenizer(b"secret").tokenize_many(values, "cnh")
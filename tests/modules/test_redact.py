@@ -0,0 +1,94 @@
+from src.redact import Redactor, redact_text
+
+
+def test_redact_text():
+
+    assert redact_text("cpf 111.444.777-35") == "cpf ***.444.777-**"
+    assert redact_text("cpf=11144477735;") == "cpf=***444777**;"
+    assert redact_text("tel (11) 91234-5678") == "tel (**) *****-5678"
+    assert redact_text("joao@email.com") == "j***@email.com"
+    assert redact_text("placa ABC-1D23.") == "placa ABC-****."
+    assert redact_text("placa abc1d23 / ABC 1D23 / Abc-1234") == (
+        "placa abc**** / ABC **** / Abc-****"
+    )
+    assert redact_text("a\n111.444.777-35\nb (11) 91234-5678\n") == (
+        "a\n***.444.777-**\nb (**) *****-5678\n"
+    )
+    # Dígitos não ASCII também são aceitos por validate_cpf
+    assert redact_text("cpf ١١١٤٤٤٧٧٧٣٥") == "cpf ***٤٤٤٧٧٧**"
+
+
+def test_redact_only_true_positives():
+
+    # Invalid CPF and invalid phone (DDD 12 with 9 digits not starting with 9)
+    assert redact_text("id 12345678901") == "id 12345678901"
+    assert redact_text("order 1234567890123") == "order 1234567890123"
+    assert redact_text("abc@localhost") == "abc@localhost"
+    assert redact_text("XABC1234") == "XABC1234"
+    line = "2024-01-01 12:00:05 INFO took 12ms ts=1704067205\n"
+    assert redact_text(line) == line
+
+    # Formatos aceitos por format_e164_phone
+    assert redact_text("tel 5511912345678") == "tel *********5678"
+    assert redact_text("tel 11 9 1234-5678") == "tel ** * ****-5678"
+    assert redact_text("tel 055 11 91234-5678") == "tel *** ** *****-5678"
+    assert redact_text("tel 0 21 11 91234-5678.") == (
+        "tel * ** ** *****-5678."
+    )
+
+
+def test_redact_accented_email():
+
+    assert redact_text("joão@email.com") == "j***@email.com"
+    assert redact_text("de: joão.ávila@ação.com.br ok") == (
+        "de: j***@ação.com.br ok"
+    )
+    assert redact_text("x@y joão@localhost") == "x@y joão@localhost"
+    assert redact_text("joão@ação.br", {"email": "full"}) == "****@****.**"
+
+
+def test_redact_styles():
+
+    redactor = Redactor(
+        {"cpf": "tag", "phone": "full", "plate": None, "email": str.upper}
+    )
+    assert redactor.redact("11144477735 (21) 3456-7890 ABC1234 a@b.com") == (
+        "[CPF] (**) ****-**** ABC1234 A@B.COM"
+    )
+
+
+def test_redact_stream_chunk_boundaries():
+
+    data = "user 111.444.777-35 from joao@email.com ok\n" * 3
+    expected = "user ***.444.777-** from j***@email.com ok\n" * 3
+    redactor = Redactor()
+
+    for size in (1, 5, 7, 64):
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert "".join(redactor.redact_stream(chunks)) == expected
+        binary = [chunk.encode() for chunk in chunks]
+        assert b"".join(redactor.redact_stream(binary)) == expected.encode()
+
+    # Emails acentuados em UTF-8, com caracteres multibyte cortados entre
+    # chunks de bytes
+    data = "cà@x.com Åsa@x.com maria@exãmplo.com fim\n".encode() * 2
+    expected = "c***@x.com Å***@x.com m***@exãmplo.com fim\n".encode() * 2
+    for size in (1, 2, 3, 7, 64):
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert b"".join(redactor.redact_stream(chunks)) == expected
+
+    # Bytes que não são UTF-8 (ex.: latin-1) passam intactos
+    data = b"caf\xe9 111.444.777-35\n"
+    assert b"".join(redactor.redact_stream([data])) == (
+        b"caf\xe9 ***.444.777-**\n"
+    )
+
+
+def test_redact_stream_long_line():
+
+    redactor = Redactor(max_line_length=16)
+    data = "a 111.444.777-35 b " * 4
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert "".join(redactor.redact_stream(chunks)) == (
+        "a ***.444.777-** b " * 4
+    )
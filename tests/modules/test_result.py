@@ -0,0 +1,72 @@
+from src.cnh import check_cnh
+from src.cpf import check_cpf, validate_cpf
+from src.crv import check_crv
+from src.email import check_email
+from src.phone import check_brazilian_phone
+from src.plate import check_plate
+from src.result import FailureCode
+
+
+def test_check_cpf():
+
+    result = check_cpf("11144477735")
+    assert bool(result) is True
+    assert result.code == FailureCode.OK
+    assert result.normalized == "111.444.777-35"
+    assert check_cpf("1234").code == FailureCode.INVALID_LENGTH
+    assert check_cpf("000.000.000-00").code == FailureCode.REPEATED_DIGITS
+    assert check_cpf("111.444.777-45").code == FailureCode.FIRST_CHECK_DIGIT
+    assert check_cpf("111.444.777-36").code == FailureCode.SECOND_CHECK_DIGIT
+    assert check_cpf("111.444.777-36").normalized == ""
+
+
+def test_check_matches_validate():
+
+    for cpf in ["584.492.260-31", "11144477735", "12345678909", "1"]:
+        assert bool(check_cpf(cpf)) is validate_cpf(cpf)
+
+
+def test_check_cnh():
+
+    assert check_cnh("12345678901").valid is True
+    assert check_cnh("1234567890").code == FailureCode.INVALID_LENGTH
+    assert check_cnh("1234567890A").code == FailureCode.INVALID_CHARACTERS
+    assert check_cnh("12345678911").code == FailureCode.FIRST_CHECK_DIGIT
+    assert check_cnh("12345678902").code == FailureCode.SECOND_CHECK_DIGIT
+
+
+def test_check_crv_and_plate():
+
+    assert check_crv("a1b2 c3d4e5f").normalized == "A1B2C3D4E5F"
+    assert check_crv("1234567890").code == FailureCode.INVALID_LENGTH
+    assert check_crv("A1B2C3D4E5!").code == FailureCode.INVALID_CHARACTERS
+    assert check_plate("abc-1234").normalized == "ABC1234"
+    assert check_plate("ABC123").code == FailureCode.INVALID_LENGTH
+    assert check_plate("A1B2C3D").code == FailureCode.INVALID_FORMAT
+
+
+def test_check_phone_and_email():
+
+    assert check_brazilian_phone("11912345678").normalized == (
+        "(11) 91234-5678"
+    )
+    # Fixo com 8 dígitos continua o mesmo número
+    assert check_brazilian_phone("(21) 3456-7890").normalized == (
+        "(21) 3456-7890"
+    )
+    assert check_brazilian_phone("1234").code == FailureCode.INVALID_LENGTH
+    assert check_brazilian_phone("00912345678").valid is True
+    assert (
+        check_brazilian_phone("00912345678", check_ddd=True).code
+        == FailureCode.INVALID_DDD
+    )
+    assert check_email("Test@Example.com").normalized == "test@example.com"
+    assert check_email("invalid-email").code == FailureCode.INVALID_FORMAT
+
+
+def test_message():
+
+    assert check_cpf("111.444.777-36").message == (
+        "CPF second check digit is invalid"
+    )
+    assert check_plate("ABC1D23").message == "Plate is valid"
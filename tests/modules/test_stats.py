@@ -0,0 +1,81 @@
+from src.stats import CountMinSketch, FieldStats, HeavyHitters, HyperLogLog
+
+
+def test_count_min_sketch():
+
+    sketch = CountMinSketch(width=256, depth=4)
+    for _ in range(5):
+        sketch.add("gmail.com")
+    sketch.add("example.com", 3)
+
+    assert sketch.estimate("gmail.com") >= 5
+    assert sketch.estimate("example.com") >= 3
+    assert sketch.total == 8
+
+
+def test_heavy_hitters():
+
+    hitters = HeavyHitters(k=2)
+    for index in range(1000):
+        hitters.add("gmail.com")
+        if index % 2:
+            hitters.add("hotmail.com")
+        hitters.add(f"rare{index}.com")
+
+    assert [item for item, _ in hitters.top()] == [
+        "gmail.com",
+        "hotmail.com",
+    ]
+
+
+def test_hyperloglog_merge():
+
+    first = HyperLogLog()
+    second = HyperLogLog()
+    for index in range(6000):
+        first.add(str(index))
+    for index in range(4000, 10000):
+        second.add(str(index))
+    first.merge(second)
+
+    assert abs(first.count() - 10000) < 300
+
+
+def test_field_stats_merge():
+
+    worker_a = FieldStats()
+    worker_b = FieldStats()
+    worker_a.add_email("a@example.com")
+    worker_a.add_email("invalid-email")
+    worker_a.add_phone("(11) 91234-5678")
+    worker_a.add_plate("ABC-1234")
+    worker_a.add_cpf("111.444.777-35")
+    worker_b.add_email("b@Example.com")
+    worker_b.add_phone("(21) 98765-4321")
+    worker_b.add_phone("1234")
+    worker_b.add_plate("ABC1D23")
+    worker_b.add_cpf("11144477735")
+    worker_b.add_cpf("00000000000")
+
+    worker_a.merge(worker_b)
+
+    assert worker_a.top_domains() == [("example.com", 2)]
+    assert worker_a.top_ddds() == [("11", 1), ("21", 1)]
+    assert worker_a.plate_formats == {"old": 1, "mercosul": 1}
+    assert worker_a.distinct_cpfs() == 1
+    assert worker_a.invalid_rate("email") == 1 / 3
+    assert worker_a.invalid_rate("phone") == 1 / 3
+    assert worker_a.invalid_rate("cpf") == 1 / 3
+    assert worker_a.invalid_rate("plate") == 0.0
+
+
+def test_field_stats_e164_phones():
+
+    stats = FieldStats()
+    stats.add_phone("+55 11 91234-5678")
+    stats.add_phone("+5521987654321")
+    stats.add_phone("021 11 3456-7890")
+    stats.add_phone("(11) 1234-5678")
+
+    assert stats.top_ddds() == [("11", 2), ("21", 1)]
+    assert stats.invalid_rate("phone") == 1 / 4